@@ -0,0 +1,33 @@
+#!/usr/bin/env python3
+"""
+Bulk Job tenant_op Backfill Script
+
+Bulk jobs filtered by operation are listed through the tenant-op-state-index
+GSI, whose partition key is the composite "tenant#operation" attribute
+tenant_op. Jobs created before that attribute existed are not in the index,
+so they are missing from operation-filtered job listings until this script
+has set it. Unfiltered and state-only listings are not affected.
+
+Run once per environment, after the index has been deployed. The script is
+idempotent: jobs that already have tenant_op are skipped.
+
+The table is taken from the usual settings environment variables
+(SPECTRA_DYNAMODB_BULK_TABLE_NAME and SPECTRA_AWS_REGION).
+
+Usage:
+    python scripts/backfill_bulk_tenant_op.py
+"""
+
+from spectra.services.bulk import BulkJobService
+
+
+def main() -> None:
+    """Backfill tenant_op on every bulk job that lacks it."""
+    service = BulkJobService()
+    print(f"Backfilling tenant_op in {service.settings.dynamodb_bulk_table_name}")
+    updated = service.backfill_tenant_op()
+    print(f"Updated {updated} job(s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+"""
+Job batch_shard Backfill Script
+
+Batch jobs are listed through the batch-shard-index GSI, keyed on the
+batch_shard attribute ("<batch_id>#<shard>"). Jobs created with a batch_id
+before that attribute existed are not in the index, so they are missing from
+batch listings until this script has set it.
+
+Run once per environment, after the index has been deployed. The script is
+idempotent: jobs that already have batch_shard are skipped.
+
+The table is taken from the usual settings environment variables
+(SPECTRA_DYNAMODB_TABLE_NAME and SPECTRA_AWS_REGION).
+
+Usage:
+    python scripts/backfill_job_batch_shard.py
+"""
+
+from spectra.services.job import JobService
+
+
+def main() -> None:
+    """Backfill batch_shard on every batch job that lacks it."""
+    service = JobService()
+    print(f"Backfilling batch_shard in {service.settings.dynamodb_table_name}")
+    updated = service.backfill_batch_shard()
+    print(f"Updated {updated} job(s)")
+
+
+if __name__ == "__main__":
+    main()
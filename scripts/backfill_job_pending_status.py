@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+"""
+Job pending_status Backfill Script
+
+The status poller finds SUBMITTED and RUNNING jobs through the sparse
+pending-index GSI, keyed on the pending_status attribute. Jobs that were
+already pending when that index was introduced do not carry the attribute,
+so the poller never picks them up until this script has set it.
+
+Deploy order: deploy the index and the service version that writes
+pending_status, then run this script once per environment. Jobs that become
+pending in between are written with the attribute already. The script is
+idempotent: jobs that already have pending_status, or that have finished
+since the scan, are skipped.
+
+The table is taken from the usual settings environment variables
+(SPECTRA_DYNAMODB_TABLE_NAME and SPECTRA_AWS_REGION).
+
+Usage:
+    python scripts/backfill_job_pending_status.py
+"""
+
+from spectra.services.job import JobService
+
+
+def main() -> None:
+    """Backfill pending_status on every pending job that lacks it."""
+    service = JobService()
+    print(f"Backfilling pending_status in {service.settings.dynamodb_table_name}")
+    updated = service.backfill_pending_status()
+    print(f"Updated {updated} job(s)")
+
+
+if __name__ == "__main__":
+    main()
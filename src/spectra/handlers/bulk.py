@@ -33,7 +33,7 @@ from spectra.models.bulk import (
     BulkJobUpdateRequest,
     BulkOperation,
 )
-from spectra.services.bulk import BulkJobNotFoundError, BulkJobService
+from spectra.services.bulk import BulkJobNotFoundError, BulkJobService, InvalidPageTokenError
 from spectra.utils.response import api_response
 
 logger = Logger()
@@ -267,13 +267,16 @@ def list_bulk_jobs() -> Response:
 
     bulk_service = BulkJobService()
 
-    jobs, next_cursor = bulk_service.list_jobs(
-        tenant_id=tenant_ctx.tenant_id,
-        operation=operation,
-        state=state,
-        limit=limit,
-        next_token=next_token,
-    )
+    try:
+        jobs, next_cursor = bulk_service.list_jobs(
+            tenant_id=tenant_ctx.tenant_id,
+            operation=operation,
+            state=state,
+            limit=limit,
+            next_token=next_token,
+        )
+    except InvalidPageTokenError as e:
+        raise BadRequestError(f"Invalid cursor: {e!s}")
 
     return api_response(
         200,
@@ -320,7 +323,7 @@ def upload_batch_data(job_id: str) -> Response:
         job = bulk_service.get_job(job_id, tenant_id=tenant_ctx.tenant_id)
 
         if job.state != BulkJobState.OPEN:
-            raise BadRequestError(f"Job is not open for upload. Current state: {job.state.value}")
+            raise BadRequestError(f"Job is not open for upload. Current state: {job.state}")
 
         if job.operation == BulkOperation.QUERY:
             raise BadRequestError("Cannot upload data for query (export) jobs")
@@ -336,6 +339,7 @@ def upload_batch_data(job_id: str) -> Response:
             tenant_id=tenant_ctx.tenant_id,
             data=body,
             content_type=job.content_type,
+            job=job,
         )
 
         metrics.add_metric(name="BulkBatchUploaded", unit=MetricUnit.Count, value=1)
@@ -376,9 +380,9 @@ def get_bulk_job_results(job_id: str) -> Response:
         job = bulk_service.get_job(job_id, tenant_id=tenant_ctx.tenant_id)
 
         if job.state not in {BulkJobState.JOB_COMPLETE, BulkJobState.FAILED}:
-            raise BadRequestError(f"Job results not available. Current state: {job.state.value}")
+            raise BadRequestError(f"Job results not available. Current state: {job.state}")
 
-        result = bulk_service.get_job_results(job_id, tenant_id=tenant_ctx.tenant_id)
+        result = bulk_service.get_job_results(job_id, tenant_id=tenant_ctx.tenant_id, job=job)
 
         return api_response(200, result)
 
@@ -21,7 +21,13 @@ from pydantic import ValidationError
 
 from spectra.middleware.tenant import TenantContext, extract_tenant_context
 from spectra.models.job import JobError, JobResult, JobStatus
-from spectra.models.query import QueryRequest, QueryResponse, ResultMetadata
+from spectra.models.query import (
+    ColumnarData,
+    DataLayout,
+    QueryRequest,
+    QueryResponse,
+    ResultMetadata,
+)
 from spectra.services.job import DuplicateJobError, JobService
 from spectra.services.redshift import (
     QueryExecutionError,
@@ -219,10 +225,14 @@ def submit_query() -> Response:
             message=message,
         )
 
+        data: list[dict[str, Any]] | ColumnarData = records
+        if request.data_layout == DataLayout.COLUMNAR:
+            data = ColumnarData.from_records(column_names, records)
+
         response = QueryResponse(
             job_id=job.job_id,
             status="COMPLETED",
-            data=records,
+            data=data,
             metadata=metadata,
         )
 
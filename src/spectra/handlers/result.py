@@ -27,6 +27,9 @@ metrics = Metrics()
 app = APIGatewayRestResolver()
 settings = get_settings()
 
+# Output formats exported straight from Arrow tables
+_ARROW_FORMATS = frozenset({"csv", "parquet"})
+
 
 @app.get("/v1/jobs/<job_id>/results")
 @tracer.capture_method
@@ -98,10 +101,19 @@ def get_job_results(job_id: str) -> Response:
         if not job.statement_id:
             raise BadRequestError("No statement ID found for this job")
 
-        # Use get_all_statement_results to handle pagination automatically
+        # CSV and Parquet results are kept as an Arrow table end-to-end, so
+        # exports never build per-row Python dictionaries.
+        use_arrow = job.output_format in _ARROW_FORMATS
+
+        # Use pagination helpers to fetch all rows automatically
         # For inline results, we limit to threshold to avoid memory issues
         # For S3 export, we fetch all results
-        result = redshift_service.get_all_statement_results(
+        fetch_results = (
+            redshift_service.get_all_statement_results_arrow
+            if use_arrow
+            else redshift_service.get_all_statement_results
+        )
+        result = fetch_results(
             statement_id=job.statement_id,
             max_rows=settings.result_size_threshold
             * 2,  # Fetch enough to determine if S3 export needed
@@ -109,7 +121,6 @@ def get_job_results(job_id: str) -> Response:
 
         row_count = result.get("total_rows", 0)
         columns = result.get("columns", [])
-        data = result.get("records", [])
 
         # Check if results should be offloaded to S3
         if row_count > settings.result_size_threshold:
@@ -119,25 +130,18 @@ def get_job_results(job_id: str) -> Response:
             )
 
             # Export to S3 based on requested format
-            if job.output_format == "csv":
-                s3_uri = export_service.write_csv_results(
-                    job_id=job.job_id,
-                    tenant_id=tenant_ctx.tenant_id,
-                    columns=columns,
-                    data=data,
-                )
-            elif job.output_format == "parquet":
-                s3_uri = export_service.write_parquet_results(
+            if use_arrow:
+                s3_uri = export_service.write_arrow_results(
                     job_id=job.job_id,
                     tenant_id=tenant_ctx.tenant_id,
-                    columns=columns,
-                    data=data,
+                    table=result["table"],
+                    format=job.output_format,
                 )
             else:
                 s3_uri = export_service.write_json_results(
                     job_id=job.job_id,
                     tenant_id=tenant_ctx.tenant_id,
-                    data=data,
+                    data=result.get("records", []),
                     metadata={"columns": columns},
                 )
 
@@ -167,6 +171,7 @@ def get_job_results(job_id: str) -> Response:
 
         # Return inline results
         metrics.add_metric(name="ResultReturnedInline", unit=MetricUnit.Count, value=1)
+        data = result["table"].to_pylist() if use_arrow else result.get("records", [])
 
         return api_response(
             200,
@@ -68,15 +68,17 @@ def get_job_status(job_id: str) -> Response:
                             job_id=job.job_id,
                             row_count=statement_info.get("result_rows", 0),
                             size_bytes=statement_info.get("result_size", 0),
+                            echo=True,
                         )
                     elif new_status == JobStatus.FAILED:
                         job = job_service.update_job_failed(
                             job_id=job.job_id,
                             error_code="REDSHIFT_ERROR",
                             error_message=statement_info.get("error", "Unknown error"),
+                            echo=True,
                         )
                     elif new_status == JobStatus.RUNNING:
-                        job = job_service.update_job_running(job.job_id)
+                        job = job_service.update_job_running(job.job_id, echo=True)
 
             except StatementNotFoundError:
                 logger.warning(
@@ -13,7 +13,7 @@ from aws_lambda_powertools.metrics import MetricUnit
 from aws_lambda_powertools.utilities.typing import LambdaContext
 
 from spectra.models.bulk import BulkJobState, BulkOperation
-from spectra.models.job import JobStatus
+from spectra.models.job import Job, JobStatus
 from spectra.services.bulk import BulkJobService
 from spectra.services.export import ExportService
 from spectra.services.job import JobService
@@ -25,12 +25,21 @@ metrics = Metrics()
 
 
 @tracer.capture_method
-def process_query_job(job_id: str, tenant_id: str) -> dict[str, Any]:
+def process_query_job(
+    job_id: str,
+    tenant_id: str,
+    *,
+    job: Job | None = None,
+    statement_info: dict[str, Any] | None = None,
+) -> dict[str, Any]:
     """Process a query export job.
 
     Args:
         job_id: Job identifier
         tenant_id: Tenant identifier
+        job: Already loaded job, to skip the DynamoDB read
+        statement_info: Already fetched statement description, to skip the
+            DescribeStatement call
 
     Returns:
         Processing result
@@ -41,7 +50,8 @@ def process_query_job(job_id: str, tenant_id: str) -> dict[str, Any]:
 
     try:
         # Get job details
-        job = job_service.get_job(job_id, tenant_id=tenant_id)
+        if job is None:
+            job = job_service.get_job(job_id, tenant_id=tenant_id)
 
         if job.status not in {JobStatus.QUEUED, JobStatus.SUBMITTED, JobStatus.RUNNING}:
             logger.info(f"Job {job_id} is not in processable state: {job.status}")
@@ -52,7 +62,8 @@ def process_query_job(job_id: str, tenant_id: str) -> dict[str, Any]:
 
         # Check statement status if we have a statement ID
         if job.statement_id:
-            statement_info = redshift_service.describe_statement(job.statement_id)
+            if statement_info is None:
+                statement_info = redshift_service.describe_statement(job.statement_id)
             status = statement_info.get("status", "")
 
             if status == "FINISHED":
@@ -102,6 +113,35 @@ def process_query_job(job_id: str, tenant_id: str) -> dict[str, Any]:
         return {"status": "failed", "error": str(e)}
 
 
+@tracer.capture_method
+def process_pending_jobs(limit: int = 100) -> list[dict[str, Any]]:
+    """Poll Redshift for all pending query jobs in one pass.
+
+    The statements of every pending job are described concurrently, so a
+    poll costs about one Data API round trip however many jobs are in
+    flight. Each job is then processed with its prefetched description.
+
+    Args:
+        limit: Maximum number of pending jobs to poll
+
+    Returns:
+        Processing result per job
+    """
+    jobs = [job for job in JobService().get_pending_jobs(limit=limit) if job.statement_id]
+    descriptions = RedshiftService().describe_statements([job.statement_id for job in jobs])
+
+    results = []
+    for job in jobs:
+        statement_info = descriptions.get(job.statement_id)
+        if statement_info is None:
+            results.append({"status": "skipped", "reason": "Statement not found"})
+            continue
+        results.append(
+            process_query_job(job.job_id, job.tenant_id, job=job, statement_info=statement_info)
+        )
+    return results
+
+
 @tracer.capture_method
 def process_bulk_job(job_id: str, tenant_id: str) -> dict[str, Any]:
     """Process a bulk job.
@@ -231,7 +271,8 @@ def process_dynamodb_record(record: dict[str, Any]) -> dict[str, Any]:
 def handler(event: dict[str, Any], context: LambdaContext) -> dict[str, Any]:  # noqa: ARG001
     """Worker Lambda handler.
 
-    Processes events from SQS, DynamoDB Streams, or direct invocation.
+    Processes events from SQS, DynamoDB Streams, scheduled polls
+    (``{"job_type": "poll"}``), or direct invocation.
 
     Args:
         event: Lambda event
@@ -256,6 +297,10 @@ def handler(event: dict[str, Any], context: LambdaContext) -> dict[str, Any]:  #
 
             results.append(result)
 
+    # Handle scheduled polling of in-flight query jobs
+    elif event.get("job_type") == "poll":
+        results = process_pending_jobs(limit=event.get("limit", 100))
+
     # Handle direct invocation
     elif "job_id" in event:
         job_id = event["job_id"]
@@ -3,6 +3,8 @@
 from spectra.models.job import Job, JobResult, JobState, JobStatus
 from spectra.models.query import (
     BulkQueryRequest,
+    ColumnarData,
+    DataLayout,
     OutputFormat,
     QueryParameter,
     QueryRequest,
@@ -11,6 +13,8 @@ from spectra.models.query import (
 
 __all__ = [
     "BulkQueryRequest",
+    "ColumnarData",
+    "DataLayout",
     "Job",
     "JobResult",
     "JobState",
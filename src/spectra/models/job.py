@@ -1,10 +1,19 @@
 """Job state models for query tracking."""
 
+import sys
 from datetime import datetime
 from enum import Enum
+from functools import cached_property
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
+from pydantic_core import to_jsonable_python
+
+# Low-cardinality values shared by every cached job. Strings loaded from
+# DynamoDB are fresh objects, so they are interned on validation to keep a
+# single copy per process.
+_JSON = sys.intern("json")
+_INLINE = sys.intern("inline")
 
 
 class JobStatus(str, Enum):
@@ -37,10 +46,33 @@ class JobResult(BaseModel):
     columns: list[str] = Field(default_factory=list, description="Column names")
     column_types: list[str] = Field(default_factory=list, description="Column data types")
     location: str = Field(..., description="Result location: 'inline' or S3 path")
-    format: str = Field(default="json", description="Result format")
+    format: str = Field(default=_JSON, description="Result format")
     download_url: str | None = Field(default=None, description="Presigned download URL")
     download_url_expires: datetime | None = Field(default=None, description="URL expiration")
 
+    model_config = {"frozen": True}
+
+    @field_validator("format")
+    @classmethod
+    def intern_format(cls, v: str) -> str:
+        """Share a single string object per result format."""
+        return sys.intern(v)
+
+    @field_validator("location")
+    @classmethod
+    def intern_inline_location(cls, v: str) -> str:
+        """Share the 'inline' marker; S3 paths are unique and left as-is."""
+        return _INLINE if v == _INLINE else v
+
+    @cached_property
+    def dynamo_map(self) -> dict[str, Any]:
+        """DynamoDB map of this result, without None values.
+
+        The model is frozen, so the map is built once and reused by every
+        status update and job item that embeds it. Treat it as read-only.
+        """
+        return _to_dynamo_dict(self)
+
 
 class JobError(BaseModel):
     """Error information for a failed job."""
@@ -52,6 +84,22 @@ class JobError(BaseModel):
         default=None, description="Redshift-specific error code"
     )
 
+    model_config = {"frozen": True}
+
+    @field_validator("code", "redshift_error_code")
+    @classmethod
+    def intern_code(cls, v: str | None) -> str | None:
+        """Share a single string object per error code."""
+        return sys.intern(v) if v is not None else None
+
+    @cached_property
+    def dynamo_map(self) -> dict[str, Any]:
+        """DynamoDB map of this error, without None values.
+
+        Built once per frozen instance, like ``JobResult.dynamo_map``.
+        """
+        return _to_dynamo_dict(self)
+
 
 class Job(BaseModel):
     """Job state model for DynamoDB persistence."""
@@ -79,7 +127,7 @@ class Job(BaseModel):
     error: JobError | None = Field(default=None, description="Error info for failed jobs")
 
     # Configuration
-    output_format: str = Field(default="json", description="Requested output format")
+    output_format: str = Field(default=_JSON, description="Requested output format")
     timeout_seconds: int | None = Field(default=None, description="Query timeout")
     async_mode: bool = Field(default=True, description="Async execution mode")
 
@@ -93,6 +141,12 @@ class Job(BaseModel):
 
     model_config = {"use_enum_values": True}
 
+    @field_validator("output_format")
+    @classmethod
+    def intern_output_format(cls, v: str) -> str:
+        """Share a single string object per output format."""
+        return sys.intern(v)
+
     @property
     def duration_ms(self) -> int | None:
         """Calculate job duration in milliseconds."""
@@ -110,38 +164,51 @@ class Job(BaseModel):
         return None
 
     def to_dynamo_item(self) -> dict[str, Any]:
-        """Convert to DynamoDB item format."""
-        item = self.model_dump(mode="json", exclude_none=True)
-
-        # Convert datetime to ISO strings
-        for key in ["created_at", "updated_at", "submitted_at", "started_at", "completed_at"]:
-            if item.get(key) and isinstance(item[key], datetime):
-                item[key] = item[key].isoformat()
+        """Convert to DynamoDB item format.
 
-        return item
+        Walks the field values directly instead of going through
+        ``model_dump(mode="json")``: only datetimes, enums and nested models
+        need converting, and None values are omitted.
+        """
+        return _to_dynamo_dict(self)
 
     @classmethod
     def from_dynamo_item(cls, item: dict[str, Any]) -> "Job":
-        """Create Job from DynamoDB item."""
-        # Parse datetime strings
-        for key in ["created_at", "updated_at", "submitted_at", "started_at", "completed_at"]:
-            if item.get(key) and isinstance(item[key], str):
-                item[key] = datetime.fromisoformat(item[key])
-
-        # Handle nested result/error
-        if (
-            item.get("result")
-            and "download_url_expires" in item["result"]
-            and item["result"]["download_url_expires"]
-            and isinstance(item["result"]["download_url_expires"], str)
-        ):
-            item["result"]["download_url_expires"] = datetime.fromisoformat(
-                item["result"]["download_url_expires"]
-            )
+        """Create Job from DynamoDB item.
 
+        ISO timestamps (including the nested result expiry) are parsed by
+        the model's compiled validator, so the item is passed through as-is
+        and is not modified.
+        """
         return cls.model_validate(item)
 
 
+def _to_dynamo_value(value: Any) -> Any:
+    """Convert a single field value to its DynamoDB representation."""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (JobResult, JobError)):
+        # Cached on the instance, which also keeps the cache entry out of
+        # the walk over ``__dict__`` below.
+        return value.dynamo_map
+    if isinstance(value, BaseModel):
+        return _to_dynamo_dict(value)
+    if isinstance(value, (dict, list, tuple)):
+        # Free-form containers (error details, job metadata) may hold any
+        # value, so they get the same conversion model_dump(mode="json") applies
+        return to_jsonable_python(value)
+    return value
+
+
+def _to_dynamo_dict(model: BaseModel) -> dict[str, Any]:
+    """Convert a model to a DynamoDB map, skipping None values."""
+    return {
+        key: _to_dynamo_value(value) for key, value in model.__dict__.items() if value is not None
+    }
+
+
 class JobState(BaseModel):
     """Lightweight job state for status responses."""
 
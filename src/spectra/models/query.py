@@ -15,20 +15,79 @@ class OutputFormat(str, Enum):
     PARQUET = "parquet"
 
 
+class DataLayout(str, Enum):
+    """Layout of inline result data in query responses."""
+
+    RECORDS = "records"
+    COLUMNAR = "columnar"
+
+
+# Obviously dangerous operations rejected by the model-level SQL check
+_DANGEROUS_PATTERNS = (
+    "DROP DATABASE",
+    "DROP SCHEMA",
+    "DROP TABLE",
+    "TRUNCATE",
+    "DELETE FROM",
+    "INSERT INTO",
+    "UPDATE ",
+    "CREATE ",
+    "ALTER ",
+    "GRANT ",
+    "REVOKE ",
+)
+
+
+# SQL parameter names: ASCII letters, digits and underscores, not starting with a digit.
+# Enforced as a field constraint so pydantic-core checks it without a Python call.
+_PARAMETER_NAME_PATTERN = r"^[A-Za-z_][A-Za-z0-9_]*$"
+
+
+def _validate_select_sql(v: str) -> str:
+    """Check that SQL is a single non-empty SELECT without dangerous operations.
+
+    Args:
+        v: Raw SQL text
+
+    Returns:
+        SQL stripped of surrounding whitespace and trailing semicolons
+
+    Raises:
+        ValueError: If the SQL is empty, not a SELECT, or contains a blocked operation
+    """
+    v = v.strip()
+    if not v:
+        raise ValueError("SQL query cannot be empty")
+
+    # Remove trailing semicolons (single statement only)
+    v = v.rstrip(";").strip()
+
+    # Quick check for obviously dangerous operations
+    upper_sql = v.upper()
+
+    # Must start with SELECT or WITH (for CTEs)
+    if not upper_sql.startswith(("SELECT", "WITH")):
+        raise ValueError("Only SELECT statements are allowed")
+
+    for pattern in _DANGEROUS_PATTERNS:
+        if pattern in upper_sql:
+            raise ValueError(f"Dangerous SQL operation not allowed: {pattern.strip()}")
+
+    return v
+
+
 class QueryParameter(BaseModel):
     """A named parameter for SQL queries."""
 
-    name: str = Field(..., description="Parameter name", min_length=1, max_length=128)
+    name: str = Field(
+        ...,
+        description="Parameter name (SQL identifier)",
+        min_length=1,
+        max_length=128,
+        pattern=_PARAMETER_NAME_PATTERN,
+    )
     value: str | int | float | bool | None = Field(..., description="Parameter value")
 
-    @field_validator("name")
-    @classmethod
-    def validate_name(cls, v: str) -> str:
-        """Validate parameter name format."""
-        if not v.isidentifier():
-            raise ValueError("Parameter name must be a valid identifier")
-        return v
-
 
 class QueryRequest(BaseModel):
     """Request model for submitting a synchronous query.
@@ -63,6 +122,10 @@ class QueryRequest(BaseModel):
         default=None,
         description="Custom metadata to attach to the job for audit purposes",
     )
+    data_layout: DataLayout = Field(
+        default=DataLayout.RECORDS,
+        description="Inline data layout: one object per row, or column names plus row arrays",
+    )
 
     model_config = {"populate_by_name": True}
 
@@ -74,39 +137,7 @@ class QueryRequest(BaseModel):
         Note: Comprehensive security validation is performed by SQLValidator
         in the handler layer. This is just a quick sanity check.
         """
-        v = v.strip()
-        if not v:
-            raise ValueError("SQL query cannot be empty")
-
-        # Remove trailing semicolons (single statement only)
-        v = v.rstrip(";").strip()
-
-        # Quick check for obviously dangerous operations
-        upper_sql = v.upper()
-
-        # Must start with SELECT or WITH (for CTEs)
-        if not (upper_sql.startswith("SELECT") or upper_sql.startswith("WITH")):
-            raise ValueError("Only SELECT statements are allowed")
-
-        # Block obviously dangerous patterns
-        dangerous_patterns = [
-            "DROP DATABASE",
-            "DROP SCHEMA",
-            "DROP TABLE",
-            "TRUNCATE",
-            "DELETE FROM",
-            "INSERT INTO",
-            "UPDATE ",
-            "CREATE ",
-            "ALTER ",
-            "GRANT ",
-            "REVOKE ",
-        ]
-        for pattern in dangerous_patterns:
-            if pattern in upper_sql:
-                raise ValueError(f"Dangerous SQL operation not allowed: {pattern.strip()}")
-
-        return v
+        return _validate_select_sql(v)
 
 
 class ResultMetadata(BaseModel):
@@ -125,6 +156,38 @@ class ResultMetadata(BaseModel):
     )
 
 
+class ColumnarData(BaseModel):
+    """Struct-of-arrays result data.
+
+    Column names are sent once instead of being repeated as keys in every
+    row, which keeps large inline results considerably smaller.
+    """
+
+    columns: list[str] = Field(..., description="Column names")
+    rows: list[list[Any]] = Field(..., description="Row values in column order")
+
+    @classmethod
+    def from_records(cls, columns: list[str], records: list[dict[str, Any]]) -> "ColumnarData":
+        """Build columnar data from row dictionaries.
+
+        Args:
+            columns: Column names in result order
+            records: Rows as dictionaries keyed by column name
+
+        Returns:
+            ColumnarData with one value list per row
+        """
+        return cls.model_construct(
+            columns=columns,
+            rows=[[record.get(name) for name in columns] for record in records],
+        )
+
+    def records(self) -> list[dict[str, Any]]:
+        """Materialize rows as dictionaries keyed by column name."""
+        columns = self.columns
+        return [dict(zip(columns, row, strict=False)) for row in self.rows]
+
+
 class QueryResponse(BaseModel):
     """Response model for synchronous query execution.
 
@@ -134,9 +197,9 @@ class QueryResponse(BaseModel):
 
     job_id: str = Field(..., description="Unique job identifier (for audit trail)")
     status: str = Field(..., description="Query status: COMPLETED, FAILED, or TIMEOUT")
-    data: list[dict[str, Any]] | None = Field(
+    data: list[dict[str, Any]] | ColumnarData | None = Field(
         default=None,
-        description="Query results as JSON array",
+        description="Query results as JSON array, or columnar data when requested",
     )
     metadata: ResultMetadata | None = Field(
         default=None,
@@ -1,8 +1,33 @@
-"""Services package for Redshift Spectra."""
+"""Services package for Redshift Spectra.
 
-from spectra.services.export import ExportService
-from spectra.services.job import JobService
-from spectra.services.redshift import RedshiftService
-from spectra.services.session import SessionService
+Service classes are imported lazily on first attribute access so a Lambda
+that only needs one service does not pay the import cost of the others.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from spectra.services.export import ExportService
+    from spectra.services.job import JobService
+    from spectra.services.redshift import RedshiftService
+    from spectra.services.session import SessionService
 
 __all__ = ["ExportService", "JobService", "RedshiftService", "SessionService"]
+
+_SERVICE_MODULES = {
+    "ExportService": "spectra.services.export",
+    "JobService": "spectra.services.job",
+    "RedshiftService": "spectra.services.redshift",
+    "SessionService": "spectra.services.session",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import service classes on first access (PEP 562)."""
+    module_name = _SERVICE_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value
+    return value
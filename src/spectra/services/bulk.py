@@ -12,16 +12,20 @@ Supports multiple formats (CSV, JSON, Parquet) and compression types.
 
 import base64
 import json
+import random
+import secrets
+import time
 import uuid
+from collections.abc import Callable, Iterator
 from datetime import UTC, datetime, timedelta
-from typing import Any
+from functools import wraps
+from typing import Any, ParamSpec, TypeVar
 
-import boto3
 from aws_lambda_powertools import Logger, Tracer
-from boto3.dynamodb.conditions import Attr, Key
 from botocore.exceptions import ClientError
 
 from spectra.models.bulk import (
+    BulkJobCreateRequest,
     BulkJobInfo,
     BulkJobState,
     BulkOperation,
@@ -30,11 +34,169 @@ from spectra.models.bulk import (
     DataFormat,
     LineEnding,
 )
+from spectra.utils.aws import (
+    count_aws_calls,
+    deserialize_item,
+    get_client,
+    get_resource,
+    get_table,
+)
 from spectra.utils.config import get_settings
 
 logger = Logger()
 tracer = Tracer()
 
+_P = ParamSpec("_P")
+_R = TypeVar("_R")
+
+# Maximum keys per BatchGetItem request
+_BATCH_GET_LIMIT = 100
+
+# UnprocessedKeys are not an error response, so botocore's retry mode does not
+# back off for them. They are resubmitted at most this many times, after a
+# capped exponential delay with full jitter.
+_BATCH_GET_MAX_RETRIES = 5
+_BATCH_GET_BACKOFF_BASE_SECONDS = 0.05
+_BATCH_GET_BACKOFF_MAX_SECONDS = 1.0
+
+# Allowed state transitions; Aborted is additionally allowed from any non-terminal state
+_VALID_TRANSITIONS: dict[BulkJobState, frozenset[BulkJobState]] = {
+    BulkJobState.OPEN: frozenset({BulkJobState.UPLOAD_COMPLETE}),
+    BulkJobState.UPLOAD_COMPLETE: frozenset({BulkJobState.IN_PROGRESS}),
+    BulkJobState.IN_PROGRESS: frozenset({BulkJobState.JOB_COMPLETE, BulkJobState.FAILED}),
+}
+
+# Complete set of states reachable from each state, including Aborted
+_NEXT_STATES: dict[BulkJobState, frozenset[BulkJobState]] = {
+    current: frozenset()
+    if current.is_terminal
+    else _VALID_TRANSITIONS.get(current, frozenset()) | {BulkJobState.ABORTED}
+    for current in BulkJobState
+}
+
+# Inverse of the transition table: states a job may be in before moving to a new state.
+# Used to enforce transitions server-side in update_item's ConditionExpression.
+_PREVIOUS_STATES: dict[BulkJobState, list[str]] = {
+    new: [current.value for current in BulkJobState if new in _NEXT_STATES[current]]
+    for new in BulkJobState
+}
+
+# Precompiled ConditionExpression (and its placeholder values) per target state:
+# the job must belong to the tenant and currently be in an allowed previous state.
+_TRANSITION_CONDITIONS: dict[BulkJobState, tuple[str, dict[str, str]]] = {
+    new: (
+        "tenant_id = :tenant_id AND #state IN ("
+        + ", ".join(f":from{i}" for i in range(len(previous)))
+        + ")",
+        {f":from{i}": state for i, state in enumerate(previous)},
+    )
+    for new, previous in _PREVIOUS_STATES.items()
+    if previous
+}
+
+
+_FORMAT_EXTENSIONS: dict[DataFormat, str] = {
+    DataFormat.CSV: ".csv",
+    DataFormat.JSON: ".json",
+    DataFormat.PARQUET: ".parquet",
+}
+
+_COMPRESSION_EXTENSIONS: dict[CompressionType, str] = {
+    CompressionType.NONE: "",
+    CompressionType.GZIP: ".gz",
+    CompressionType.LZOP: ".lzo",
+    CompressionType.BZIP2: ".bz2",
+    CompressionType.ZSTD: ".zst",
+}
+
+_BASE_CONTENT_TYPES: dict[DataFormat, str] = {
+    DataFormat.CSV: "text/csv",
+    DataFormat.JSON: "application/json",
+    DataFormat.PARQUET: "application/octet-stream",
+}
+
+# File extension and upload Content-Type for every (format, compression) pair.
+# Parquet has built-in compression, so no compression extension is added, and
+# any compressed file is uploaded as octet-stream.
+_FILE_EXTENSIONS: dict[tuple[DataFormat, CompressionType], str] = {
+    (fmt, comp): ext if fmt == DataFormat.PARQUET else ext + _COMPRESSION_EXTENSIONS[comp]
+    for fmt, ext in _FORMAT_EXTENSIONS.items()
+    for comp in CompressionType
+}
+
+_CONTENT_TYPE_HEADERS: dict[tuple[DataFormat, CompressionType], str] = {
+    (fmt, comp): base if comp == CompressionType.NONE else "application/octet-stream"
+    for fmt, base in _BASE_CONTENT_TYPES.items()
+    for comp in CompressionType
+}
+
+
+def _encode_page_token(last_evaluated_key: dict[str, Any]) -> str:
+    """Encode a LastEvaluatedKey as a URL-safe, unpadded pagination token."""
+    raw = json.dumps(last_evaluated_key, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+
+def _decode_page_token(token: str, key: dict[str, str | None]) -> dict[str, Any]:
+    """Decode a pagination token produced by ``_encode_page_token``.
+
+    Args:
+        token: Token returned by a previous listing
+        key: Key attributes of the queried index, mapped to the value the
+            listing's key condition fixes them to (``None`` if any value)
+
+    Returns:
+        The start key to resume the query from
+
+    Raises:
+        InvalidPageTokenError: If the token is malformed or was not issued
+            for this listing
+    """
+    padded = token + "=" * (-len(token) % 4)
+    try:
+        start_key = json.loads(base64.urlsafe_b64decode(padded))
+    except ValueError as e:  # binascii, JSON and UTF-8 decode errors alike
+        raise InvalidPageTokenError("Malformed pagination token") from e
+
+    if not (
+        isinstance(start_key, dict)
+        and start_key.keys() == key.keys()
+        and all(
+            isinstance(value, dict)
+            and value.keys() == {"S"}
+            and isinstance(value["S"], str)
+            and key[name] in (None, value["S"])
+            for name, value in start_key.items()
+        )
+    ):
+        raise InvalidPageTokenError("Pagination token does not match this listing")
+    return start_key
+
+
+def _tenant_op_key(tenant_id: str, operation: str) -> str:
+    """Build the composite ``tenant#operation`` partition key used for job listing."""
+    return f"{tenant_id}#{operation}"
+
+
+def _annotate_round_trips(method: Callable[_P, _R]) -> Callable[_P, _R]:
+    """Record the AWS round trips a traced method made, nested calls included.
+
+    Lets traces be grouped and sorted by round-trip count, which dominates
+    the latency of these network-bound methods. Calls are counted as boto3
+    makes them; apply below ``tracer.capture_method`` so the annotation
+    lands on the method's own subsegment.
+    """
+
+    @wraps(method)
+    def wrapper(*args: _P.args, **kwargs: _P.kwargs) -> _R:
+        with count_aws_calls() as calls:
+            try:
+                return method(*args, **kwargs)
+            finally:
+                tracer.put_annotation(key="aws_round_trips", value=calls.count)
+
+    return wrapper
+
 
 class BulkJobNotFoundError(Exception):
     """Raised when a bulk job is not found."""
@@ -42,6 +204,12 @@ class BulkJobNotFoundError(Exception):
     pass
 
 
+class InvalidPageTokenError(ValueError):
+    """Raised when a pagination token cannot be used to resume a listing."""
+
+    pass
+
+
 class BulkJobStateError(Exception):
     """Raised when job state transition is invalid."""
 
@@ -64,14 +232,16 @@ class BulkJobService:
     def __init__(self) -> None:
         """Initialize bulk job service."""
         self.settings = get_settings()
-        self.dynamodb = boto3.resource("dynamodb", region_name=self.settings.aws_region)
-        self.table = self.dynamodb.Table(self.settings.dynamodb_bulk_table_name)
-        self.s3_client = boto3.client("s3", region_name=self.settings.aws_region)
+        self.dynamodb = get_resource("dynamodb", self.settings.aws_region)
+        self.table = get_table(self.settings.dynamodb_bulk_table_name, self.settings.aws_region)
+        # Read-heavy paths use the low-level client to skip the resource layer
+        self.dynamodb_client = get_client("dynamodb", self.settings.aws_region)
+        self.s3_client = get_client("s3", self.settings.aws_region)
 
     @staticmethod
     def generate_job_id() -> str:
-        """Generate a unique bulk job ID."""
-        return f"bulk-{uuid.uuid4().hex[:16]}"
+        """Generate a unique bulk job ID ("bulk-" + 16 random hex characters)."""
+        return "bulk-" + secrets.token_hex(8)
 
     def _calculate_ttl(self, days: int | None = None) -> int:
         """Calculate TTL timestamp for DynamoDB."""
@@ -125,35 +295,14 @@ class BulkJobService:
         Returns:
             File extension string
         """
-        format_extensions = {
-            DataFormat.CSV: ".csv",
-            DataFormat.JSON: ".json",
-            DataFormat.PARQUET: ".parquet",
-        }
-
-        compression_extensions = {
-            CompressionType.NONE: "",
-            CompressionType.GZIP: ".gz",
-            CompressionType.LZOP: ".lzo",
-            CompressionType.BZIP2: ".bz2",
-            CompressionType.ZSTD: ".zst",
-        }
-
-        base_ext = format_extensions.get(content_type, ".csv")
-        comp_ext = compression_extensions.get(compression, "")
-
-        # Parquet has built-in compression, don't add extension
-        if content_type == DataFormat.PARQUET:
-            return base_ext
-
-        return f"{base_ext}{comp_ext}"
+        return _FILE_EXTENSIONS[(content_type, compression)]
 
-    @tracer.capture_method
-    def create_job(
+    def _build_job_item(
         self,
         tenant_id: str,
         db_user: str,
         operation: BulkOperation,
+        *,
         query: str | None = None,
         object_name: str | None = None,
         external_id_field: str | None = None,
@@ -164,34 +313,18 @@ class BulkJobService:
         column_delimiter: str = ",",
         assignment_rule_id: str | None = None,
         metadata: dict[str, Any] | None = None,
-    ) -> BulkJobInfo:
-        """Create a new bulk job.
-
-        For QUERY (export) operations, job starts processing immediately.
-        For import operations, job enters Open state awaiting data upload.
+    ) -> dict[str, Any]:
+        """Validate job options and build the DynamoDB item for a new job.
 
-        Args:
-            tenant_id: Tenant identifier
-            db_user: Database user for RLS
-            operation: Type of bulk operation
-            query: SQL query for export operations
-            object_name: Target table for import operations
-            external_id_field: Key column for upsert/update
-            column_mappings: Column mappings for import
-            content_type: Data format
-            compression: Compression type
-            line_ending: Line ending for CSV
-            column_delimiter: Column delimiter for CSV
-            assignment_rule_id: Custom assignment rule
-            metadata: Custom metadata
+        Arguments are the same as for ``create_job``.
 
         Returns:
-            Created BulkJobInfo
+            DynamoDB item for the job
 
         Raises:
             ValueError: If required fields are missing
         """
-        now = datetime.now(UTC)
+        now_iso = datetime.now(UTC).isoformat()
         job_id = self.generate_job_id()
 
         # Validate operation requirements
@@ -209,22 +342,20 @@ class BulkJobService:
             BulkJobState.IN_PROGRESS if operation == BulkOperation.QUERY else BulkJobState.OPEN
         )
 
-        content_url = self._get_content_url(tenant_id, job_id, operation, content_type, compression)
-
         job_item = {
             "job_id": job_id,
             "tenant_id": tenant_id,
             "operation": operation.value,
             "state": initial_state.value,
+            "tenant_op": _tenant_op_key(tenant_id, operation.value),
             "db_user": db_user,
-            "created_at": now.isoformat(),
-            "updated_at": now.isoformat(),
-            "system_modstamp": now.isoformat(),
+            "created_at": now_iso,
+            "updated_at": now_iso,
+            "system_modstamp": now_iso,
             "content_type": content_type.value,
             "compression": compression.value,
             "line_ending": line_ending.value,
             "column_delimiter": column_delimiter,
-            "content_url": content_url,
             "api_version": "v1",
             "concurrency_mode": "Parallel",
             "number_records_processed": 0,
@@ -248,19 +379,82 @@ class BulkJobService:
         if metadata:
             job_item["metadata"] = metadata
 
+        return job_item
+
+    @tracer.capture_method
+    @_annotate_round_trips
+    def create_job(
+        self,
+        tenant_id: str,
+        db_user: str,
+        operation: BulkOperation,
+        query: str | None = None,
+        object_name: str | None = None,
+        external_id_field: str | None = None,
+        column_mappings: list[ColumnMapping] | None = None,
+        content_type: DataFormat = DataFormat.CSV,
+        compression: CompressionType = CompressionType.GZIP,
+        line_ending: LineEnding = LineEnding.LF,
+        column_delimiter: str = ",",
+        assignment_rule_id: str | None = None,
+        metadata: dict[str, Any] | None = None,
+    ) -> BulkJobInfo:
+        """Create a new bulk job.
+
+        For QUERY (export) operations, job starts processing immediately.
+        For import operations, job enters Open state awaiting data upload.
+
+        Args:
+            tenant_id: Tenant identifier
+            db_user: Database user for RLS
+            operation: Type of bulk operation
+            query: SQL query for export operations
+            object_name: Target table for import operations
+            external_id_field: Key column for upsert/update
+            column_mappings: Column mappings for import
+            content_type: Data format
+            compression: Compression type
+            line_ending: Line ending for CSV
+            column_delimiter: Column delimiter for CSV
+            assignment_rule_id: Custom assignment rule
+            metadata: Custom metadata
+
+        Returns:
+            Created BulkJobInfo
+
+        Raises:
+            ValueError: If required fields are missing
+        """
+        job_item = self._build_job_item(
+            tenant_id,
+            db_user,
+            operation,
+            query=query,
+            object_name=object_name,
+            external_id_field=external_id_field,
+            column_mappings=column_mappings,
+            content_type=content_type,
+            compression=compression,
+            line_ending=line_ending,
+            column_delimiter=column_delimiter,
+            assignment_rule_id=assignment_rule_id,
+            metadata=metadata,
+        )
+        job_id = job_item["job_id"]
+
         # Save to DynamoDB
         try:
             self.table.put_item(
                 Item=job_item,
-                ConditionExpression=Attr("job_id").not_exists(),
+                ConditionExpression="attribute_not_exists(job_id)",
             )
             logger.info(
                 "Bulk job created",
                 extra={
                     "job_id": job_id,
                     "tenant_id": tenant_id,
-                    "operation": operation.value,
-                    "state": initial_state.value,
+                    "operation": job_item["operation"],
+                    "state": job_item["state"],
                 },
             )
 
@@ -275,6 +469,71 @@ class BulkJobService:
         return self._item_to_job_info(job_item)
 
     @tracer.capture_method
+    @_annotate_round_trips
+    def create_jobs_bulk(
+        self,
+        tenant_id: str,
+        db_user: str,
+        job_specs: list[BulkJobCreateRequest],
+    ) -> list[BulkJobInfo]:
+        """Create several bulk jobs with batched writes.
+
+        Items are written through the table's batch writer, which sends up to
+        25 puts per BatchWriteItem call and resubmits unprocessed items. Batch
+        writes cannot carry the ``not_exists`` condition used by
+        ``create_job``; uniqueness relies on freshly generated job IDs.
+
+        Args:
+            tenant_id: Tenant identifier
+            db_user: Database user for RLS
+            job_specs: Job creation requests
+
+        Returns:
+            Created BulkJobInfo list, in request order
+
+        Raises:
+            ValueError: If any job spec is missing required fields
+        """
+        # Build (and validate) every item before writing any of them
+        job_items = [
+            self._build_job_item(
+                tenant_id,
+                db_user,
+                spec.operation,
+                query=spec.query,
+                object_name=spec.object,
+                external_id_field=spec.external_id_field,
+                column_mappings=spec.column_mappings,
+                content_type=spec.content_type,
+                compression=spec.compression,
+                line_ending=spec.line_ending,
+                column_delimiter=spec.column_delimiter,
+                assignment_rule_id=spec.assignment_rule_id,
+            )
+            for spec in job_specs
+        ]
+
+        try:
+            with self.table.batch_writer(overwrite_by_pkeys=["job_id"]) as batch:
+                for job_item in job_items:
+                    batch.put_item(Item=job_item)
+        except ClientError as e:
+            error_code = e.response.get("Error", {}).get("Code", "Unknown")
+            logger.error(
+                "Failed to create bulk jobs",
+                extra={"error_code": error_code, "error": str(e), "count": len(job_items)},
+            )
+            raise
+
+        logger.info(
+            "Bulk jobs created",
+            extra={"tenant_id": tenant_id, "count": len(job_items)},
+        )
+
+        return [self._item_to_job_info(job_item) for job_item in job_items]
+
+    @tracer.capture_method
+    @_annotate_round_trips
     def get_job(self, job_id: str, tenant_id: str | None = None) -> BulkJobInfo:
         """Get a bulk job by ID.
 
@@ -289,22 +548,121 @@ class BulkJobService:
             BulkJobNotFoundError: If job not found or tenant mismatch
         """
         try:
-            response = self.table.get_item(Key={"job_id": job_id})
+            response = self.dynamodb_client.get_item(
+                TableName=self.settings.dynamodb_bulk_table_name,
+                Key={"job_id": {"S": job_id}},
+            )
             item = response.get("Item")
 
             if not item:
                 raise BulkJobNotFoundError(f"Bulk job not found: {job_id}")
 
-            if tenant_id and item.get("tenant_id") != tenant_id:
+            if tenant_id and item.get("tenant_id", {}).get("S") != tenant_id:
                 raise BulkJobNotFoundError(f"Bulk job not found: {job_id}")
 
-            return self._item_to_job_info(item)
+            return self._item_to_job_info(deserialize_item(item))
 
         except ClientError as e:
             logger.error("Failed to get bulk job", extra={"job_id": job_id, "error": str(e)})
             raise
 
     @tracer.capture_method
+    @_annotate_round_trips
+    def get_jobs(self, job_ids: list[str], tenant_id: str) -> list[BulkJobInfo]:
+        """Get several bulk jobs with batched reads.
+
+        Jobs are fetched with BatchGetItem, up to 100 keys per call, so N jobs
+        cost about N/100 round trips instead of N sequential lookups. Keys
+        DynamoDB leaves unprocessed are retried with backoff; any still
+        unprocessed after ``_BATCH_GET_MAX_RETRIES`` retries are logged and
+        omitted like missing jobs.
+
+        Args:
+            job_ids: Job identifiers
+            tenant_id: Tenant ID the jobs must belong to
+
+        Returns:
+            Found jobs in request order; missing jobs and jobs owned by
+            another tenant are omitted
+        """
+        table_name = self.settings.dynamodb_bulk_table_name
+        unique_ids = list(dict.fromkeys(job_ids))
+        items: dict[str, dict[str, Any]] = {}
+
+        try:
+            for start in range(0, len(unique_ids), _BATCH_GET_LIMIT):
+                request: dict[str, Any] = {
+                    table_name: {
+                        "Keys": [
+                            {"job_id": {"S": job_id}}
+                            for job_id in unique_ids[start : start + _BATCH_GET_LIMIT]
+                        ]
+                    }
+                }
+                # Throttled keys come back in UnprocessedKeys and are resubmitted
+                for attempt in range(_BATCH_GET_MAX_RETRIES + 1):
+                    if attempt:
+                        delay = min(
+                            _BATCH_GET_BACKOFF_MAX_SECONDS,
+                            _BATCH_GET_BACKOFF_BASE_SECONDS * 2 ** (attempt - 1),
+                        )
+                        time.sleep(random.uniform(0, delay))
+                    response = self.dynamodb_client.batch_get_item(RequestItems=request)
+                    for item in response.get("Responses", {}).get(table_name, []):
+                        items[item["job_id"]["S"]] = item
+                    request = response.get("UnprocessedKeys") or {}
+                    if not request:
+                        break
+                else:
+                    logger.warning(
+                        "Bulk job lookup left keys unprocessed",
+                        extra={
+                            "tenant_id": tenant_id,
+                            "unprocessed": len(request[table_name]["Keys"]),
+                        },
+                    )
+
+        except ClientError as e:
+            logger.error(
+                "Failed to batch get bulk jobs",
+                extra={"tenant_id": tenant_id, "count": len(unique_ids), "error": str(e)},
+            )
+            raise
+
+        return [
+            self._item_to_job_info(deserialize_item(item))
+            for job_id in job_ids
+            if (item := items.get(job_id)) is not None
+            and item.get("tenant_id", {}).get("S") == tenant_id
+        ]
+
+    def _resolve_job(
+        self,
+        job_id: str,
+        tenant_id: str,
+        job: BulkJobInfo | None,
+    ) -> BulkJobInfo:
+        """Return the caller's already-fetched job, or look it up.
+
+        Args:
+            job_id: Job identifier
+            tenant_id: Tenant identifier
+            job: Job previously returned by this service, if any
+
+        Returns:
+            BulkJobInfo
+
+        Raises:
+            BulkJobNotFoundError: If job not found or tenant mismatch
+        """
+        if job is None:
+            return self.get_job(job_id, tenant_id)
+        if job.id != job_id or job.created_by_id != tenant_id:
+            raise BulkJobNotFoundError(f"Bulk job not found: {job_id}")
+        return job
+
+    @tracer.capture_method
+    @_annotate_round_trips
     def list_jobs(
         self,
         tenant_id: str,
@@ -324,39 +682,57 @@ class BulkJobService:
 
         Returns:
             Tuple of (jobs list, next_token)
+
+        Raises:
+            InvalidPageTokenError: If next_token is malformed or was issued
+                for a different listing
         """
         try:
             query_params: dict[str, Any] = {
-                "IndexName": "tenant-state-index",
-                "KeyConditionExpression": Key("tenant_id").eq(tenant_id),
+                "TableName": self.settings.dynamodb_bulk_table_name,
                 "Limit": min(limit, 1000),
                 "ScanIndexForward": False,  # Most recent first
             }
 
-            # Add state filter if provided
+            # An operation filter selects the tenant#operation partition, so
+            # neither filter discards items after they have been read
+            if operation:
+                query_params["IndexName"] = "tenant-op-state-index"
+                partition_key = "tenant_op"
+                partition_value = _tenant_op_key(tenant_id, operation.value)
+            else:
+                query_params["IndexName"] = "gsi1-tenant-state"
+                partition_key = "tenant_id"
+                partition_value = tenant_id
+            key_condition = f"{partition_key} = :{partition_key}"
+            expression_values: dict[str, Any] = {f":{partition_key}": {"S": partition_value}}
+
             if state:
-                query_params["KeyConditionExpression"] = query_params[
-                    "KeyConditionExpression"
-                ] & Key("state").eq(state.value)
+                key_condition += " AND #state = :state"
+                expression_values[":state"] = {"S": state.value}
+                query_params["ExpressionAttributeNames"] = {"#state": "state"}
 
-            # Add operation filter if provided
-            if operation:
-                query_params["FilterExpression"] = Attr("operation").eq(operation.value)
+            query_params["KeyConditionExpression"] = key_condition
+            query_params["ExpressionAttributeValues"] = expression_values
 
             if next_token:
-                decoded = json.loads(base64.b64decode(next_token).decode())
-                query_params["ExclusiveStartKey"] = decoded
+                query_params["ExclusiveStartKey"] = _decode_page_token(
+                    next_token,
+                    {
+                        "job_id": None,
+                        partition_key: partition_value,
+                        "state": state.value if state else None,
+                    },
+                )
 
-            response = self.table.query(**query_params)
+            response = self.dynamodb_client.query(**query_params)
             items = response.get("Items", [])
-            jobs = [self._item_to_job_info(item) for item in items]
+            jobs = [self._item_to_job_info(deserialize_item(item)) for item in items]
 
             # Generate next token if there are more results
             new_next_token = None
             if "LastEvaluatedKey" in response:
-                new_next_token = base64.b64encode(
-                    json.dumps(response["LastEvaluatedKey"]).encode()
-                ).decode()
+                new_next_token = _encode_page_token(response["LastEvaluatedKey"])
 
             return jobs, new_next_token
 
@@ -367,7 +743,50 @@ class BulkJobService:
             )
             raise
 
+    def backfill_tenant_op(self) -> int:
+        """Set the listing partition key on jobs written before it existed.
+
+        Jobs without ``tenant_op`` are missing from ``tenant-op-state-index``
+        and so from operation-filtered ``list_jobs`` calls; other listings use
+        ``gsi1-tenant-state``, which already holds them. Run once after
+        deploying the index. The key never changes once set, so it is safe
+        to run while jobs keep moving between states.
+
+        Returns:
+            Number of jobs updated
+        """
+        updated = 0
+        scan_params: dict[str, Any] = {
+            "FilterExpression": "attribute_not_exists(tenant_op)",
+            "ProjectionExpression": "job_id, tenant_id, operation",
+        }
+        while True:
+            response = self.table.scan(**scan_params)
+            for item in response.get("Items", []):
+                try:
+                    self.table.update_item(
+                        Key={"job_id": item["job_id"]},
+                        UpdateExpression="SET tenant_op = :tenant_op",
+                        ConditionExpression="attribute_not_exists(tenant_op)",
+                        ExpressionAttributeValues={
+                            ":tenant_op": _tenant_op_key(item["tenant_id"], item["operation"]),
+                        },
+                    )
+                except ClientError as e:
+                    if e.response.get("Error", {}).get("Code") != "ConditionalCheckFailedException":
+                        raise
+                    continue
+                updated += 1
+
+            if "LastEvaluatedKey" not in response:
+                break
+            scan_params["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+
+        logger.info("Bulk job tenant_op backfill finished", extra={"updated": updated})
+        return updated
+
     @tracer.capture_method
+    @_annotate_round_trips
     def update_job_state(
         self,
         job_id: str,
@@ -395,53 +814,57 @@ class BulkJobService:
             BulkJobNotFoundError: If job not found
             BulkJobStateError: If transition is invalid
         """
-        current_job = self.get_job(job_id, tenant_id)
-
-        # Get current state - it's a string due to use_enum_values=True
-        current_state_value = current_job.state
-        current_state = BulkJobState(current_state_value)
-
-        # Validate state transition
-        if not self._is_valid_transition(current_state, new_state):
+        transition_condition = _TRANSITION_CONDITIONS.get(new_state)
+        if transition_condition is None:
+            # No state can move to new_state (e.g. back to Open)
+            current_job = self.get_job(job_id, tenant_id)
             raise BulkJobStateError(
                 job_id=job_id,
-                current_state=current_state_value,
+                current_state=current_job.state,
                 requested_state=new_state.value,
             )
 
-        now = datetime.now(UTC)
+        condition_expression, condition_values = transition_condition
+        expression_values: dict[str, Any] = {
+            ":state": new_state.value,
+            ":now": datetime.now(UTC).isoformat(),
+            ":tenant_id": tenant_id,
+            **condition_values,
+        }
 
+        # Tenant ownership and the transition rule are both checked by DynamoDB,
+        # so a valid transition costs a single round trip.
         try:
             response = self.table.update_item(
                 Key={"job_id": job_id},
-                UpdateExpression="SET #state = :state, updated_at = :updated_at, system_modstamp = :modstamp",
+                UpdateExpression="SET #state = :state, updated_at = :now, system_modstamp = :now",
                 ExpressionAttributeNames={"#state": "state"},
-                ExpressionAttributeValues={
-                    ":state": new_state.value,
-                    ":updated_at": now.isoformat(),
-                    ":modstamp": now.isoformat(),
-                },
-                ConditionExpression=Attr("tenant_id").eq(tenant_id),
+                ExpressionAttributeValues=expression_values,
+                ConditionExpression=condition_expression,
                 ReturnValues="ALL_NEW",
             )
 
-            logger.info(
-                "Bulk job state updated",
-                extra={
-                    "job_id": job_id,
-                    "old_state": current_state_value,
-                    "new_state": new_state.value,
-                },
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") != "ConditionalCheckFailedException":
+                raise
+
+            # Only on failure: read the job to tell a missing job from a bad transition
+            current_job = self.get_job(job_id, tenant_id)
+            raise BulkJobStateError(
+                job_id=job_id,
+                current_state=current_job.state,
+                requested_state=new_state.value,
             )
 
-            return self._item_to_job_info(response["Attributes"])
+        logger.info(
+            "Bulk job state updated",
+            extra={"job_id": job_id, "new_state": new_state.value},
+        )
 
-        except ClientError as e:
-            if e.response.get("Error", {}).get("Code") == "ConditionalCheckFailedException":
-                raise BulkJobNotFoundError(f"Bulk job not found: {job_id}")
-            raise
+        return self._item_to_job_info(response["Attributes"])
 
     @tracer.capture_method
+    @_annotate_round_trips
     def update_job_progress(
         self,
         job_id: str,
@@ -457,18 +880,19 @@ class BulkJobService:
             records_failed: Number of records failed
             error_message: Error message if any
         """
-        now = datetime.now(UTC)
+        if not (records_processed or records_failed or error_message):
+            return
 
-        update_expr = """
-            SET number_records_processed = number_records_processed + :processed,
-                number_records_failed = number_records_failed + :failed,
-                updated_at = :updated_at
-        """
+        # ADD creates missing counters and increments atomically under concurrent writers
+        update_expr = (
+            "ADD number_records_processed :processed, number_records_failed :failed"
+            " SET updated_at = :updated_at"
+        )
 
         expr_values = {
             ":processed": records_processed,
             ":failed": records_failed,
-            ":updated_at": now.isoformat(),
+            ":updated_at": datetime.now(UTC).isoformat(),
         }
 
         if error_message:
@@ -488,6 +912,7 @@ class BulkJobService:
             )
 
     @tracer.capture_method
+    @_annotate_round_trips
     def get_upload_url(
         self,
         job_id: str,
@@ -495,6 +920,8 @@ class BulkJobService:
         content_type: DataFormat,
         compression: CompressionType,
         expiration_seconds: int = 3600,
+        *,
+        job: BulkJobInfo | None = None,
     ) -> str:
         """Generate presigned URL for data upload.
 
@@ -504,16 +931,17 @@ class BulkJobService:
             content_type: Data format
             compression: Compression type
             expiration_seconds: URL expiration time
+            job: The job, if the caller already fetched it; skips the lookup
 
         Returns:
             Presigned URL for PUT operation
         """
-        job = self.get_job(job_id, tenant_id)
+        job = self._resolve_job(job_id, tenant_id, job)
 
         if job.state != BulkJobState.OPEN:
             raise BulkJobStateError(
                 job_id=job_id,
-                current_state=job.state.value,
+                current_state=job.state,
                 requested_state="UPLOAD",
             )
 
@@ -537,12 +965,15 @@ class BulkJobService:
         return url
 
     @tracer.capture_method
+    @_annotate_round_trips
     def get_download_url(
         self,
         job_id: str,
         tenant_id: str,
         file_type: str = "results",
         expiration_seconds: int = 3600,
+        *,
+        job: BulkJobInfo | None = None,
     ) -> str:
         """Generate presigned URL for result download.
 
@@ -551,26 +982,23 @@ class BulkJobService:
             tenant_id: Tenant identifier
             file_type: 'results' or 'failed'
             expiration_seconds: URL expiration time
+            job: The job, if the caller already fetched it; skips the lookup
 
         Returns:
             Presigned URL for GET operation
         """
-        job = self.get_job(job_id, tenant_id)
+        job = self._resolve_job(job_id, tenant_id, job)
 
         if job.state not in (BulkJobState.JOB_COMPLETE, BulkJobState.FAILED):
             raise BulkJobStateError(
                 job_id=job_id,
-                current_state=job.state.value,
+                current_state=job.state,
                 requested_state="DOWNLOAD",
             )
 
         prefix = self._get_s3_prefix(tenant_id, job_id)
-        extension = self._get_file_extension(
-            DataFormat(job.content_type),
-            CompressionType(job.compression)
-            if hasattr(job, "compression")
-            else CompressionType.GZIP,
-        )
+        # BulkJobInfo stores enum values; str-based enums compare and hash equal to them
+        extension = self._get_file_extension(job.content_type, job.compression)
         key = f"{prefix}/{file_type}/data{extension}"
 
         url = self.s3_client.generate_presigned_url(
@@ -585,48 +1013,28 @@ class BulkJobService:
         return url
 
     @tracer.capture_method
+    @_annotate_round_trips
     def list_result_files(
         self,
         job_id: str,
         tenant_id: str,
+        *,
+        job: BulkJobInfo | None = None,
     ) -> list[dict[str, Any]]:
         """List result files for a job.
 
         Args:
             job_id: Job identifier
             tenant_id: Tenant identifier
+            job: The job, if the caller already fetched it; skips the lookup
 
         Returns:
             List of file information dictionaries
         """
-        self.get_job(job_id, tenant_id)  # Validate job exists
-        prefix = self._get_s3_prefix(tenant_id, job_id)
+        files = self.iter_result_files(job_id, tenant_id, job=job)
 
         try:
-            response = self.s3_client.list_objects_v2(
-                Bucket=self.settings.s3_bucket_name,
-                Prefix=f"{prefix}/results/",
-            )
-
-            files = []
-            for obj in response.get("Contents", []):
-                files.append(
-                    {
-                        "key": obj["Key"],
-                        "size": obj["Size"],
-                        "last_modified": obj["LastModified"].isoformat(),
-                        "download_url": self.s3_client.generate_presigned_url(
-                            "get_object",
-                            Params={
-                                "Bucket": self.settings.s3_bucket_name,
-                                "Key": obj["Key"],
-                            },
-                            ExpiresIn=3600,
-                        ),
-                    }
-                )
-
-            return files
+            result_files = list(files)
 
         except ClientError as e:
             logger.error(
@@ -635,6 +1043,62 @@ class BulkJobService:
             )
             return []
 
+        return result_files
+
+    def iter_result_files(
+        self,
+        job_id: str,
+        tenant_id: str,
+        *,
+        job: BulkJobInfo | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Iterate over result files for a job, one S3 listing page at a time.
+
+        The job is validated immediately; files are listed and presigned
+        lazily as the iterator is consumed.
+
+        Args:
+            job_id: Job identifier
+            tenant_id: Tenant identifier
+            job: The job, if the caller already fetched it; skips the lookup
+
+        Returns:
+            Iterator of file information dictionaries
+
+        Raises:
+            BulkJobNotFoundError: If job not found
+            ClientError: While iterating, if listing the result files fails
+        """
+        self._resolve_job(job_id, tenant_id, job)  # Validate job exists
+        prefix = self._get_s3_prefix(tenant_id, job_id)
+        return self._iter_result_objects(f"{prefix}/results/")
+
+    def _iter_result_objects(self, prefix: str) -> Iterator[dict[str, Any]]:
+        """Yield file information for every object under a result prefix."""
+        bucket = self.settings.s3_bucket_name
+        presign = self.s3_client.generate_presigned_url
+
+        # Follow continuation tokens; a single ListObjectsV2 call caps at 1000 keys
+        pages = self.s3_client.get_paginator("list_objects_v2").paginate(
+            Bucket=bucket,
+            Prefix=prefix,
+            PaginationConfig={"PageSize": 1000},
+        )
+
+        # Presigning is local; keep per-object work to the signature itself
+        for page in pages:
+            for obj in page.get("Contents", ()):
+                yield {
+                    "key": obj["Key"],
+                    "size": obj["Size"],
+                    "last_modified": obj["LastModified"].isoformat(),
+                    "download_url": presign(
+                        "get_object",
+                        Params={"Bucket": bucket, "Key": obj["Key"]},
+                        ExpiresIn=3600,
+                    ),
+                }
+
     @staticmethod
     def _is_valid_transition(current: BulkJobState, new: BulkJobState) -> bool:
         """Check if state transition is valid.
@@ -646,22 +1110,7 @@ class BulkJobService:
         Returns:
             True if transition is valid
         """
-        # Cannot transition from terminal states
-        if current.is_terminal:
-            return False
-
-        # Aborted is allowed from any non-terminal state
-        if new == BulkJobState.ABORTED:
-            return True
-
-        # Valid transitions
-        valid_transitions = {
-            BulkJobState.OPEN: {BulkJobState.UPLOAD_COMPLETE},
-            BulkJobState.UPLOAD_COMPLETE: {BulkJobState.IN_PROGRESS},
-            BulkJobState.IN_PROGRESS: {BulkJobState.JOB_COMPLETE, BulkJobState.FAILED},
-        }
-
-        return new in valid_transitions.get(current, set())
+        return new in _NEXT_STATES[current]
 
     @staticmethod
     def _get_content_type_header(
@@ -677,19 +1126,7 @@ class BulkJobService:
         Returns:
             Content-Type header value
         """
-        base_types = {
-            DataFormat.CSV: "text/csv",
-            DataFormat.JSON: "application/json",
-            DataFormat.PARQUET: "application/octet-stream",
-        }
-
-        base = base_types.get(content_type, "application/octet-stream")
-
-        # For compressed files, use octet-stream
-        if compression != CompressionType.NONE:
-            return "application/octet-stream"
-
-        return base
+        return _CONTENT_TYPE_HEADERS[(content_type, compression)]
 
     def _item_to_job_info(self, item: dict[str, Any]) -> BulkJobInfo:
         """Convert DynamoDB item to BulkJobInfo.
@@ -700,17 +1137,24 @@ class BulkJobService:
         Returns:
             BulkJobInfo instance
         """
+        # Enum and ISO timestamp strings are passed through as-is: the model's
+        # compiled validator converts them without per-field Python calls.
+        job_id = item["job_id"]
+        tenant_id = item.get("tenant_id", "")
+        operation = item["operation"]
+        content_type = item.get("content_type", "CSV")
+        compression = item.get("compression", "GZIP")
         return BulkJobInfo(
-            id=item["job_id"],
-            operation=BulkOperation(item["operation"]),
-            state=BulkJobState(item["state"]),
+            id=job_id,
+            operation=operation,
+            state=item["state"],
             object=item.get("object"),
-            created_by_id=item.get("tenant_id", ""),
-            created_at=datetime.fromisoformat(item["created_at"]),
-            system_modstamp=datetime.fromisoformat(item.get("system_modstamp", item["updated_at"])),
-            content_type=DataFormat(item.get("content_type", "CSV")),
-            compression=CompressionType(item.get("compression", "GZIP")),
-            line_ending=LineEnding(item.get("line_ending", "LF")),
+            created_by_id=tenant_id,
+            created_at=item["created_at"],
+            system_modstamp=item.get("system_modstamp") or item["updated_at"],
+            content_type=content_type,
+            compression=compression,
+            line_ending=item.get("line_ending", "LF"),
             column_delimiter=item.get("column_delimiter", ","),
             number_records_processed=item.get("number_records_processed", 0),
             number_records_failed=item.get("number_records_failed", 0),
@@ -718,9 +1162,12 @@ class BulkJobService:
             total_processing_time=item.get("total_processing_time", 0),
             api_version=item.get("api_version", "v1"),
             concurrency_mode=item.get("concurrency_mode", "Parallel"),
-            content_url=item.get("content_url"),
+            # Derived rather than stored, so it follows the configured bucket
+            content_url=self._get_content_url(
+                tenant_id, job_id, operation, content_type, compression
+            ),
             error_message=item.get("error_message"),
-            job_type="V2Query" if item["operation"] == "query" else "V2Ingest",
+            job_type="V2Query" if operation == "query" else "V2Ingest",
         )
 
     @tracer.capture_method
@@ -762,6 +1209,7 @@ class BulkJobService:
         )
 
     @tracer.capture_method
+    @_annotate_round_trips
     def delete_job(self, job_id: str, tenant_id: str) -> None:
         """Delete a completed job.
 
@@ -783,7 +1231,8 @@ class BulkJobService:
         try:
             self.table.delete_item(
                 Key={"job_id": job_id},
-                ConditionExpression=Attr("tenant_id").eq(tenant_id),
+                ConditionExpression="tenant_id = :tenant_id",
+                ExpressionAttributeValues={":tenant_id": tenant_id},
             )
             logger.info("Bulk job deleted", extra={"job_id": job_id})
         except ClientError as e:
@@ -791,12 +1240,15 @@ class BulkJobService:
             raise
 
     @tracer.capture_method
+    @_annotate_round_trips
     def add_batch(
         self,
         job_id: str,
         tenant_id: str,
         data: str | bytes,
         content_type: DataFormat,
+        *,
+        job: BulkJobInfo | None = None,
     ) -> dict[str, Any]:
         """Add a batch of data to a job.
 
@@ -807,14 +1259,15 @@ class BulkJobService:
             tenant_id: Tenant identifier
             data: Data to upload
             content_type: Format of the data
+            job: The job, if the caller already fetched it; skips the lookup
 
         Returns:
             Batch info with upload details
         """
-        job = self.get_job(job_id, tenant_id)
+        job = self._resolve_job(job_id, tenant_id, job)
 
         if job.state != BulkJobState.OPEN:
-            raise BulkJobStateError(job_id, job.state.value, "add_batch")
+            raise BulkJobStateError(job_id, job.state, "add_batch")
 
         batch_id = str(uuid.uuid4())
         s3_key = f"bulk/{tenant_id}/{job_id}/batches/{batch_id}"
@@ -837,20 +1290,29 @@ class BulkJobService:
         }
 
     @tracer.capture_method
-    def get_job_results(self, job_id: str, tenant_id: str) -> dict[str, Any]:
+    @_annotate_round_trips
+    def get_job_results(
+        self,
+        job_id: str,
+        tenant_id: str,
+        *,
+        job: BulkJobInfo | None = None,
+    ) -> dict[str, Any]:
         """Get results for a completed job.
 
         Args:
             job_id: Job identifier
             tenant_id: Tenant identifier
+            job: The job, if the caller already fetched it; skips the lookup
 
         Returns:
             Job results including download URLs
         """
-        job = self.get_job(job_id, tenant_id)
+        job = self._resolve_job(job_id, tenant_id, job)
 
-        if not job.state.is_terminal:
-            raise BulkJobStateError(job_id, job.state.value, "get_results")
+        # BulkJobInfo stores the plain state value
+        if not BulkJobState(job.state).is_terminal:
+            raise BulkJobStateError(job_id, job.state, "get_results")
 
         # Generate presigned URL for results
         results_key = f"bulk/{tenant_id}/{job_id}/results/data"
@@ -858,7 +1320,7 @@ class BulkJobService:
 
         result: dict[str, Any] = {
             "job_id": job_id,
-            "state": job.state.value,
+            "state": job.state,
             "number_records_processed": job.number_records_processed,
             "number_records_failed": job.number_records_failed,
         }
@@ -3,19 +3,121 @@
 import csv
 import io
 import json
+import time
+from collections.abc import Iterable, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime, timedelta
-from typing import Any
+from functools import lru_cache
+from itertools import zip_longest
+from tempfile import SpooledTemporaryFile
+from typing import TYPE_CHECKING, Any
 from urllib.parse import urlparse
 
-import boto3
 from aws_lambda_powertools import Logger, Tracer
+from boto3.exceptions import S3UploadFailedError
+from boto3.s3.transfer import TransferConfig
 from botocore.exceptions import ClientError
 
+from spectra.services.redshift import RedshiftError, RedshiftService
+from spectra.utils.aws import get_client
 from spectra.utils.config import get_settings
 
+try:
+    import orjson
+except ImportError:  # Optional speedup; stdlib json is used otherwise
+    orjson = None
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
 logger = Logger()
 tracer = Tracer()
 
+# Shared stdlib encoder for exports. Compact, non-ASCII-escaped output matches
+# what orjson produces, and reusing one instance avoids building an encoder
+# with its ``default`` hook on every export
+_JSON_ENCODER = json.JSONEncoder(default=str, ensure_ascii=False, separators=(",", ":"))
+
+# Exports up to this many rows are encoded in one pass and sent with a single PutObject
+_JSON_BUFFERED_MAX_ROWS = 10_000
+
+# Streamed exports stay in memory up to this size before spilling to /tmp
+_UPLOAD_SPOOL_MAX_SIZE = 8 * 1024 * 1024
+
+# Parallel HEAD requests when list_exports_page is asked for object metadata
+_HEAD_MAX_WORKERS = 16
+
+# Presigned URLs are reused while at least half their lifetime (and never less
+# than the margin) remains, so repeated downloads of a hot result get the same
+# cacheable URL without re-signing
+_PRESIGNED_URL_CACHE: dict[tuple[str, str, int], tuple[str, datetime]] = {}
+_PRESIGNED_URL_CACHE_MAX_SIZE = 10_000
+_PRESIGNED_URL_MIN_REMAINING = timedelta(seconds=60)
+
+# Regions of buckets other than the export bucket, looked up once per process
+# so requests for them are signed for, and sent to, the bucket's own region
+# instead of being redirected and retried from the configured one
+_BUCKET_REGIONS: dict[str, str] = {}
+
+# Formats Redshift can UNLOAD results as
+_UNLOAD_FORMATS = frozenset({"PARQUET", "CSV", "JSON"})
+
+# Bodies above the threshold are sent as parallel multipart uploads
+_UPLOAD_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=8 * 1024 * 1024,
+    multipart_chunksize=16 * 1024 * 1024,
+    max_concurrency=10,
+    use_threads=True,
+)
+
+
+def _dumps_json(payload: Any) -> bytes:
+    """Serialize a document to UTF-8 JSON bytes in one pass.
+
+    Uses orjson when installed. Datetimes are passed through to ``str`` like
+    the stdlib fallback so both produce the same values.
+    """
+    if orjson is None:
+        return _JSON_ENCODER.encode(payload).encode("utf-8")
+    return orjson.dumps(
+        payload,
+        default=str,
+        option=orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME,
+    )
+
+
+@lru_cache(maxsize=1)
+def _format_epoch_day(epoch_day: int) -> str:
+    """Format a UTC epoch day number as ``YYYY/MM/DD``."""
+    day = datetime.fromtimestamp(epoch_day * 86400, tz=UTC)
+    return f"{day.year:04d}/{day.month:02d}/{day.day:02d}"
+
+
+def _date_prefix() -> str:
+    """Return today's UTC date as ``YYYY/MM/DD``, formatting it once per day."""
+    return _format_epoch_day(int(time.time()) // 86400)
+
+
+def _cache_presigned_url(
+    cache_key: tuple[str, str, int], url: str, expires_at: datetime, now: datetime
+) -> None:
+    """Store a presigned URL, pruning expired entries when the cache is full."""
+    if len(_PRESIGNED_URL_CACHE) >= _PRESIGNED_URL_CACHE_MAX_SIZE:
+        for stale_key in [k for k, (_, exp) in _PRESIGNED_URL_CACHE.items() if exp <= now]:
+            del _PRESIGNED_URL_CACHE[stale_key]
+        if len(_PRESIGNED_URL_CACHE) >= _PRESIGNED_URL_CACHE_MAX_SIZE:
+            _PRESIGNED_URL_CACHE.clear()
+    _PRESIGNED_URL_CACHE[cache_key] = (url, expires_at)
+
+
+def _location_to_region(location: str | None) -> str:
+    """Map a GetBucketLocation constraint to a region name."""
+    if not location:
+        return "us-east-1"
+    if location == "EU":
+        return "eu-west-1"
+    return location
+
 
 class ExportError(Exception):
     """Base exception for export operations."""
@@ -29,7 +131,43 @@ class ExportService:
     def __init__(self) -> None:
         """Initialize export service."""
         self.settings = get_settings()
-        self.s3_client = boto3.client("s3", region_name=self.settings.aws_region)
+        self.s3_client = get_client("s3", self.settings.aws_region)
+
+    def _client_for_bucket(self, bucket: str) -> Any:
+        """Get an S3 client for the region a bucket lives in.
+
+        The export bucket is deployed alongside the service and uses the
+        default client. Other buckets have their region resolved with a
+        single GetBucketLocation call per process; if that fails, the
+        configured region is used for this call only.
+
+        Args:
+            bucket: Bucket name
+
+        Returns:
+            S3 client for the bucket's region
+        """
+        if bucket == self.settings.s3_bucket_name:
+            return self.s3_client
+
+        region = _BUCKET_REGIONS.get(bucket)
+        if region is None:
+            try:
+                response = self.s3_client.get_bucket_location(Bucket=bucket)
+            except ClientError as e:
+                # Not cached, so a transient failure is retried on the next request
+                logger.warning(
+                    "Failed to resolve bucket region",
+                    extra={"bucket": bucket, "error": str(e)},
+                )
+                region = self.settings.aws_region
+            else:
+                region = _location_to_region(response.get("LocationConstraint"))
+                _BUCKET_REGIONS[bucket] = region
+
+        if region == self.settings.aws_region:
+            return self.s3_client
+        return get_client("s3", region)
 
     @tracer.capture_method
     def write_json_results(
@@ -41,6 +179,11 @@ class ExportService:
     ) -> str:
         """Write JSON results to S3.
 
+        Small results are encoded in a single pass and sent with one
+        PutObject. Larger results are encoded incrementally into a spooled
+        buffer and sent with a managed transfer, which switches to parallel
+        multipart uploads for large bodies.
+
         Args:
             job_id: Job identifier
             tenant_id: Tenant identifier
@@ -54,29 +197,30 @@ class ExportService:
             ExportError: If write fails
         """
         key = self._build_key(tenant_id, job_id, "json")
+        payload = {
+            "metadata": metadata or {},
+            "data": data,
+            "row_count": len(data),
+            "exported_at": datetime.now(UTC).isoformat(),
+        }
 
-        try:
-            body = json.dumps(
-                {
-                    "metadata": metadata or {},
-                    "data": data,
-                    "row_count": len(data),
-                    "exported_at": datetime.now(UTC).isoformat(),
-                },
-                default=str,
-            )
+        s3_metadata = {
+            "job_id": job_id,
+            "tenant_id": tenant_id,
+            "row_count": str(len(data)),
+        }
 
-            self.s3_client.put_object(
-                Bucket=self.settings.s3_bucket_name,
-                Key=key,
-                Body=body.encode("utf-8"),
-                ContentType="application/json",
-                Metadata={
-                    "job_id": job_id,
-                    "tenant_id": tenant_id,
-                    "row_count": str(len(data)),
-                },
-            )
+        try:
+            if len(data) <= _JSON_BUFFERED_MAX_ROWS:
+                self.s3_client.put_object(
+                    Bucket=self.settings.s3_bucket_name,
+                    Key=key,
+                    Body=_dumps_json(payload),
+                    ContentType="application/json",
+                    Metadata=s3_metadata,
+                )
+            else:
+                self._upload_json_stream(key, payload, s3_metadata)
 
             s3_uri = f"s3://{self.settings.s3_bucket_name}/{key}"
             logger.info(
@@ -86,17 +230,46 @@ class ExportService:
 
             return s3_uri
 
-        except ClientError as e:
+        except (ClientError, S3UploadFailedError) as e:
             logger.error("Failed to export JSON to S3", extra={"error": str(e)})
             raise ExportError(f"Failed to export results: {e}")
 
+    def _upload_json_stream(
+        self,
+        key: str,
+        payload: dict[str, Any],
+        s3_metadata: dict[str, str],
+    ) -> None:
+        """Encode a JSON document incrementally and upload it with a managed transfer.
+
+        Args:
+            key: S3 key to write
+            payload: Document to encode
+            s3_metadata: S3 object metadata
+        """
+        with SpooledTemporaryFile(max_size=_UPLOAD_SPOOL_MAX_SIZE) as body:
+            # Encode incrementally so the full document never exists as one str
+            text = io.TextIOWrapper(body, encoding="utf-8")
+            text.writelines(_JSON_ENCODER.iterencode(payload))
+            text.flush()
+            text.detach()
+            body.seek(0)
+
+            self.s3_client.upload_fileobj(
+                body,
+                self.settings.s3_bucket_name,
+                key,
+                ExtraArgs={"ContentType": "application/json", "Metadata": s3_metadata},
+                Config=_UPLOAD_TRANSFER_CONFIG,
+            )
+
     @tracer.capture_method
     def write_parquet_results(
         self,
         job_id: str,
         tenant_id: str,
         columns: list[str],
-        data: list[dict[str, Any]],
+        data: list[dict[str, Any]] | list[Sequence[Any]],
     ) -> str:
         """Write query results to S3 in Parquet format.
 
@@ -106,7 +279,7 @@ class ExportService:
             job_id: Job identifier
             tenant_id: Tenant identifier
             columns: Column names
-            data: Result data as list of dicts
+            data: Result data as list of dicts, or of rows in column order
 
         Returns:
             S3 URI of the result file
@@ -124,8 +297,17 @@ class ExportService:
 
                 key = self._build_key(tenant_id, job_id, "parquet")
 
-                # Create PyArrow table
-                table = pa.Table.from_pylist(data)
+                # Create PyArrow table; positional rows are transposed into
+                # columns without building a dict per row
+                if data and not isinstance(data[0], dict):
+                    table = pa.table(
+                        {
+                            name: list(values)
+                            for name, values in zip(columns, zip_longest(*data), strict=False)
+                        }
+                    )
+                else:
+                    table = pa.Table.from_pylist(data)
 
                 # Write to bytes buffer
                 buffer = BytesIO()
@@ -135,7 +317,8 @@ class ExportService:
                 self.s3_client.put_object(
                     Bucket=self.settings.s3_bucket_name,
                     Key=key,
-                    Body=buffer.getvalue(),
+                    # Upload from the buffer itself rather than a getvalue() copy
+                    Body=buffer,
                     ContentType="application/octet-stream",
                     Metadata={
                         "job_id": job_id,
@@ -172,15 +355,22 @@ class ExportService:
         job_id: str,
         tenant_id: str,
         columns: list[str],
-        data: list[dict[str, Any]],
+        data: Iterable[dict[str, Any] | Sequence[Any]],
     ) -> str:
         """Write CSV results to S3.
 
+        Rows are written straight into a spooled buffer and sent with a
+        managed transfer, so the CSV is never held as a separate str and
+        bytes copy.
+
         Args:
             job_id: Job identifier
             tenant_id: Tenant identifier
             columns: Column names
-            data: Result data to write
+            data: Result rows to write; may be a generator. Dict rows are
+                projected onto ``columns`` (missing values become empty and
+                extra keys are ignored); list or tuple rows are written as-is
+                and must already be in column order.
 
         Returns:
             S3 URI of the written file
@@ -191,37 +381,123 @@ class ExportService:
         key = self._build_key(tenant_id, job_id, "csv")
 
         try:
-            output = io.StringIO()
-            writer = csv.DictWriter(output, fieldnames=columns, extrasaction="ignore")
-            writer.writeheader()
-            writer.writerows(data)
+            with SpooledTemporaryFile(max_size=_UPLOAD_SPOOL_MAX_SIZE) as body:
+                text = io.TextIOWrapper(body, encoding="utf-8", newline="")
+                # csv.writer with an explicit projection skips DictWriter's
+                # per-row field checks
+                writer = csv.writer(text)
+                writer.writerow(columns)
+                row_count = 0
+                for row in data:
+                    writer.writerow(
+                        [row.get(column, "") for column in columns]
+                        if isinstance(row, dict)
+                        else row
+                    )
+                    row_count += 1
+                text.flush()
+                text.detach()
+                body.seek(0)
+
+                self.s3_client.upload_fileobj(
+                    body,
+                    self.settings.s3_bucket_name,
+                    key,
+                    ExtraArgs={
+                        "ContentType": "text/csv",
+                        "Metadata": {
+                            "job_id": job_id,
+                            "tenant_id": tenant_id,
+                            "row_count": str(row_count),
+                        },
+                    },
+                    Config=_UPLOAD_TRANSFER_CONFIG,
+                )
+
+            s3_uri = f"s3://{self.settings.s3_bucket_name}/{key}"
+            logger.info(
+                "Exported CSV results to S3",
+                extra={"s3_uri": s3_uri, "row_count": row_count},
+            )
 
-            body = output.getvalue()
+            return s3_uri
 
+        except (ClientError, S3UploadFailedError) as e:
+            logger.error("Failed to export CSV to S3", extra={"error": str(e)})
+            raise ExportError(f"Failed to export results: {e}")
+
+    @tracer.capture_method
+    def write_arrow_results(
+        self,
+        job_id: str,
+        tenant_id: str,
+        table: "pa.Table",
+        format: str,
+    ) -> str:
+        """Write a pyarrow Table to S3 as Parquet or CSV.
+
+        The table is encoded by pyarrow directly, without materializing
+        per-row Python dictionaries.
+
+        Args:
+            job_id: Job identifier
+            tenant_id: Tenant identifier
+            table: Result data as a pyarrow Table
+            format: Output format ('parquet' or 'csv')
+
+        Returns:
+            S3 URI of the written file
+
+        Raises:
+            ExportError: If the format is unsupported or the write fails
+        """
+        # pyarrow and its writers are imported on first use so JSON and
+        # inline exports do not load them at cold start
+        import pyarrow as pa  # noqa: PLC0415
+
+        fmt = format.lower()
+        buffer = pa.BufferOutputStream()
+        if fmt == "parquet":
+            import pyarrow.parquet as pq  # noqa: PLC0415
+
+            pq.write_table(table, buffer)
+            content_type = "application/octet-stream"
+        elif fmt == "csv":
+            import pyarrow.csv as pa_csv  # noqa: PLC0415
+
+            pa_csv.write_csv(table, buffer)
+            content_type = "text/csv"
+        else:
+            raise ExportError(f"Unsupported Arrow export format: {format}")
+
+        key = self._build_key(tenant_id, job_id, fmt)
+
+        try:
             self.s3_client.put_object(
                 Bucket=self.settings.s3_bucket_name,
                 Key=key,
-                Body=body.encode("utf-8"),
-                ContentType="text/csv",
+                # Zero-copy reader over the Arrow buffer; to_pybytes() would copy it
+                Body=pa.BufferReader(buffer.getvalue()),
+                ContentType=content_type,
                 Metadata={
                     "job_id": job_id,
                     "tenant_id": tenant_id,
-                    "row_count": str(len(data)),
+                    "row_count": str(table.num_rows),
+                    "format": fmt,
                 },
             )
-
-            s3_uri = f"s3://{self.settings.s3_bucket_name}/{key}"
-            logger.info(
-                "Exported CSV results to S3",
-                extra={"s3_uri": s3_uri, "row_count": len(data)},
-            )
-
-            return s3_uri
-
         except ClientError as e:
-            logger.error("Failed to export CSV to S3", extra={"error": str(e)})
+            logger.error("Failed to export Arrow results to S3", extra={"error": str(e)})
             raise ExportError(f"Failed to export results: {e}")
 
+        s3_uri = f"s3://{self.settings.s3_bucket_name}/{key}"
+        logger.info(
+            "Exported Arrow results to S3",
+            extra={"s3_uri": s3_uri, "row_count": table.num_rows, "format": fmt},
+        )
+
+        return s3_uri
+
     @tracer.capture_method
     def generate_presigned_url(
         self,
@@ -230,6 +506,10 @@ class ExportService:
     ) -> tuple[str, datetime]:
         """Generate a presigned URL for downloading results.
 
+        URLs are cached per process by object and expiry, and a cached URL is
+        returned while at least half of its lifetime remains. The returned
+        expiration is that of the URL actually handed out.
+
         Args:
             s3_uri: S3 URI of the file
             expiry_seconds: URL expiration in seconds
@@ -247,14 +527,22 @@ class ExportService:
         bucket = parsed.netloc
         key = parsed.path.lstrip("/")
 
+        now = datetime.now(UTC)
+        cache_key = (bucket, key, expiry)
+        cached = _PRESIGNED_URL_CACHE.get(cache_key)
+        min_remaining = max(timedelta(seconds=expiry / 2), _PRESIGNED_URL_MIN_REMAINING)
+        if cached is not None and cached[1] - now >= min_remaining:
+            return cached
+
         try:
-            url = self.s3_client.generate_presigned_url(
+            url = self._client_for_bucket(bucket).generate_presigned_url(
                 "get_object",
                 Params={"Bucket": bucket, "Key": key},
                 ExpiresIn=expiry,
             )
 
-            expires_at = datetime.now(UTC) + timedelta(seconds=expiry)
+            expires_at = now + timedelta(seconds=expiry)
+            _cache_presigned_url(cache_key, url, expires_at, now)
 
             logger.info(
                 "Generated presigned URL",
@@ -285,7 +573,7 @@ class ExportService:
         key = parsed.path.lstrip("/")
 
         try:
-            response = self.s3_client.head_object(Bucket=bucket, Key=key)
+            response = self._client_for_bucket(bucket).head_object(Bucket=bucket, Key=key)
 
             return {
                 "size_bytes": response.get("ContentLength", 0),
@@ -315,7 +603,7 @@ class ExportService:
         key = parsed.path.lstrip("/")
 
         try:
-            self.s3_client.delete_object(Bucket=bucket, Key=key)
+            self._client_for_bucket(bucket).delete_object(Bucket=bucket, Key=key)
             logger.info("Deleted export", extra={"s3_uri": s3_uri})
             return True
 
@@ -334,13 +622,73 @@ class ExportService:
         Returns:
             S3 path for UNLOAD destination
         """
-        date_prefix = datetime.now(UTC).strftime("%Y/%m/%d")
+        date_prefix = _date_prefix()
         return (
             f"s3://{self.settings.s3_bucket_name}/"
             f"{self.settings.s3_prefix}"
             f"{tenant_id}/{date_prefix}/{job_id}/"
         )
 
+    @tracer.capture_method
+    def export_via_unload(
+        self,
+        job_id: str,
+        tenant_id: str,
+        sql: str,
+        db_user: str,
+        *,
+        format: str = "PARQUET",
+    ) -> dict[str, Any]:
+        """Export query results with a Redshift UNLOAD instead of through the Lambda.
+
+        Redshift writes the files in parallel directly under the job's
+        UNLOAD prefix, capped at ``unload_max_file_size_mb`` each. The
+        statement runs asynchronously; once it finishes, the prefix holds
+        the complete result and can be read with Redshift Spectrum or
+        ``aws s3 cp --recursive``.
+
+        Args:
+            job_id: Job identifier
+            tenant_id: Tenant identifier
+            sql: SELECT query to export
+            db_user: Database user
+            format: UNLOAD format ('PARQUET', 'CSV' or 'JSON')
+
+        Returns:
+            Dict with 'statement_id', 'location' (S3 prefix) and 'format'
+
+        Raises:
+            ExportError: If UNLOAD is not configured or cannot be started
+        """
+        file_format = format.upper()
+        if file_format not in _UNLOAD_FORMATS:
+            raise ExportError(f"Unsupported UNLOAD format: {format}")
+        if not self.settings.unload_iam_role_arn:
+            raise ExportError("UNLOAD export requires unload_iam_role_arn to be configured")
+
+        location = self.build_unload_path(tenant_id, job_id)
+
+        try:
+            statement_id = RedshiftService().execute_unload(
+                sql=sql,
+                s3_path=location,
+                db_user=db_user,
+                iam_role=self.settings.unload_iam_role_arn,
+                tenant_id=tenant_id,
+                file_format=file_format,
+                max_file_size_mb=self.settings.unload_max_file_size_mb,
+            )
+        except RedshiftError as e:
+            logger.error("Failed to start UNLOAD export", extra={"error": str(e)})
+            raise ExportError(f"Failed to export results: {e}")
+
+        logger.info(
+            "Started UNLOAD export",
+            extra={"location": location, "statement_id": statement_id},
+        )
+
+        return {"statement_id": statement_id, "location": location, "format": file_format}
+
     def _build_key(self, tenant_id: str, job_id: str, extension: str) -> str:
         """Build S3 key for a result file.
 
@@ -352,7 +700,7 @@ class ExportService:
         Returns:
             S3 key
         """
-        date_prefix = datetime.now(UTC).strftime("%Y/%m/%d")
+        date_prefix = _date_prefix()
         return f"{self.settings.s3_prefix}{tenant_id}/{date_prefix}/{job_id}/results.{extension}"
 
     @tracer.capture_method
@@ -382,28 +730,27 @@ class ExportService:
         records = results.get("records", [])
         columns = [col.get("name", "") for col in results.get("column_info", [])]
 
-        # Convert records to list of dicts if needed
-        if records and isinstance(records[0], list):
-            data = [dict(zip(columns, row, strict=False)) for row in records]
-        else:
-            data = records
-
-        # Export based on format
+        # Export based on format. CSV and Parquet take positional rows as-is;
+        # only JSON output needs each row as a dict
         if format.lower() == "parquet":
             s3_uri = self.write_parquet_results(
                 job_id=job_id,
                 tenant_id=tenant_id,
                 columns=columns,
-                data=data,
+                data=records,
             )
         elif format.lower() == "csv":
             s3_uri = self.write_csv_results(
                 job_id=job_id,
                 tenant_id=tenant_id,
                 columns=columns,
-                data=data,
+                data=records,
             )
         else:
+            if records and isinstance(records[0], list):
+                data = [dict(zip(columns, row, strict=False)) for row in records]
+            else:
+                data = records
             s3_uri = self.write_json_results(
                 job_id=job_id,
                 tenant_id=tenant_id,
@@ -426,41 +773,147 @@ class ExportService:
         tenant_id: str,
         prefix: str | None = None,
         max_results: int = 100,
+        *,
+        fetch_metadata: bool = False,
     ) -> list[dict[str, Any]]:
         """List exports for a tenant.
 
+        Returns the first page only; use ``list_exports_page`` to continue
+        past it, or ``iter_exports`` to walk every export.
+
         Args:
             tenant_id: Tenant identifier
             prefix: Optional additional prefix filter
             max_results: Maximum number of results
+            fetch_metadata: Also fetch content type and user metadata per object
 
         Returns:
             List of export objects
         """
+        exports, _ = self.list_exports_page(
+            tenant_id, prefix, max_results, fetch_metadata=fetch_metadata
+        )
+        return exports
+
+    def list_exports_page(
+        self,
+        tenant_id: str,
+        prefix: str | None = None,
+        max_results: int = 100,
+        *,
+        next_token: str | None = None,
+        fetch_metadata: bool = False,
+    ) -> tuple[list[dict[str, Any]], str | None]:
+        """List one page of exports for a tenant.
+
+        Key, size and last-modified time come from a single ListObjectsV2
+        call, which is enough for listings. Content type and user metadata
+        need a HEAD request per object, so they are only fetched when
+        ``fetch_metadata`` is set; those requests run in parallel.
+
+        Args:
+            tenant_id: Tenant identifier
+            prefix: Optional additional prefix filter
+            max_results: Maximum number of results
+            next_token: Continuation token from a previous call
+            fetch_metadata: Also fetch content type and user metadata per object
+
+        Returns:
+            Tuple of (export objects, next continuation token or None)
+        """
         full_prefix = f"{self.settings.s3_prefix}{tenant_id}/"
         if prefix:
             full_prefix += prefix
 
+        list_kwargs: dict[str, Any] = {
+            "Bucket": self.settings.s3_bucket_name,
+            "Prefix": full_prefix,
+            "MaxKeys": max_results,
+        }
+        if next_token:
+            list_kwargs["ContinuationToken"] = next_token
+
         try:
-            response = self.s3_client.list_objects_v2(
-                Bucket=self.settings.s3_bucket_name,
-                Prefix=full_prefix,
-                MaxKeys=max_results,
-            )
+            response = self.s3_client.list_objects_v2(**list_kwargs)
 
-            exports = []
-            for obj in response.get("Contents", []):
-                exports.append(
-                    {
-                        "key": obj["Key"],
-                        "size_bytes": obj["Size"],
-                        "last_modified": obj["LastModified"],
-                        "s3_uri": f"s3://{self.settings.s3_bucket_name}/{obj['Key']}",
-                    }
-                )
+            exports = [self._export_entry(obj) for obj in response.get("Contents", [])]
+
+            if fetch_metadata and exports:
+                with ThreadPoolExecutor(max_workers=_HEAD_MAX_WORKERS) as executor:
+                    heads = executor.map(self._head_export, [e["key"] for e in exports])
+                    for export, head in zip(exports, heads, strict=True):
+                        if head is not None:
+                            export["content_type"] = head.get(
+                                "ContentType", "application/octet-stream"
+                            )
+                            export["metadata"] = head.get("Metadata", {})
 
-            return exports
+            return exports, response.get("NextContinuationToken")
 
         except ClientError as e:
             logger.error("Failed to list exports", extra={"tenant_id": tenant_id, "error": str(e)})
-            return []
+            return [], None
+
+    def iter_exports(
+        self,
+        tenant_id: str,
+        prefix: str | None = None,
+        *,
+        page_size: int = 1000,
+    ) -> Iterator[dict[str, Any]]:
+        """Iterate over all exports for a tenant, one listing page at a time.
+
+        Only the current ListObjectsV2 page is held in memory, so walking a
+        large prefix costs the same as listing a single page. Use
+        ``list_exports_page`` for a bounded page with a continuation token
+        or object metadata.
+
+        Args:
+            tenant_id: Tenant identifier
+            prefix: Optional additional prefix filter
+            page_size: Keys requested per ListObjectsV2 call
+
+        Yields:
+            Export objects with key, size, last-modified time and S3 URI.
+            Iteration stops early, after logging, if a listing call fails.
+        """
+        full_prefix = f"{self.settings.s3_prefix}{tenant_id}/"
+        if prefix:
+            full_prefix += prefix
+
+        paginator = self.s3_client.get_paginator("list_objects_v2")
+        pages = paginator.paginate(
+            Bucket=self.settings.s3_bucket_name,
+            Prefix=full_prefix,
+            PaginationConfig={"PageSize": page_size},
+        )
+        try:
+            for page in pages:
+                for obj in page.get("Contents", []):
+                    yield self._export_entry(obj)
+        except ClientError as e:
+            logger.error("Failed to list exports", extra={"tenant_id": tenant_id, "error": str(e)})
+
+    def _export_entry(self, obj: dict[str, Any]) -> dict[str, Any]:
+        """Build an export entry from a ListObjectsV2 content item."""
+        return {
+            "key": obj["Key"],
+            "size_bytes": obj["Size"],
+            "last_modified": obj["LastModified"],
+            "s3_uri": f"s3://{self.settings.s3_bucket_name}/{obj['Key']}",
+        }
+
+    def _head_export(self, key: str) -> dict[str, Any] | None:
+        """HEAD a listed export, returning None if it can no longer be read.
+
+        Args:
+            key: S3 key from the listing
+
+        Returns:
+            HeadObject response, or None on error
+        """
+        try:
+            return self.s3_client.head_object(Bucket=self.settings.s3_bucket_name, Key=key)
+        except ClientError as e:
+            logger.warning("Failed to head export", extra={"key": key, "error": str(e)})
+            return None
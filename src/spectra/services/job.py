@@ -2,20 +2,108 @@
 
 import hashlib
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime, timedelta
-from typing import Any
+from typing import Any, Literal, overload
 
-import boto3
 from aws_lambda_powertools import Logger, Tracer
 from boto3.dynamodb.conditions import Attr, Key
 from botocore.exceptions import ClientError
 
 from spectra.models.job import Job, JobError, JobResult, JobStatus
+from spectra.utils.aws import deserialize_item, get_client, get_resource, get_table, serialize_item
 from spectra.utils.config import get_settings
 
 logger = Logger()
 tracer = Tracer()
 
+# Statuses the poller tracks. Jobs in these statuses carry a copy of their
+# status in ``pending_status``, the key of the sparse pending-index GSI; it is
+# removed on any other status so finished jobs drop out of the index.
+_PENDING_STATUSES = (JobStatus.SUBMITTED, JobStatus.RUNNING)
+
+# Batch members are spread over up to this many batch-shard-index partitions,
+# one per _JOBS_PER_BATCH_SHARD jobs, so list_batch_jobs can read large
+# batches with parallel queries and small ones with a single query
+_BATCH_SHARDS = 16
+_JOBS_PER_BATCH_SHARD = 50
+
+# TransactWriteItems accepts at most 100 actions per request
+_TRANSACT_WRITE_LIMIT = 100
+
+
+def _batch_shard_count(job_count: int) -> int:
+    """Return how many batch-shard-index partitions a batch write spreads over."""
+    return min(_BATCH_SHARDS, max(1, -(-job_count // _JOBS_PER_BATCH_SHARD)))
+
+
+def _job_item(job: Job, shard: int = 0, shard_count: int = 1) -> dict[str, Any]:
+    """Convert a new job to its DynamoDB item, adding index-only attributes.
+
+    Every write puts a job in shard 0 tagged with its shard count, so
+    list_batch_jobs learns from shard 0 how many shards to read.
+    """
+    item = job.to_dynamo_item()
+    if job.batch_id:
+        item["batch_shard"] = f"{job.batch_id}#{shard}"
+        item["batch_shards"] = shard_count
+    return item
+
+
+def _status_update(
+    status: JobStatus,
+    now: datetime,
+    statement_id: str | None = None,
+    result: JobResult | None = None,
+    error: JobError | None = None,
+) -> tuple[str, dict[str, str], dict[str, Any]]:
+    """Build the update expression for a status transition.
+
+    Returns:
+        Tuple of (UpdateExpression, ExpressionAttributeNames, ExpressionAttributeValues)
+    """
+    update_expr = "SET #status = :status, updated_at = :updated_at"
+    expr_names = {"#status": "status"}
+    expr_values: dict[str, Any] = {
+        ":status": status.value,
+        ":updated_at": now.isoformat(),
+    }
+
+    # Add statement_id if provided
+    if statement_id:
+        update_expr += ", statement_id = :statement_id, submitted_at = :submitted_at"
+        expr_values[":statement_id"] = statement_id
+        expr_values[":submitted_at"] = now.isoformat()
+
+    # Add started_at for RUNNING status
+    if status == JobStatus.RUNNING:
+        update_expr += ", started_at = :started_at"
+        expr_values[":started_at"] = now.isoformat()
+
+    # Add completed_at for terminal states
+    if status.is_terminal:
+        update_expr += ", completed_at = :completed_at"
+        expr_values[":completed_at"] = now.isoformat()
+
+    # Add result for completed jobs
+    if result:
+        update_expr += ", #result = :result"
+        expr_names["#result"] = "result"
+        expr_values[":result"] = result.dynamo_map
+
+    # Add error for failed jobs
+    if error:
+        update_expr += ", #error = :error"
+        expr_names["#error"] = "error"
+        expr_values[":error"] = error.dynamo_map
+
+    if status in _PENDING_STATUSES:
+        update_expr += ", pending_status = :status"
+    else:
+        update_expr += " REMOVE pending_status"
+
+    return update_expr, expr_names, expr_values
+
 
 class JobNotFoundError(Exception):
     """Raised when a job is not found."""
@@ -37,8 +125,11 @@ class JobService:
     def __init__(self) -> None:
         """Initialize job service."""
         self.settings = get_settings()
-        self.dynamodb = boto3.resource("dynamodb", region_name=self.settings.aws_region)
-        self.table = self.dynamodb.Table(self.settings.dynamodb_table_name)
+        self.dynamodb = get_resource("dynamodb", self.settings.aws_region)
+        self.table = get_table(self.settings.dynamodb_table_name, self.settings.aws_region)
+        # Low-level client for the hot create/get paths; skips the resource
+        # layer's per-call expression building and recursive type conversion
+        self.dynamodb_client = get_client("dynamodb", self.settings.aws_region)
 
     @staticmethod
     def generate_job_id() -> str:
@@ -48,14 +139,80 @@ class JobService:
     @staticmethod
     def hash_sql(sql: str) -> str:
         """Generate a hash of the SQL for deduplication."""
+        # split()/join() runs in C and measures faster than a precompiled
+        # re.sub; it also collapses Unicode whitespace, which a bytes regex
+        # would not, so stored hashes stay stable
         normalized = " ".join(sql.split()).lower()
         return hashlib.sha256(normalized.encode()).hexdigest()[:16]
 
+    @staticmethod
+    def hash_sql_batch(sqls: list[str]) -> list[str]:
+        """Hash several SQL statements, matching ``hash_sql`` for each.
+
+        Repeated statements, common in batch submissions, are hashed once.
+
+        Args:
+            sqls: SQL statements
+
+        Returns:
+            Hashes in the order of ``sqls``
+        """
+        sha256 = hashlib.sha256
+        seen: dict[str, str] = {}
+        hashes = []
+        for sql in sqls:
+            sql_hash = seen.get(sql)
+            if sql_hash is None:
+                normalized = " ".join(sql.split()).lower()
+                sql_hash = seen[sql] = sha256(normalized.encode()).hexdigest()[:16]
+            hashes.append(sql_hash)
+        return hashes
+
     def _calculate_ttl(self) -> int:
         """Calculate TTL timestamp for DynamoDB."""
         ttl_datetime = datetime.now(UTC) + timedelta(days=self.settings.dynamodb_ttl_days)
         return int(ttl_datetime.timestamp())
 
+    def _build_job(
+        self,
+        tenant_id: str,
+        sql: str,
+        db_user: str,
+        *,
+        db_group: str | None = None,
+        output_format: str = "json",
+        async_mode: bool = True,
+        timeout_seconds: int | None = None,
+        idempotency_key: str | None = None,
+        batch_id: str | None = None,
+        metadata: dict[str, Any] | None = None,
+        sql_hash: str | None = None,
+    ) -> Job:
+        """Build a new QUEUED job.
+
+        Arguments are the same as for ``create_job``; ``sql_hash`` may be
+        passed when it has already been computed.
+        """
+        now = datetime.now(UTC)
+        return Job(
+            job_id=self.generate_job_id(),
+            tenant_id=tenant_id,
+            status=JobStatus.QUEUED,
+            sql=sql,
+            sql_hash=sql_hash or self.hash_sql(sql),
+            db_user=db_user,
+            db_group=db_group,
+            created_at=now,
+            updated_at=now,
+            output_format=output_format,
+            async_mode=async_mode,
+            timeout_seconds=timeout_seconds or self.settings.query_timeout_seconds,
+            idempotency_key=idempotency_key,
+            batch_id=batch_id,
+            metadata=metadata,
+            ttl=self._calculate_ttl(),
+        )
+
     @tracer.capture_method
     def create_job(
         self,
@@ -90,40 +247,32 @@ class JobService:
         Raises:
             DuplicateJobError: If idempotency key matches existing job
         """
-        now = datetime.now(UTC)
-        job_id = self.generate_job_id()
-        sql_hash = self.hash_sql(sql)
-
         # Check for existing job with same idempotency key
         if idempotency_key:
             existing = self._find_by_idempotency_key(tenant_id, idempotency_key)
             if existing:
                 raise DuplicateJobError(existing.job_id)
 
-        job = Job(
-            job_id=job_id,
-            tenant_id=tenant_id,
-            status=JobStatus.QUEUED,
-            sql=sql,
-            sql_hash=sql_hash,
-            db_user=db_user,
+        job = self._build_job(
+            tenant_id,
+            sql,
+            db_user,
             db_group=db_group,
-            created_at=now,
-            updated_at=now,
             output_format=output_format,
             async_mode=async_mode,
-            timeout_seconds=timeout_seconds or self.settings.query_timeout_seconds,
+            timeout_seconds=timeout_seconds,
             idempotency_key=idempotency_key,
             batch_id=batch_id,
             metadata=metadata,
-            ttl=self._calculate_ttl(),
         )
+        job_id = job.job_id
 
         # Save to DynamoDB
         try:
-            self.table.put_item(
-                Item=job.to_dynamo_item(),
-                ConditionExpression=Attr("job_id").not_exists(),
+            self.dynamodb_client.put_item(
+                TableName=self.settings.dynamodb_table_name,
+                Item=serialize_item(_job_item(job)),
+                ConditionExpression="attribute_not_exists(job_id)",
             )
             logger.info("Job created", extra={"job_id": job_id, "tenant_id": tenant_id})
             return job
@@ -133,6 +282,75 @@ class JobService:
                 raise DuplicateJobError(job_id)
             raise
 
+    @tracer.capture_method
+    def create_jobs_bulk(
+        self,
+        tenant_id: str,
+        db_user: str,
+        sqls: list[str],
+        *,
+        db_group: str | None = None,
+        output_format: str = "json",
+        async_mode: bool = True,
+        timeout_seconds: int | None = None,
+        batch_id: str | None = None,
+        metadata: dict[str, Any] | None = None,
+    ) -> list[Job]:
+        """Create one job per SQL statement with batched writes.
+
+        Items are written through the table's batch writer, which sends up to
+        25 puts per BatchWriteItem call and resubmits unprocessed items. Batch
+        writes cannot carry the ``not_exists`` condition used by
+        ``create_job``, so idempotency keys are not supported here.
+
+        Args:
+            tenant_id: Tenant identifier
+            db_user: Database user for execution
+            sqls: SQL queries, one job each
+            db_group: Optional database group
+            output_format: Desired output format
+            async_mode: Whether to execute asynchronously
+            timeout_seconds: Query timeout
+            batch_id: Optional batch ID shared by the jobs
+            metadata: Optional custom metadata
+
+        Returns:
+            Created jobs, in the order of ``sqls``
+        """
+        jobs = [
+            self._build_job(
+                tenant_id,
+                sql,
+                db_user,
+                db_group=db_group,
+                output_format=output_format,
+                async_mode=async_mode,
+                timeout_seconds=timeout_seconds,
+                batch_id=batch_id,
+                metadata=metadata,
+                sql_hash=sql_hash,
+            )
+            for sql, sql_hash in zip(sqls, self.hash_sql_batch(sqls), strict=True)
+        ]
+
+        try:
+            with self.table.batch_writer(overwrite_by_pkeys=["job_id"]) as batch:
+                shard_count = _batch_shard_count(len(jobs))
+                for position, job in enumerate(jobs):
+                    batch.put_item(Item=_job_item(job, position % shard_count, shard_count))
+        except ClientError as e:
+            logger.error(
+                "Failed to create jobs",
+                extra={"tenant_id": tenant_id, "count": len(jobs), "error": str(e)},
+            )
+            raise
+
+        logger.info(
+            "Jobs created",
+            extra={"tenant_id": tenant_id, "count": len(jobs), "batch_id": batch_id},
+        )
+        return jobs
+
     @tracer.capture_method
     def get_job(self, job_id: str, tenant_id: str | None = None) -> Job:
         """Get a job by ID.
@@ -148,24 +366,61 @@ class JobService:
             JobNotFoundError: If job not found
         """
         try:
-            response = self.table.get_item(Key={"job_id": job_id})
+            response = self.dynamodb_client.get_item(
+                TableName=self.settings.dynamodb_table_name,
+                Key={"job_id": {"S": job_id}},
+            )
             item = response.get("Item")
 
             if not item:
                 raise JobNotFoundError(f"Job {job_id} not found")
 
-            job = Job.from_dynamo_item(item)
-
-            # Validate tenant access
-            if tenant_id and job.tenant_id != tenant_id:
+            # Validate tenant access before paying for deserialization
+            if tenant_id and item.get("tenant_id", {}).get("S") != tenant_id:
                 raise JobNotFoundError(f"Job {job_id} not found")
 
-            return job
+            return Job.from_dynamo_item(deserialize_item(item))
 
         except ClientError as e:
             logger.error("Failed to get job", extra={"job_id": job_id, "error": str(e)})
             raise
 
+    @overload
+    def update_job_status(
+        self,
+        job_id: str,
+        status: JobStatus,
+        statement_id: str | None = None,
+        result: JobResult | None = None,
+        error: JobError | None = None,
+        *,
+        echo: Literal[True],
+    ) -> Job: ...
+
+    @overload
+    def update_job_status(
+        self,
+        job_id: str,
+        status: JobStatus,
+        statement_id: str | None = None,
+        result: JobResult | None = None,
+        error: JobError | None = None,
+        *,
+        echo: Literal[False] = False,
+    ) -> None: ...
+
+    @overload
+    def update_job_status(
+        self,
+        job_id: str,
+        status: JobStatus,
+        statement_id: str | None = None,
+        result: JobResult | None = None,
+        error: JobError | None = None,
+        *,
+        echo: bool,
+    ) -> Job | None: ...
+
     @tracer.capture_method
     def update_job_status(
         self,
@@ -174,79 +429,111 @@ class JobService:
         statement_id: str | None = None,
         result: JobResult | None = None,
         error: JobError | None = None,
-    ) -> Job:
+        *,
+        echo: bool = False,
+    ) -> Job | None:
         """Update job status and related fields.
 
+        A bare status change (no statement ID, result or error) is written
+        only if the job exists and is not already in that status; otherwise
+        it is a no-op. The updated item is only returned when ``echo`` is set.
+
         Args:
             job_id: Job identifier
             status: New status
             statement_id: Redshift statement ID
             result: Result info for completed jobs
             error: Error info for failed jobs
+            echo: Return the updated job
 
         Returns:
-            Updated Job instance
+            Updated Job instance if ``echo`` is set, otherwise None
         """
-        now = datetime.now(UTC)
-
-        update_expr = "SET #status = :status, updated_at = :updated_at"
-        expr_names = {"#status": "status"}
-        expr_values: dict[str, Any] = {
-            ":status": status.value,
-            ":updated_at": now.isoformat(),
+        update_expr, expr_names, expr_values = _status_update(
+            status, datetime.now(UTC), statement_id, result, error
+        )
+        update_kwargs: dict[str, Any] = {
+            "Key": {"job_id": job_id},
+            "UpdateExpression": update_expr,
+            "ExpressionAttributeNames": expr_names,
+            "ExpressionAttributeValues": expr_values,
+            "ReturnValues": "ALL_NEW" if echo else "NONE",
         }
-
-        # Add statement_id if provided
-        if statement_id:
-            update_expr += ", statement_id = :statement_id, submitted_at = :submitted_at"
-            expr_values[":statement_id"] = statement_id
-            expr_values[":submitted_at"] = now.isoformat()
-
-        # Add started_at for RUNNING status
-        if status == JobStatus.RUNNING:
-            update_expr += ", started_at = :started_at"
-            expr_values[":started_at"] = now.isoformat()
-
-        # Add completed_at for terminal states
-        if status.is_terminal:
-            update_expr += ", completed_at = :completed_at"
-            expr_values[":completed_at"] = now.isoformat()
-
-        # Add result for completed jobs
-        if result:
-            update_expr += ", #result = :result"
-            expr_names["#result"] = "result"
-            expr_values[":result"] = result.model_dump(mode="json", exclude_none=True)
-
-        # Add error for failed jobs
-        if error:
-            update_expr += ", #error = :error"
-            expr_names["#error"] = "error"
-            expr_values[":error"] = error.model_dump(mode="json", exclude_none=True)
+        if statement_id is None and result is None and error is None:
+            # attribute_exists keeps the update from creating a stub item for
+            # an unknown job ID, which "#status <> :status" alone would allow
+            update_kwargs["ConditionExpression"] = "attribute_exists(job_id) AND #status <> :status"
 
         try:
-            response = self.table.update_item(
-                Key={"job_id": job_id},
-                UpdateExpression=update_expr,
-                ExpressionAttributeNames=expr_names,
-                ExpressionAttributeValues=expr_values,
-                ReturnValues="ALL_NEW",
-            )
+            response = self.table.update_item(**update_kwargs)
 
             logger.info(
                 "Job status updated",
                 extra={"job_id": job_id, "status": status.value},
             )
 
-            return Job.from_dynamo_item(response["Attributes"])
+            return Job.from_dynamo_item(response["Attributes"]) if echo else None
 
         except ClientError as e:
+            if (
+                "ConditionExpression" in update_kwargs
+                and e.response.get("Error", {}).get("Code") == "ConditionalCheckFailedException"
+            ):
+                logger.debug(
+                    "Job status unchanged",
+                    extra={"job_id": job_id, "status": status.value},
+                )
+                return self.get_job(job_id) if echo else None
             logger.error(
                 "Failed to update job status",
                 extra={"job_id": job_id, "error": str(e)},
             )
             raise
 
+    @tracer.capture_method
+    def update_jobs_status(self, updates: list[tuple[str, JobStatus]]) -> None:
+        """Apply several status transitions with transactional batch writes.
+
+        Updates are sent as TransactWriteItems requests of up to 100 items,
+        instead of one UpdateItem round trip per job. Each request is
+        all-or-nothing, and every job must already exist.
+
+        Args:
+            updates: (job_id, new status) pairs
+
+        Raises:
+            ClientError: If a transaction is cancelled or fails
+        """
+        now = datetime.now(UTC)
+        client = self.dynamodb.meta.client
+        for start in range(0, len(updates), _TRANSACT_WRITE_LIMIT):
+            transact_items = []
+            for job_id, status in updates[start : start + _TRANSACT_WRITE_LIMIT]:
+                update_expr, expr_names, expr_values = _status_update(status, now)
+                transact_items.append(
+                    {
+                        "Update": {
+                            "TableName": self.settings.dynamodb_table_name,
+                            "Key": {"job_id": job_id},
+                            "UpdateExpression": update_expr,
+                            "ConditionExpression": "attribute_exists(job_id)",
+                            "ExpressionAttributeNames": expr_names,
+                            "ExpressionAttributeValues": expr_values,
+                        }
+                    }
+                )
+
+            try:
+                client.transact_write_items(TransactItems=transact_items)
+            except ClientError as e:
+                logger.error(
+                    "Failed to update job statuses",
+                    extra={"count": len(transact_items), "error": str(e)},
+                )
+                raise
+
+        logger.info("Job statuses updated", extra={"count": len(updates)})
+
     @tracer.capture_method
     def list_jobs(
         self,
@@ -299,21 +586,42 @@ class JobService:
     def list_batch_jobs(self, batch_id: str, tenant_id: str) -> list[Job]:
         """List all jobs in a batch.
 
+        Shard 0 of the batch-shard-index is read first; the largest shard
+        count recorded there says how many more shards hold members, and
+        those are queried to exhaustion in parallel.
+
         Args:
             batch_id: Batch identifier
             tenant_id: Tenant identifier for access control
 
         Returns:
-            List of jobs in the batch
+            List of jobs in the batch, oldest first
         """
+
+        def query_shard(shard: int) -> list[dict[str, Any]]:
+            query_kwargs: dict[str, Any] = {
+                "IndexName": "batch-shard-index",
+                "KeyConditionExpression": Key("batch_shard").eq(f"{batch_id}#{shard}"),
+                "FilterExpression": Attr("tenant_id").eq(tenant_id),
+            }
+            items: list[dict[str, Any]] = []
+            while True:
+                response = self.table.query(**query_kwargs)
+                items.extend(response.get("Items", []))
+                if "LastEvaluatedKey" not in response:
+                    return items
+                query_kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+
         try:
-            response = self.table.query(
-                IndexName="batch-index",
-                KeyConditionExpression=Key("batch_id").eq(batch_id),
-                FilterExpression=Attr("tenant_id").eq(tenant_id),
-            )
+            items = query_shard(0)
+            shard_count = max((int(item.get("batch_shards", 1)) for item in items), default=1)
+            if shard_count > 1:
+                with ThreadPoolExecutor(max_workers=shard_count - 1) as executor:
+                    for shard_items in executor.map(query_shard, range(1, shard_count)):
+                        items.extend(shard_items)
 
-            return [Job.from_dynamo_item(item) for item in response.get("Items", [])]
+            items.sort(key=lambda item: item["created_at"])
+            return [Job.from_dynamo_item(item) for item in items]
 
         except ClientError as e:
             logger.error(
@@ -322,6 +630,92 @@ class JobService:
             )
             raise
 
+    def backfill_batch_shard(self) -> int:
+        """Index batch jobs written before the batch-shard-index existed.
+
+        Such jobs have a ``batch_id`` but no ``batch_shard`` and are missing
+        from ``list_batch_jobs``. Each is put in shard 0 of its batch. Run once
+        after deploying the index; it is safe to run again.
+
+        Returns:
+            Number of jobs updated
+        """
+        updated = 0
+        scan_kwargs: dict[str, Any] = {
+            "FilterExpression": Attr("batch_id").exists() & Attr("batch_shard").not_exists(),
+            "ProjectionExpression": "job_id, batch_id",
+        }
+        while True:
+            response = self.table.scan(**scan_kwargs)
+            for item in response.get("Items", []):
+                try:
+                    self.table.update_item(
+                        Key={"job_id": item["job_id"]},
+                        UpdateExpression="SET batch_shard = :shard, batch_shards = :count",
+                        ConditionExpression=Attr("batch_shard").not_exists(),
+                        ExpressionAttributeValues={
+                            ":shard": f"{item['batch_id']}#0",
+                            ":count": 1,
+                        },
+                    )
+                except ClientError as e:
+                    if e.response.get("Error", {}).get("Code") != "ConditionalCheckFailedException":
+                        raise
+                    continue
+                updated += 1
+
+            if "LastEvaluatedKey" not in response:
+                break
+            scan_kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+
+        logger.info("Job batch_shard backfill finished", extra={"updated": updated})
+        return updated
+
+    def backfill_pending_status(self) -> int:
+        """Index pending jobs written before the pending-index existed.
+
+        SUBMITTED and RUNNING jobs without ``pending_status`` are missing from
+        ``get_pending_jobs``, so the poller never picks them up. Deploy the
+        index and the code that writes ``pending_status`` first, then run this
+        once; jobs that reach a pending status in between are written with the
+        attribute already. It is safe to run again.
+
+        Returns:
+            Number of jobs updated
+        """
+        updated = 0
+        pending_values = [status.value for status in _PENDING_STATUSES]
+        scan_kwargs: dict[str, Any] = {
+            "FilterExpression": Attr("status").is_in(pending_values)
+            & Attr("pending_status").not_exists(),
+            "ProjectionExpression": "job_id, #status",
+            "ExpressionAttributeNames": {"#status": "status"},
+        }
+        while True:
+            response = self.table.scan(**scan_kwargs)
+            for item in response.get("Items", []):
+                try:
+                    # The status condition skips jobs that finished since the scan
+                    self.table.update_item(
+                        Key={"job_id": item["job_id"]},
+                        UpdateExpression="SET pending_status = :status",
+                        ConditionExpression=Attr("status").eq(item["status"])
+                        & Attr("pending_status").not_exists(),
+                        ExpressionAttributeValues={":status": item["status"]},
+                    )
+                except ClientError as e:
+                    if e.response.get("Error", {}).get("Code") != "ConditionalCheckFailedException":
+                        raise
+                    continue
+                updated += 1
+
+            if "LastEvaluatedKey" not in response:
+                break
+            scan_kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+
+        logger.info("Job pending_status backfill finished", extra={"updated": updated})
+        return updated
+
     def _find_by_idempotency_key(self, tenant_id: str, idempotency_key: str) -> Job | None:
         """Find a job by idempotency key.
 
@@ -352,56 +746,116 @@ class JobService:
     def get_pending_jobs(self, limit: int = 100) -> list[Job]:
         """Get jobs that need status updates (submitted but not complete).
 
+        Queries the sparse pending-index once per pending status, in
+        parallel, so only pending jobs are read. Jobs that were pending before
+        the index was deployed appear once ``backfill_pending_status`` has run.
+
         Args:
             limit: Maximum number of jobs to return
 
         Returns:
-            List of pending jobs
+            List of pending jobs, least recently updated first
         """
-        try:
-            response = self.table.scan(
-                FilterExpression=Attr("status").is_in(["SUBMITTED", "RUNNING"]),
+
+        def query_status(status: JobStatus) -> list[dict[str, Any]]:
+            response = self.table.query(
+                IndexName="pending-index",
+                KeyConditionExpression=Key("pending_status").eq(status.value),
                 Limit=limit,
             )
+            return response.get("Items", [])
 
-            return [Job.from_dynamo_item(item) for item in response.get("Items", [])]
+        try:
+            with ThreadPoolExecutor(max_workers=len(_PENDING_STATUSES)) as executor:
+                items = [
+                    item
+                    for status_items in executor.map(query_status, _PENDING_STATUSES)
+                    for item in status_items
+                ]
+
+            items.sort(key=lambda item: item["updated_at"])
+            return [Job.from_dynamo_item(item) for item in items[:limit]]
 
         except ClientError as e:
             logger.error("Failed to get pending jobs", extra={"error": str(e)})
             raise
 
+    @overload
+    def update_job_submitted(
+        self, job_id: str, statement_id: str, *, echo: Literal[True]
+    ) -> Job: ...
+
+    @overload
+    def update_job_submitted(
+        self, job_id: str, statement_id: str, *, echo: Literal[False] = False
+    ) -> None: ...
+
     @tracer.capture_method
-    def update_job_submitted(self, job_id: str, statement_id: str) -> Job:
+    def update_job_submitted(
+        self, job_id: str, statement_id: str, *, echo: bool = False
+    ) -> Job | None:
         """Update job with Redshift statement ID.
 
         Args:
             job_id: Job identifier
             statement_id: Redshift Data API statement ID
+            echo: Return the updated job
 
         Returns:
-            Updated Job instance
+            Updated Job instance if ``echo`` is set, otherwise None
         """
         return self.update_job_status(
             job_id=job_id,
             status=JobStatus.SUBMITTED,
             statement_id=statement_id,
+            echo=echo,
         )
 
+    @overload
+    def update_job_running(self, job_id: str, *, echo: Literal[True]) -> Job: ...
+
+    @overload
+    def update_job_running(self, job_id: str, *, echo: Literal[False] = False) -> None: ...
+
     @tracer.capture_method
-    def update_job_running(self, job_id: str) -> Job:
+    def update_job_running(self, job_id: str, *, echo: bool = False) -> Job | None:
         """Mark job as running.
 
         Args:
             job_id: Job identifier
+            echo: Return the updated job
 
         Returns:
-            Updated Job instance
+            Updated Job instance if ``echo`` is set, otherwise None
         """
         return self.update_job_status(
             job_id=job_id,
             status=JobStatus.RUNNING,
+            echo=echo,
         )
 
+    @overload
+    def update_job_completed(
+        self,
+        job_id: str,
+        row_count: int = 0,
+        size_bytes: int = 0,
+        location: str | None = None,
+        *,
+        echo: Literal[True],
+    ) -> Job: ...
+
+    @overload
+    def update_job_completed(
+        self,
+        job_id: str,
+        row_count: int = 0,
+        size_bytes: int = 0,
+        location: str | None = None,
+        *,
+        echo: Literal[False] = False,
+    ) -> None: ...
+
     @tracer.capture_method
     def update_job_completed(
         self,
@@ -409,7 +863,9 @@ class JobService:
         row_count: int = 0,
         size_bytes: int = 0,
         location: str | None = None,
-    ) -> Job:
+        *,
+        echo: bool = False,
+    ) -> Job | None:
         """Mark job as completed with result info.
 
         Args:
@@ -417,9 +873,10 @@ class JobService:
             row_count: Number of result rows
             size_bytes: Result size in bytes
             location: Result location (S3 URI or 'inline')
+            echo: Return the updated job
 
         Returns:
-            Updated Job instance
+            Updated Job instance if ``echo`` is set, otherwise None
         """
         return self.update_job_status(
             job_id=job_id,
@@ -429,24 +886,48 @@ class JobService:
                 size_bytes=size_bytes,
                 location=location or "inline",
             ),
+            echo=echo,
         )
 
+    @overload
+    def update_job_failed(
+        self,
+        job_id: str,
+        error_code: str,
+        error_message: str,
+        *,
+        echo: Literal[True],
+    ) -> Job: ...
+
+    @overload
+    def update_job_failed(
+        self,
+        job_id: str,
+        error_code: str,
+        error_message: str,
+        *,
+        echo: Literal[False] = False,
+    ) -> None: ...
+
     @tracer.capture_method
     def update_job_failed(
         self,
         job_id: str,
         error_code: str,
         error_message: str,
-    ) -> Job:
+        *,
+        echo: bool = False,
+    ) -> Job | None:
         """Mark job as failed with error info.
 
         Args:
             job_id: Job identifier
             error_code: Error code
             error_message: Error message
+            echo: Return the updated job
 
         Returns:
-            Updated Job instance
+            Updated Job instance if ``echo`` is set, otherwise None
         """
         return self.update_job_status(
             job_id=job_id,
@@ -455,8 +936,31 @@ class JobService:
                 code=error_code,
                 message=error_message,
             ),
+            echo=echo,
         )
 
+    @overload
+    def update_job_result_location(
+        self,
+        job_id: str,
+        location: str,
+        format: str = "json",
+        download_url: str | None = None,
+        *,
+        echo: Literal[True],
+    ) -> Job: ...
+
+    @overload
+    def update_job_result_location(
+        self,
+        job_id: str,
+        location: str,
+        format: str = "json",
+        download_url: str | None = None,
+        *,
+        echo: Literal[False] = False,
+    ) -> None: ...
+
     @tracer.capture_method
     def update_job_result_location(
         self,
@@ -464,7 +968,9 @@ class JobService:
         location: str,
         format: str = "json",
         download_url: str | None = None,
-    ) -> Job:
+        *,
+        echo: bool = False,
+    ) -> Job | None:
         """Update job with result location in S3.
 
         Args:
@@ -472,9 +978,10 @@ class JobService:
             location: S3 URI of the results
             format: Result format (json, csv, parquet)
             download_url: Presigned download URL
+            echo: Return the updated job
 
         Returns:
-            Updated Job instance
+            Updated Job instance if ``echo`` is set, otherwise None
         """
         return self.update_job_status(
             job_id=job_id,
@@ -485,4 +992,5 @@ class JobService:
                 format=format,
                 download_url=download_url,
             ),
+            echo=echo,
         )
@@ -8,19 +8,95 @@ Optimized with:
 
 import csv
 import io
+import logging
+import random
+import re
+import sys
 import time
-from typing import Any, cast
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, cast
 
-import boto3
 from aws_lambda_powertools import Logger, Tracer
 from botocore.exceptions import ClientError
 
 from spectra.services.session import SessionService
+from spectra.utils.aws import get_client
 from spectra.utils.config import get_settings
 
+if TYPE_CHECKING:
+    import pyarrow as pa
+
 logger = Logger()
 tracer = Tracer()
 
+# Parallel Data API calls when several statements are submitted or checked at once
+_DATA_API_MAX_WORKERS = 16
+
+# Seconds between DescribeStatement polls: 50ms steps for the first half
+# second catch short queries early, then the interval backs off to a 5s cap
+_POLL_SCHEDULE_SECONDS = (0.05,) * 10 + (0.1, 0.2, 0.4, 0.8, 1.5, 3.0, 5.0)
+
+# Each poll sleeps within +/-20% of its scheduled interval so waiters that
+# started together do not poll in lockstep
+_POLL_JITTER = 0.2
+
+# ExecuteStatement error messages about the session (e.g. "Session ... is not
+# valid", "session is busy"), whatever their case. The word must start with
+# "session", so names merely containing it (e.g. "MySession") do not count.
+_SESSION_ERROR = re.compile(r"\bsession", re.IGNORECASE)
+
+# Splits a FormattedRecords payload into lines that keep their "\n", so quoted
+# values spanning lines still parse. Unlike str.splitlines, only "\n" ends a
+# line, and unlike io.StringIO, no wide-character copy of the payload is made.
+_CSV_LINE = re.compile(r"[^\n]*\n|[^\n]+")
+
+# CSV pages larger than this are parsed by pyarrow's C reader. Smaller pages,
+# typical of inline results, use the csv module and avoid importing pyarrow.
+_ARROW_PARSE_MIN_CHARS = 256 * 1024
+
+# Once pyarrow is loaded anyway, its reader overtakes the csv module from
+# pages of roughly this size, so smaller pages switch to it as well
+_ARROW_PARSE_MIN_CHARS_LOADED = 32 * 1024
+
+# Redshift integer types that Arrow result tables parse natively as int64
+_ARROW_INT_TYPES = frozenset({"int2", "int4", "int8"})
+
+# Whether GetStatementResultV2 (CSV results) works against a (region, cluster
+# or workgroup). Recorded on the first ValidationException so later reads go
+# straight to the typed API instead of failing a CSV request every time.
+_CSV_RESULTS_SUPPORTED: dict[tuple[str, str], bool] = {}
+
+# Field member that carries values of a Redshift type in typed results
+_TYPED_VALUE_KEYS: dict[str, str] = {
+    "int2": "longValue",
+    "int4": "longValue",
+    "int8": "longValue",
+    "float4": "doubleValue",
+    "float8": "doubleValue",
+    "bool": "booleanValue",
+    "varchar": "stringValue",
+    "bpchar": "stringValue",
+    "numeric": "stringValue",
+    "date": "stringValue",
+    "timestamp": "stringValue",
+    "timestamptz": "stringValue",
+}
+
+# Statement statuses that never change again, so their descriptions can be reused
+_TERMINAL_STATUSES = frozenset({"FINISHED", "FAILED", "ABORTED"})
+
+# Redshift Data API statement status to job status; unknown statuses are RUNNING
+_STATUS_MAPPING: dict[str, str] = {
+    "SUBMITTED": "SUBMITTED",
+    "PICKED": "RUNNING",
+    "STARTED": "RUNNING",
+    "FINISHED": "COMPLETED",
+    "FAILED": "FAILED",
+    "ABORTED": "CANCELLED",
+}
+
 
 class RedshiftError(Exception):
     """Base exception for Redshift operations."""
@@ -57,6 +133,229 @@ class SessionCreationError(RedshiftError):
     pass
 
 
+def _csv_to_arrow(
+    column_names: list[str],
+    formatted_records: str,
+    *,
+    type_names: list[str] | None = None,
+) -> "pa.Table":
+    """Parse a FormattedRecords CSV page into a pyarrow Table.
+
+    Rows whose field count does not match the columns are skipped, and empty
+    values become nulls, mirroring _parse_csv_result. Columns are strings
+    unless ``type_names`` marks them as Redshift integers, in which case
+    they are parsed to int64 by the C reader instead of boxed per cell.
+
+    Args:
+        column_names: Column names from the result metadata
+        formatted_records: CSV payload from get_statement_result_v2
+        type_names: Optional Redshift type name of each column
+
+    Returns:
+        pyarrow Table with one column per result column
+    """
+    # Imported on first use: most pages never need pyarrow, and loading it
+    # would add to every cold start (see _ARROW_PARSE_MIN_CHARS)
+    import pyarrow as pa  # noqa: PLC0415
+    import pyarrow.csv as pa_csv  # noqa: PLC0415
+
+    column_types = {
+        name: pa.int64() if type_name in _ARROW_INT_TYPES else pa.string()
+        for name, type_name in zip(
+            column_names, type_names or [""] * len(column_names), strict=True
+        )
+    }
+    if not formatted_records:
+        return pa.schema(column_types).empty_table()
+
+    return pa_csv.read_csv(
+        io.BytesIO(formatted_records.encode("utf-8")),
+        read_options=pa_csv.ReadOptions(column_names=column_names),
+        parse_options=pa_csv.ParseOptions(
+            newlines_in_values=True,
+            invalid_row_handler=lambda _row: "skip",
+        ),
+        convert_options=pa_csv.ConvertOptions(
+            column_types=column_types,
+            null_values=[""],
+            strings_can_be_null=True,
+        ),
+    )
+
+
+def _parse_column_metadata(column_metadata: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Convert Data API ColumnMetadata into the service's column descriptions.
+
+    Args:
+        column_metadata: ``ColumnMetadata`` from a result page
+
+    Returns:
+        Columns with 'name', 'type' and 'label'
+    """
+    columns = []
+    for i, col in enumerate(column_metadata):
+        # The label defaults to the name, so look the name up only once
+        name = col.get("name", f"col_{i}")
+        columns.append(
+            {"name": name, "type": col.get("typeName", "unknown"), "label": col.get("label", name)}
+        )
+    return columns
+
+
+def _escape_sql_literal(value: str) -> str:
+    """Escape a value for use inside a single-quoted SQL string literal.
+
+    str.replace is used rather than a str.translate table: it runs as one C
+    search-and-copy and measured far faster for single-character escaping.
+
+    Args:
+        value: Raw value, such as a query to wrap in UNLOAD
+
+    Returns:
+        The value with each single quote doubled
+    """
+    return value.replace("'", "''")
+
+
+@lru_cache(maxsize=32)
+def _unload_options(
+    file_format: str, partition_by: tuple[str, ...], max_file_size_mb: int | None
+) -> str:
+    """Build the option clauses of an UNLOAD statement.
+
+    Exports reuse a handful of option combinations, so the rendered string
+    is cached.
+
+    Args:
+        file_format: Output format (PARQUET, CSV, JSON)
+        partition_by: Partition columns, empty for none
+        max_file_size_mb: Optional cap on the size of each written file
+
+    Returns:
+        Newline-separated UNLOAD options
+    """
+    unload_options = [
+        f"FORMAT {file_format}",
+        "PARALLEL ON",
+        "ALLOWOVERWRITE",
+    ]
+
+    if partition_by:
+        partition_cols = ", ".join(partition_by)
+        unload_options.append(f"PARTITION BY ({partition_cols})")
+
+    if max_file_size_mb:
+        unload_options.append(f"MAXFILESIZE {max_file_size_mb} MB")
+
+    return "\n".join(unload_options)
+
+
+def _poll_intervals(initial_seconds: float | None) -> Iterator[float]:
+    """Yield the un-jittered sleep before each DescribeStatement poll.
+
+    Args:
+        initial_seconds: First interval, growing 1.5x per poll up to the 5s
+            cap; None follows _POLL_SCHEDULE_SECONDS instead
+
+    Yields:
+        Interval in seconds, repeating the last one once the cap is reached
+    """
+    if initial_seconds is None:
+        yield from _POLL_SCHEDULE_SECONDS
+        interval = _POLL_SCHEDULE_SECONDS[-1]
+    else:
+        interval = initial_seconds
+        while interval < _POLL_SCHEDULE_SECONDS[-1]:
+            yield interval
+            interval *= 1.5
+        interval = _POLL_SCHEDULE_SECONDS[-1]
+    while True:
+        yield interval
+
+
+def _raise_if_unsuccessful(statement_id: str, description: dict[str, Any]) -> None:
+    """Raise if a described statement failed or was cancelled.
+
+    Args:
+        statement_id: The statement ID
+        description: Result of describe_statement for it
+
+    Raises:
+        QueryExecutionError: If the statement is FAILED or ABORTED
+    """
+    status = description["status"]
+
+    if status == "FAILED":
+        error_msg = description.get("error", "Unknown error")
+        logger.error(
+            "Statement failed",
+            extra={"statement_id": statement_id, "error": error_msg},
+        )
+        raise QueryExecutionError(
+            message=f"Query failed: {error_msg}",
+            code="QUERY_FAILED",
+            details={"statement_id": statement_id, "error": error_msg},
+        )
+
+    if status == "ABORTED":
+        logger.warning("Statement was aborted", extra={"statement_id": statement_id})
+        raise QueryExecutionError(
+            message="Query was cancelled",
+            code="QUERY_CANCELLED",
+            details={"statement_id": statement_id},
+        )
+
+
+def _max_page_rows(response: dict[str, Any], is_csv: bool) -> int:
+    """Upper bound on the number of records a raw result page holds.
+
+    Typed pages are counted exactly. For CSV pages every record ends a line,
+    so the line count bounds it without parsing (quoted newlines only make
+    the bound looser).
+
+    Args:
+        response: Raw get_statement_result(_v2) response
+        is_csv: Whether the response carries FormattedRecords
+
+    Returns:
+        Maximum number of records in the page
+    """
+    if is_csv:
+        return response.get("FormattedRecords", "").count("\n") + 1
+    return len(response.get("Records", []))
+
+
+def _typed_rows_to_columns(rows: list[list[dict[str, Any]]], width: int) -> list[list[Any]]:
+    """Unwrap typed Data API records into one value list per column.
+
+    Values are appended straight to their column, so no per-row dict is
+    built. Cells beyond ``width`` are ignored.
+
+    Args:
+        rows: ``Records`` from a get_statement_result page
+        width: Number of columns in the result metadata
+
+    Returns:
+        Column value lists, in column order
+    """
+    columns: list[list[Any]] = [[] for _ in range(width)]
+    for row in rows:
+        for values, cell in zip(columns, row, strict=False):
+            if "stringValue" in cell:
+                values.append(cell["stringValue"])
+            elif "longValue" in cell:
+                values.append(cell["longValue"])
+            elif "doubleValue" in cell:
+                values.append(cell["doubleValue"])
+            elif "booleanValue" in cell:
+                values.append(cell["booleanValue"])
+            elif "blobValue" in cell:
+                values.append(cell["blobValue"])
+            else:
+                values.append(None)
+    return columns
+
+
 class RedshiftService:
     """Service for interacting with Redshift via Data API.
 
@@ -69,8 +368,24 @@ class RedshiftService:
     def __init__(self) -> None:
         """Initialize Redshift service."""
         self.settings = get_settings()
-        self.client = boto3.client("redshift-data", region_name=self.settings.aws_region)
+        self.client = get_client("redshift-data", self.settings.aws_region)
         self.session_service = SessionService()
+        self._results_target = (
+            self.settings.aws_region,
+            self.settings.redshift_workgroup_name or self.settings.redshift_cluster_id,
+        )
+
+        # Database and cluster or serverless workgroup, the same for every
+        # statement this service submits
+        self._target_params: dict[str, Any] = {"Database": self.settings.redshift_database}
+        if self.settings.is_serverless:
+            self._target_params["WorkgroupName"] = self.settings.redshift_workgroup_name
+        else:
+            self._target_params["ClusterIdentifier"] = self.settings.redshift_cluster_id
+            self._target_params["SecretArn"] = self.settings.redshift_secret_arn
+
+        # Descriptions of statements seen in a terminal state, by statement ID
+        self._terminal_descriptions: dict[str, dict[str, Any]] = {}
 
     @tracer.capture_method
     def execute_statement(
@@ -100,136 +415,169 @@ class RedshiftService:
         Raises:
             QueryExecutionError: If submission fails
         """
-        logger.info(
-            "Submitting statement to Redshift",
-            extra={
-                "db_user": db_user,
-                "tenant_id": tenant_id,
-                "statement_name": statement_name,
-                "use_session": use_session,
-                "sql_preview": sql[:100] + "..." if len(sql) > 100 else sql,
-            },
-        )
+        # The SQL preview is only built when INFO records are emitted
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Submitting statement to Redshift",
+                extra={
+                    "db_user": db_user,
+                    "tenant_id": tenant_id,
+                    "statement_name": statement_name,
+                    "use_session": use_session,
+                    "sql_preview": sql[:100] + ("..." if len(sql) > 100 else ""),
+                },
+            )
 
-        try:
-            # Build request parameters
-            request_params: dict[str, Any] = {
-                "Database": self.settings.redshift_database,
-                "Sql": sql,
-                "WithEvent": with_event,
-            }
+        # Build request parameters on top of the fixed database target; set
+        # the database user for RLS
+        request_params: dict[str, Any] = {
+            **self._target_params,
+            "Sql": sql,
+            "WithEvent": with_event,
+            "DbUser": db_user,
+        }
 
-            # Use either cluster or serverless workgroup
-            if self.settings.is_serverless:
-                request_params["WorkgroupName"] = self.settings.redshift_workgroup_name
+        if statement_name:
+            request_params["StatementName"] = statement_name
+
+        if parameters:
+            request_params["Parameters"] = parameters
+
+        # Session Reuse optimization
+        session_enabled = bool(use_session and tenant_id)
+        if session_enabled:
+            session_id, _is_new = self.session_service.get_or_create_session_id(
+                tenant_id=cast(str, tenant_id),
+                db_user=db_user,
+            )
+
+            if session_id:
+                # Reuse existing session
+                request_params["SessionId"] = session_id
+                logger.info(
+                    "Reusing existing session",
+                    extra={"session_id": session_id, "tenant_id": tenant_id},
+                )
             else:
-                request_params["ClusterIdentifier"] = self.settings.redshift_cluster_id
-                request_params["SecretArn"] = self.settings.redshift_secret_arn
+                # Request new session with keep-alive
+                keep_alive_seconds = self.settings.redshift_session_keep_alive_seconds
+                request_params["SessionKeepAliveSeconds"] = keep_alive_seconds
+                logger.info(
+                    "Creating new session",
+                    extra={"keep_alive_seconds": keep_alive_seconds, "tenant_id": tenant_id},
+                )
 
-            # Set the database user for RLS
-            request_params["DbUser"] = db_user
+        # A session error is retried once, without a session, in this loop
+        while True:
+            try:
+                response = self.client.execute_statement(**request_params)
+                break
+            except ClientError as e:
+                error_code = e.response.get("Error", {}).get("Code", "Unknown")
+                error_message = e.response.get("Error", {}).get("Message", str(e))
+
+                # Handle session-related errors
+                if session_enabled and _SESSION_ERROR.search(error_message):
+                    logger.warning(
+                        "Session error, invalidating and retrying",
+                        extra={"error_code": error_code, "error_message": error_message},
+                    )
+                    # Invalidate the bad session and retry without session
+                    failed_session_id = request_params.pop("SessionId", None)
+                    request_params.pop("SessionKeepAliveSeconds", None)
+                    if failed_session_id:
+                        self.session_service.invalidate_session(failed_session_id)
+                    session_enabled = False
+                    continue
 
-            if statement_name:
-                request_params["StatementName"] = statement_name
+                logger.error(
+                    "Failed to submit statement",
+                    extra={"error_code": error_code, "error_message": error_message},
+                )
+                raise QueryExecutionError(
+                    message=f"Failed to submit query: {error_message}",
+                    code=error_code,
+                    details={"original_error": str(e)},
+                )
 
-            if parameters:
-                request_params["Parameters"] = parameters
+        statement_id = response["Id"]
 
-            # Session Reuse optimization
-            if use_session and tenant_id:
-                session_id, _is_new = self.session_service.get_or_create_session_id(
-                    tenant_id=tenant_id,
+        # If a new session was created, store it in DynamoDB
+        if session_enabled and "SessionId" in response:
+            new_session_id = response["SessionId"]
+            if new_session_id != request_params.get("SessionId"):
+                self.session_service.create_session(
+                    session_id=new_session_id,
+                    tenant_id=cast(str, tenant_id),
                     db_user=db_user,
                 )
+                logger.info(
+                    "New session created and stored",
+                    extra={"session_id": new_session_id, "tenant_id": tenant_id},
+                )
 
-                if session_id:
-                    # Reuse existing session
-                    request_params["SessionId"] = session_id
-                    logger.info(
-                        "Reusing existing session",
-                        extra={"session_id": session_id, "tenant_id": tenant_id},
-                    )
-                else:
-                    # Request new session with keep-alive
-                    request_params["SessionKeepAliveSeconds"] = (
-                        self.settings.redshift_session_keep_alive_seconds
-                    )
-                    logger.info(
-                        "Creating new session",
-                        extra={
-                            "keep_alive_seconds": self.settings.redshift_session_keep_alive_seconds,
-                            "tenant_id": tenant_id,
-                        },
-                    )
+        logger.info(
+            "Statement submitted successfully",
+            extra={
+                "statement_id": statement_id,
+                "session_id": response.get("SessionId"),
+            },
+        )
 
-            response = self.client.execute_statement(**request_params)
-            statement_id = response["Id"]
-
-            # If a new session was created, store it in DynamoDB
-            if use_session and tenant_id and "SessionId" in response:
-                new_session_id = response["SessionId"]
-                if new_session_id != request_params.get("SessionId"):
-                    self.session_service.create_session(
-                        session_id=new_session_id,
-                        tenant_id=tenant_id,
-                        db_user=db_user,
-                    )
-                    logger.info(
-                        "New session created and stored",
-                        extra={"session_id": new_session_id, "tenant_id": tenant_id},
-                    )
+        return statement_id
 
-            logger.info(
-                "Statement submitted successfully",
-                extra={
-                    "statement_id": statement_id,
-                    "session_id": response.get("SessionId"),
-                },
-            )
+    @tracer.capture_method
+    def execute_statements(
+        self,
+        sqls: list[str],
+        db_user: str,
+        *,
+        tenant_id: str | None = None,
+        with_event: bool = False,
+    ) -> list[str]:
+        """Submit several SQL statements concurrently.
 
-            return statement_id
+        ExecuteStatement calls are issued in parallel on the shared client,
+        so submitting N statements takes roughly one round trip. Session
+        reuse is not used: a Data API session runs one statement at a time,
+        so sharing it would serialize the statements again.
 
-        except ClientError as e:
-            error_code = e.response.get("Error", {}).get("Code", "Unknown")
-            error_message = e.response.get("Error", {}).get("Message", str(e))
+        Args:
+            sqls: SQL statements to execute
+            db_user: Database user for RLS context
+            tenant_id: Tenant identifier, for logging
+            with_event: Send EventBridge event on completion
 
-            # Handle session-related errors
-            if "Session" in error_message and tenant_id:
-                logger.warning(
-                    "Session error, invalidating and retrying",
-                    extra={"error_code": error_code, "error_message": error_message},
-                )
-                # Invalidate the bad session and retry without session
-                existing_session, _ = self.session_service.get_or_create_session_id(
-                    tenant_id, db_user
-                )
-                if existing_session:
-                    self.session_service.invalidate_session(existing_session)
-                # Retry without session
-                return self.execute_statement(
-                    sql=sql,
-                    db_user=db_user,
-                    tenant_id=tenant_id,
-                    statement_name=statement_name,
-                    parameters=parameters,
-                    with_event=with_event,
-                    use_session=False,  # Disable session for retry
-                )
+        Returns:
+            Statement IDs, in the order of ``sqls``
 
-            logger.error(
-                "Failed to submit statement",
-                extra={"error_code": error_code, "error_message": error_message},
-            )
-            raise QueryExecutionError(
-                message=f"Failed to submit query: {error_message}",
-                code=error_code,
-                details={"original_error": str(e)},
+        Raises:
+            QueryExecutionError: If a statement cannot be submitted
+        """
+        if not sqls:
+            return []
+
+        def submit(sql: str) -> str:
+            return self.execute_statement(
+                sql=sql,
+                db_user=db_user,
+                tenant_id=tenant_id,
+                with_event=with_event,
+                use_session=False,
             )
 
+        workers = min(_DATA_API_MAX_WORKERS, len(sqls))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(submit, sqls))
+
     @tracer.capture_method
     def describe_statement(self, statement_id: str) -> dict[str, Any]:
         """Get the status and metadata of a statement.
 
+        Once a statement is seen FINISHED, FAILED or ABORTED its description
+        can no longer change, so later calls on this service reuse it instead
+        of calling DescribeStatement again (e.g. after wait_for_statement).
+
         Args:
             statement_id: The statement ID to describe
 
@@ -240,9 +588,13 @@ class RedshiftService:
             StatementNotFoundError: If statement ID not found
             RedshiftError: If describe fails
         """
+        cached = self._terminal_descriptions.get(statement_id)
+        if cached is not None:
+            return dict(cached)
+
         try:
             response = self.client.describe_statement(Id=statement_id)
-            return {
+            description = {
                 "id": response["Id"],
                 "status": response["Status"],
                 "has_result_set": response.get("HasResultSet", False),
@@ -268,21 +620,65 @@ class RedshiftService:
                 code=error_code,
             )
 
+        if description["status"] in _TERMINAL_STATUSES:
+            self._terminal_descriptions[statement_id] = dict(description)
+        return description
+
+    @tracer.capture_method
+    def describe_statements(self, statement_ids: list[str]) -> dict[str, dict[str, Any]]:
+        """Describe several statements concurrently.
+
+        DescribeStatement only takes a single ID, so the calls are issued in
+        parallel on the shared client and the total wait is roughly one
+        round trip rather than one per statement.
+
+        Args:
+            statement_ids: Statement IDs to describe
+
+        Returns:
+            Descriptions keyed by statement ID. Statements that no longer
+            exist are left out.
+
+        Raises:
+            RedshiftError: If a describe call fails for another reason
+        """
+        unique_ids = list(dict.fromkeys(statement_ids))
+        if not unique_ids:
+            return {}
+
+        def describe(statement_id: str) -> dict[str, Any] | None:
+            try:
+                return self.describe_statement(statement_id)
+            except StatementNotFoundError:
+                logger.warning("Statement not found", extra={"statement_id": statement_id})
+                return None
+
+        workers = min(_DATA_API_MAX_WORKERS, len(unique_ids))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            descriptions = executor.map(describe, unique_ids)
+            return {
+                statement_id: description
+                for statement_id, description in zip(unique_ids, descriptions, strict=True)
+                if description is not None
+            }
+
     @tracer.capture_method
     def wait_for_statement(
         self,
         statement_id: str,
         timeout_seconds: int = 300,
-        poll_interval_seconds: float = 0.5,
+        poll_interval_seconds: float | None = None,
     ) -> dict[str, Any]:
         """Wait for a statement to complete with polling.
 
-        Implements exponential backoff for efficient polling.
+        Polls every 50ms for the first half second, then backs off to a 5s
+        cap. Every interval is jittered so concurrent waiters spread out.
 
         Args:
             statement_id: The statement ID to wait for
             timeout_seconds: Maximum time to wait (default 300s / 5 minutes)
-            poll_interval_seconds: Initial poll interval (will increase with backoff)
+            poll_interval_seconds: Initial poll interval, growing 1.5x per poll;
+                None (default) uses the two-phase schedule
 
         Returns:
             Final statement description
@@ -293,8 +689,7 @@ class RedshiftService:
             StatementNotFoundError: If statement ID not found
         """
         start_time = time.time()
-        current_interval = poll_interval_seconds
-        max_interval = 5.0  # Cap backoff at 5 seconds
+        intervals = _poll_intervals(poll_interval_seconds)
 
         logger.info(
             "Waiting for statement completion",
@@ -329,29 +724,71 @@ class RedshiftService:
                 )
                 return description
 
-            if status == "FAILED":
-                error_msg = description.get("error", "Unknown error")
-                logger.error(
-                    "Statement failed",
-                    extra={"statement_id": statement_id, "error": error_msg},
+            _raise_if_unsuccessful(statement_id, description)
+
+            # Still running, wait and retry on the next interval
+            time.sleep(next(intervals) * random.uniform(1 - _POLL_JITTER, 1 + _POLL_JITTER))
+
+    @tracer.capture_method
+    def wait_for_statements(
+        self,
+        statement_ids: list[str],
+        timeout_seconds: int = 300,
+    ) -> dict[str, dict[str, Any]]:
+        """Wait for several statements to complete, polling them together.
+
+        Each poll describes all unfinished statements concurrently, on the
+        same schedule as wait_for_statement, so the total wait follows the
+        slowest statement rather than the sum of all of them.
+
+        Args:
+            statement_ids: Statement IDs to wait for
+            timeout_seconds: Maximum time to wait for all of them
+
+        Returns:
+            Final statement descriptions keyed by statement ID
+
+        Raises:
+            QueryTimeoutError: If a statement doesn't complete within timeout
+            QueryExecutionError: If a statement fails or is cancelled
+            StatementNotFoundError: If a statement ID not found
+        """
+        start_time = time.time()
+        intervals = _poll_intervals(None)
+        pending = list(dict.fromkeys(statement_ids))
+        finished: dict[str, dict[str, Any]] = {}
+
+        while pending:
+            elapsed = time.time() - start_time
+
+            if elapsed >= timeout_seconds:
+                logger.warning(
+                    "Statements timed out",
+                    extra={"statement_ids": pending, "elapsed_seconds": elapsed},
                 )
-                raise QueryExecutionError(
-                    message=f"Query failed: {error_msg}",
-                    code="QUERY_FAILED",
-                    details={"statement_id": statement_id, "error": error_msg},
+                raise QueryTimeoutError(
+                    message=f"Query exceeded timeout of {timeout_seconds} seconds",
+                    code="QUERY_TIMEOUT",
+                    details={"statement_ids": pending, "timeout_seconds": timeout_seconds},
                 )
 
-            if status == "ABORTED":
-                logger.warning("Statement was aborted", extra={"statement_id": statement_id})
-                raise QueryExecutionError(
-                    message="Query was cancelled",
-                    code="QUERY_CANCELLED",
-                    details={"statement_id": statement_id},
-                )
+            descriptions = self.describe_statements(pending)
+            for statement_id in pending:
+                description = descriptions.get(statement_id)
+                if description is None:
+                    raise StatementNotFoundError(
+                        message=f"Statement {statement_id} not found",
+                        code="ResourceNotFoundException",
+                    )
+                _raise_if_unsuccessful(statement_id, description)
+                if description["status"] == "FINISHED":
+                    finished[statement_id] = description
+
+            pending = [statement_id for statement_id in pending if statement_id not in finished]
+            if pending:
+                time.sleep(next(intervals) * random.uniform(1 - _POLL_JITTER, 1 + _POLL_JITTER))
 
-            # Still running, wait and retry with exponential backoff
-            time.sleep(current_interval)
-            current_interval = min(current_interval * 1.5, max_interval)
+        return {statement_id: finished[statement_id] for statement_id in statement_ids}
 
     @tracer.capture_method
     def get_statement_result(
@@ -359,6 +796,8 @@ class RedshiftService:
         statement_id: str,
         next_token: str | None = None,
         use_csv_format: bool = True,
+        *,
+        columns: list[dict[str, Any]] | None = None,
     ) -> dict[str, Any]:
         """Get the results of a completed statement.
 
@@ -369,7 +808,10 @@ class RedshiftService:
         Args:
             statement_id: The statement ID
             next_token: Pagination token
-            use_csv_format: Use CSV format for faster response (default True)
+            use_csv_format: Use CSV format for faster response (default True);
+                ignored once the cluster has rejected a CSV request
+            columns: Columns returned for an earlier page of the same
+                statement; when given, the page's ColumnMetadata is not re-parsed
 
         Returns:
             Result data with records and metadata
@@ -377,6 +819,33 @@ class RedshiftService:
         Raises:
             RedshiftError: If getting results fails
         """
+        response, is_csv = self._fetch_result_page(statement_id, next_token, use_csv_format)
+        if is_csv:
+            return self._parse_csv_result(response, columns)
+        return self._parse_typed_result(response, columns)
+
+    def _fetch_result_page(
+        self,
+        statement_id: str,
+        next_token: str | None,
+        use_csv_format: bool,
+    ) -> tuple[dict[str, Any], bool]:
+        """Fetch one raw result page, falling back to typed format if needed.
+
+        Args:
+            statement_id: The statement ID
+            next_token: Pagination token
+            use_csv_format: Request CSV format unless the cluster rejected it
+
+        Returns:
+            Tuple of (raw Data API response, whether it is in CSV format)
+
+        Raises:
+            RedshiftError: If getting results fails
+        """
+        if use_csv_format and not _CSV_RESULTS_SUPPORTED.get(self._results_target, True):
+            use_csv_format = False
+
         try:
             params: dict[str, Any] = {"Id": statement_id}
             if next_token:
@@ -388,10 +857,9 @@ class RedshiftService:
                     **params,
                     Format="CSV",
                 )
-                return self._parse_csv_result(cast(dict[str, Any], response))
             else:
                 response = self.client.get_statement_result(**params)
-                return self._parse_typed_result(cast(dict[str, Any], response))
+            return cast(dict[str, Any], response), use_csv_format
 
         except ClientError as e:
             error_code = e.response.get("Error", {}).get("Code", "Unknown")
@@ -402,46 +870,58 @@ class RedshiftService:
                     "CSV format not supported, falling back to typed format",
                     extra={"statement_id": statement_id},
                 )
-                return self.get_statement_result(
-                    statement_id=statement_id,
-                    next_token=next_token,
-                    use_csv_format=False,
-                )
+                _CSV_RESULTS_SUPPORTED[self._results_target] = False
+                return self._fetch_result_page(statement_id, next_token, use_csv_format=False)
 
             raise RedshiftError(
                 message=f"Failed to get statement result: {e}",
                 code=error_code,
             )
 
-    def _parse_csv_result(self, response: dict[str, Any]) -> dict[str, Any]:
+    def _parse_csv_result(
+        self, response: dict[str, Any], columns: list[dict[str, Any]] | None = None
+    ) -> dict[str, Any]:
         """Parse CSV format result from get_statement_result_v2.
 
+        Large pages are parsed column-wise by pyarrow and converted to row
+        dicts in one pass, which is faster than building each dict in
+        Python. The size cut-off is lower once pyarrow has been imported,
+        since its import cost no longer applies. Callers that can work on columns should use
+        ``get_all_statement_results_arrow`` and skip the row dicts entirely.
+
         Args:
             response: Raw response from Redshift Data API
+            columns: Columns already parsed from an earlier page, if any
 
         Returns:
             Parsed result with columns and records
         """
-        # Extract column metadata
-        columns = [
-            {
-                "name": col.get("name", f"col_{i}"),
-                "type": col.get("typeName", "unknown"),
-                "label": col.get("label", col.get("name", f"col_{i}")),
-            }
-            for i, col in enumerate(response.get("ColumnMetadata", []))
-        ]
+        # Column metadata is the same on every page, so paginating callers
+        # pass in the columns parsed from the first page
+        if columns is None:
+            columns = _parse_column_metadata(response.get("ColumnMetadata", []))
         column_names = [c["name"] for c in columns]
 
         # Parse CSV formatted records
         records = []
         formatted_records = response.get("FormattedRecords", "")
 
-        if formatted_records:
-            # Use CSV reader to handle proper escaping
-            csv_reader = csv.reader(io.StringIO(formatted_records))
+        page_chars = len(formatted_records)
+        if page_chars >= _ARROW_PARSE_MIN_CHARS or (
+            page_chars >= _ARROW_PARSE_MIN_CHARS_LOADED and "pyarrow.csv" in sys.modules
+        ):
+            records = _csv_to_arrow(column_names, formatted_records).to_pylist()
+        elif formatted_records:
+            # Without quotes nothing is escaped, so every "\n" ends a row and
+            # every "," ends a value and plain splitting matches csv.reader
+            # at a fraction of the cost. Otherwise use the CSV reader to
+            # handle proper escaping.
+            if '"' in formatted_records or "\r" in formatted_records:
+                rows: Iterable[list[str]] = csv.reader(_CSV_LINE.findall(formatted_records))
+            else:
+                rows = [line.split(",") for line in formatted_records.split("\n") if line]
 
-            for row in csv_reader:
+            for row in rows:
                 if len(row) == len(column_names):
                     record = {}
                     for i, value in enumerate(row):
@@ -458,33 +938,46 @@ class RedshiftService:
             "format": "CSV",
         }
 
-    def _parse_typed_result(self, response: dict[str, Any]) -> dict[str, Any]:
+    def _parse_typed_result(
+        self, response: dict[str, Any], columns: list[dict[str, Any]] | None = None
+    ) -> dict[str, Any]:
         """Parse typed format result from get_statement_result.
 
         Args:
             response: Raw response from Redshift Data API
+            columns: Columns already parsed from an earlier page, if any
 
         Returns:
             Parsed result with columns and records
         """
-        # Extract column metadata
-        columns = [
-            {
-                "name": col.get("name", f"col_{i}"),
-                "type": col.get("typeName", "unknown"),
-                "label": col.get("label", col.get("name", f"col_{i}")),
-            }
-            for i, col in enumerate(response.get("ColumnMetadata", []))
-        ]
+        # Column metadata is the same on every page, so paginating callers
+        # pass in the columns parsed from the first page
+        if columns is None:
+            columns = _parse_column_metadata(response.get("ColumnMetadata", []))
         column_names = [c["name"] for c in columns]
 
-        # Convert records to list of dicts
+        # Convert records to list of dicts. When every column has a type with
+        # a known Field member, each cell is read with a single lookup (isNull
+        # cells have no value key and become None). Otherwise the chain of
+        # membership tests is used: it measured faster than generic lookups
+        # over the tagged union (next() over a key tuple, or cell.items()).
+        value_keys = [_TYPED_VALUE_KEYS.get(c["type"], "") for c in columns]
+        known_types = bool(columns) and "" not in value_keys
+
         records = []
         for row in response.get("Records", []):
+            if len(row) > len(column_names):
+                column_names += [f"col_{i}" for i in range(len(column_names), len(row))]
+                # Cells beyond the metadata have no known type
+                known_types = False
             record = {}
-            for i, cell in enumerate(row):
-                col_name = column_names[i] if i < len(column_names) else f"col_{i}"
-                # Extract value from the typed field
+            if known_types:
+                for col_name, value_key, cell in zip(column_names, value_keys, row, strict=False):
+                    record[col_name] = cell.get(value_key)
+                records.append(record)
+                continue
+            for col_name, cell in zip(column_names, row, strict=False):
+                # Extract value from the typed field; isNull cells become None
                 if "stringValue" in cell:
                     record[col_name] = cell["stringValue"]
                 elif "longValue" in cell:
@@ -495,8 +988,6 @@ class RedshiftService:
                     record[col_name] = cell["booleanValue"]
                 elif "blobValue" in cell:
                     record[col_name] = cell["blobValue"]
-                elif cell.get("isNull"):
-                    record[col_name] = None
                 else:
                     record[col_name] = None
             records.append(record)
@@ -519,7 +1010,9 @@ class RedshiftService:
         """Get all results of a completed statement with automatic pagination.
 
         Handles pagination automatically by following NextToken until all
-        results are retrieved or max_rows is reached.
+        results are retrieved or max_rows is reached. Each page is parsed on
+        a worker thread while the next one is fetched, except when the page
+        could reach max_rows, so no page beyond the limit is requested.
 
         Args:
             statement_id: The statement ID
@@ -544,68 +1037,322 @@ class RedshiftService:
             extra={"statement_id": statement_id, "max_rows": max_rows},
         )
 
+        # One worker parses a page while the next page is being fetched
+        with ThreadPoolExecutor(max_workers=1) as parser:
+            pending: Future[dict[str, Any]] | None = None
+            while True:
+                page_count += 1
+                response, is_csv = self._fetch_result_page(statement_id, next_token, use_csv_format)
+                if pending is not None:
+                    all_records.extend(pending.result()["records"])
+                    pending = None
+
+                # Store columns from first page
+                if not columns:
+                    columns = _parse_column_metadata(response.get("ColumnMetadata", []))
+                total_rows = response.get("TotalNumRows") or total_rows
+                result_format = "CSV" if is_csv else "TYPED"
+                parse = self._parse_csv_result if is_csv else self._parse_typed_result
+
+                logger.debug(
+                    "Fetched result page",
+                    extra={"page": page_count, "total_parsed": len(all_records)},
+                )
+
+                # Overlap parsing with the next fetch, unless this page might
+                # complete max_rows and make the next page unnecessary
+                next_token = response.get("NextToken")
+                if next_token and not (
+                    max_rows and len(all_records) + _max_page_rows(response, is_csv) >= max_rows
+                ):
+                    pending = parser.submit(parse, response, columns or None)
+                    continue
+
+                all_records.extend(parse(response, columns or None)["records"])
+
+                # Check if we've reached max_rows limit
+                if max_rows and len(all_records) >= max_rows:
+                    logger.info(
+                        "Reached max_rows limit, stopping pagination",
+                        extra={"max_rows": max_rows, "fetched": len(all_records)},
+                    )
+                    all_records = all_records[:max_rows]
+                    break
+
+                # Check for more pages
+                if not next_token:
+                    break
+
+        logger.info(
+            "Completed fetching all results",
+            extra={
+                "statement_id": statement_id,
+                "pages_fetched": page_count,
+                "total_records": len(all_records),
+                "total_rows_reported": total_rows,
+            },
+        )
+
+        return {
+            "columns": columns,
+            "records": all_records,
+            "total_rows": total_rows or len(all_records),
+            "format": result_format,
+            "pages_fetched": page_count,
+        }
+
+    def iter_statement_results(
+        self,
+        statement_id: str,
+        use_csv_format: bool = True,
+    ) -> Iterator[dict[str, Any]]:
+        """Iterate over all result records of a completed statement.
+
+        Pages are fetched lazily as the iterator advances, so only the
+        current page is held in memory. Use ``get_all_statement_results``
+        when the column metadata or row totals are needed as well.
+
+        Args:
+            statement_id: The statement ID
+            use_csv_format: Use CSV format for faster response (default True)
+
+        Yields:
+            Result records, one dict per row
+
+        Raises:
+            RedshiftError: If getting a page fails
+        """
+        columns: list[dict[str, Any]] | None = None
+        next_token: str | None = None
+
         while True:
-            page_count += 1
             result = self.get_statement_result(
                 statement_id=statement_id,
                 next_token=next_token,
                 use_csv_format=use_csv_format,
+                columns=columns,
             )
+            columns = result.get("columns") or None
+            yield from result.get("records", [])
 
-            # Store columns from first page
-            if not columns:
-                columns = result.get("columns", [])
+            next_token = result.get("next_token")
+            if not next_token:
+                break
 
-            # Append records
-            page_records = result.get("records", [])
-            all_records.extend(page_records)
+    def iter_statement_result_raw(
+        self,
+        statement_id: str,
+    ) -> Iterator[tuple[list[dict[str, Any]], str]]:
+        """Iterate over the CSV text of each result page, without parsing it.
 
-            # Update total rows from API response
-            if result.get("total_rows"):
-                total_rows = result["total_rows"]
+        For callers that only forward the bytes (to S3 or an HTTP response),
+        this skips building records altogether and holds one page at a time.
+        Pages of clusters that reject CSV results are fetched typed and
+        written back out as CSV.
 
-            # Update format from response
-            if result.get("format"):
-                result_format = result["format"]
+        Args:
+            statement_id: The statement ID
 
-            logger.debug(
-                "Fetched result page",
-                extra={
-                    "page": page_count,
-                    "page_records": len(page_records),
-                    "total_fetched": len(all_records),
-                },
+        Yields:
+            Tuple of (columns, page CSV text with one "\\n"-terminated line per row)
+
+        Raises:
+            RedshiftError: If getting a page fails
+        """
+        columns: list[dict[str, Any]] | None = None
+        next_token: str | None = None
+
+        while True:
+            response, is_csv = self._fetch_result_page(
+                statement_id, next_token, use_csv_format=True
             )
+            if columns is None:
+                columns = _parse_column_metadata(response.get("ColumnMetadata", []))
 
-            # Check if we've reached max_rows limit
-            if max_rows and len(all_records) >= max_rows:
-                logger.info(
-                    "Reached max_rows limit, stopping pagination",
-                    extra={"max_rows": max_rows, "fetched": len(all_records)},
+            if is_csv:
+                yield columns, response.get("FormattedRecords", "")
+            else:
+                buffer = io.StringIO()
+                csv.writer(buffer, lineterminator="\n").writerows(
+                    record.values()
+                    for record in self._parse_typed_result(response, columns)["records"]
                 )
-                all_records = all_records[:max_rows]
+                yield columns, buffer.getvalue()
+
+            next_token = response.get("NextToken")
+            if not next_token:
                 break
 
-            # Check for more pages
-            next_token = result.get("next_token")
+    @tracer.capture_method
+    def get_all_statement_results_arrow(
+        self,
+        statement_id: str,
+        max_rows: int | None = None,
+    ) -> dict[str, Any]:
+        """Get all results of a completed statement as a pyarrow Table.
+
+        CSV pages are parsed straight into Arrow columns, so no per-row
+        Python objects are created. Integer columns (int2/int4/int8) are
+        parsed to int64, as in the typed fallback; other values are kept
+        as strings. Empty values become nulls.
+
+        Args:
+            statement_id: The statement ID
+            max_rows: Optional maximum number of rows to retrieve
+
+        Returns:
+            Result data with 'columns', 'table' (pyarrow.Table), 'total_rows',
+            'format' and 'pages_fetched'
+
+        Raises:
+            RedshiftError: If getting results fails
+        """
+        # Only Arrow callers pay for loading pyarrow, as in _csv_to_arrow
+        import pyarrow as pa  # noqa: PLC0415
+
+        if not _CSV_RESULTS_SUPPORTED.get(self._results_target, True):
+            result = self._get_all_typed_columns(statement_id, max_rows)
+            result["table"] = pa.table(result.pop("data"))
+            return result
+
+        tables: list[pa.Table] = []
+        columns: list[dict[str, Any]] = []
+        next_token: str | None = None
+        fetched = 0
+        total_rows = 0
+        page_count = 0
+
+        while True:
+            page_count += 1
+            params: dict[str, Any] = {"Id": statement_id, "Format": "CSV"}
+            if next_token:
+                params["NextToken"] = next_token
+
+            try:
+                response = cast(dict[str, Any], self.client.get_statement_result_v2(**params))
+            except ClientError as e:
+                error_code = e.response.get("Error", {}).get("Code", "Unknown")
+                if error_code == "ValidationException" and not tables:
+                    logger.warning(
+                        "CSV format not supported, building Arrow table from typed results",
+                        extra={"statement_id": statement_id},
+                    )
+                    _CSV_RESULTS_SUPPORTED[self._results_target] = False
+                    result = self._get_all_typed_columns(statement_id, max_rows)
+                    result["table"] = pa.table(result.pop("data"))
+                    return result
+                raise RedshiftError(
+                    message=f"Failed to get statement result: {e}",
+                    code=error_code,
+                )
+
+            if not columns:
+                columns = _parse_column_metadata(response.get("ColumnMetadata", []))
+
+            page = _csv_to_arrow(
+                [c["name"] for c in columns],
+                response.get("FormattedRecords", ""),
+                type_names=[c["type"] for c in columns],
+            )
+            tables.append(page)
+            fetched += page.num_rows
+            total_rows = response.get("TotalNumRows") or total_rows
+
+            if max_rows and fetched >= max_rows:
+                break
+
+            next_token = response.get("NextToken")
             if not next_token:
                 break
 
+        table = pa.concat_tables(tables)
+        if max_rows:
+            table = table.slice(0, max_rows)
+
         logger.info(
-            "Completed fetching all results",
+            "Completed fetching Arrow results",
             extra={
                 "statement_id": statement_id,
                 "pages_fetched": page_count,
-                "total_records": len(all_records),
-                "total_rows_reported": total_rows,
+                "total_records": table.num_rows,
             },
         )
 
         return {
             "columns": columns,
-            "records": all_records,
-            "total_rows": total_rows or len(all_records),
-            "format": result_format,
+            "table": table,
+            "total_rows": total_rows or table.num_rows,
+            "format": "ARROW",
+            "pages_fetched": page_count,
+        }
+
+    def _get_all_typed_columns(self, statement_id: str, max_rows: int | None) -> dict[str, Any]:
+        """Fetch all typed result pages as column value lists.
+
+        Used when a statement's results cannot be returned as CSV. Each page
+        is unwrapped into per-column lists that are appended to the running
+        columns, so no dict is created per row.
+
+        Args:
+            statement_id: The statement ID
+            max_rows: Optional maximum number of rows to retrieve
+
+        Returns:
+            Result data with 'columns', 'data' (column name to value list),
+            'total_rows', 'format' ('TYPED') and 'pages_fetched'
+
+        Raises:
+            RedshiftError: If getting results fails
+        """
+        columns: list[dict[str, Any]] = []
+        column_values: list[list[Any]] = []
+        next_token: str | None = None
+        fetched = 0
+        total_rows = 0
+        page_count = 0
+
+        while True:
+            page_count += 1
+            params: dict[str, Any] = {"Id": statement_id}
+            if next_token:
+                params["NextToken"] = next_token
+
+            try:
+                response = cast(dict[str, Any], self.client.get_statement_result(**params))
+            except ClientError as e:
+                error_code = e.response.get("Error", {}).get("Code", "Unknown")
+                raise RedshiftError(
+                    message=f"Failed to get statement result: {e}",
+                    code=error_code,
+                )
+
+            if not columns:
+                columns = _parse_column_metadata(response.get("ColumnMetadata", []))
+                column_values = [[] for _ in columns]
+
+            rows = response.get("Records", [])
+            page_columns = _typed_rows_to_columns(rows, len(columns))
+            for values, page_values in zip(column_values, page_columns, strict=True):
+                values.extend(page_values)
+            fetched += len(rows)
+            total_rows = response.get("TotalNumRows") or total_rows
+
+            if max_rows and fetched >= max_rows:
+                break
+
+            next_token = response.get("NextToken")
+            if not next_token:
+                break
+
+        if max_rows:
+            column_values = [values[:max_rows] for values in column_values]
+            fetched = min(fetched, max_rows)
+
+        return {
+            "columns": columns,
+            "data": {c["name"]: values for c, values in zip(columns, column_values, strict=True)},
+            "total_rows": total_rows or fetched,
+            "format": "TYPED",
             "pages_fetched": page_count,
         }
 
@@ -647,9 +1394,14 @@ class RedshiftService:
         tenant_id: str | None = None,
         file_format: str = "PARQUET",
         partition_by: list[str] | None = None,
+        *,
+        max_file_size_mb: int | None = None,
     ) -> str:
         """Execute an UNLOAD statement to export data to S3.
 
+        Redshift writes the result files from every slice in parallel
+        straight to S3, so rows never pass through the Lambda.
+
         Args:
             sql: SELECT query to export
             s3_path: S3 destination path
@@ -658,6 +1410,7 @@ class RedshiftService:
             tenant_id: Tenant identifier for session reuse
             file_format: Output format (PARQUET, CSV, JSON)
             partition_by: Optional partition columns
+            max_file_size_mb: Optional cap on the size of each written file
 
         Returns:
             Statement ID for tracking
@@ -666,20 +1419,10 @@ class RedshiftService:
             QueryExecutionError: If UNLOAD fails
         """
         # Build UNLOAD SQL
-        unload_options = [
-            f"FORMAT {file_format}",
-            "PARALLEL ON",
-            "ALLOWOVERWRITE",
-        ]
-
-        if partition_by:
-            partition_cols = ", ".join(partition_by)
-            unload_options.append(f"PARTITION BY ({partition_cols})")
-
-        options_str = "\n".join(unload_options)
+        options_str = _unload_options(file_format, tuple(partition_by or ()), max_file_size_mb)
 
         unload_sql = f"""
-        UNLOAD ('{sql.replace("'", "''")}')
+        UNLOAD ('{_escape_sql_literal(sql)}')
         TO '{s3_path}'
         IAM_ROLE '{iam_role}'
         {options_str};
@@ -705,7 +1448,8 @@ class RedshiftService:
         """
         return self.session_service.cleanup_expired_sessions(tenant_id)
 
-    def map_status(self, redshift_status: str) -> str:
+    @staticmethod
+    def map_status(redshift_status: str) -> str:
         """Map Redshift Data API status to our job status.
 
         Args:
@@ -714,12 +1458,4 @@ class RedshiftService:
         Returns:
             Mapped job status
         """
-        status_mapping = {
-            "SUBMITTED": "SUBMITTED",
-            "PICKED": "RUNNING",
-            "STARTED": "RUNNING",
-            "FINISHED": "COMPLETED",
-            "FAILED": "FAILED",
-            "ABORTED": "CANCELLED",
-        }
-        return status_mapping.get(redshift_status, "RUNNING")
+        return _STATUS_MAPPING.get(redshift_status, "RUNNING")
@@ -4,19 +4,45 @@ This service manages Redshift Data API sessions, storing them in DynamoDB
 and associating them with tenant users for connection reuse.
 """
 
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 from typing import Any
 
-import boto3
 from aws_lambda_powertools import Logger, Tracer
 from boto3.dynamodb.conditions import Attr, Key
 from botocore.exceptions import ClientError
 
+from spectra.utils.aws import get_resource, get_table
 from spectra.utils.config import get_settings
 
 logger = Logger()
 tracer = Tracer()
 
+# Active session IDs per (tenant_id, db_user), kept briefly so a burst of
+# queries from one user skips the DynamoDB lookup. Entries are dropped when
+# the session is invalidated or deleted through this process.
+_SESSION_ID_CACHE: dict[tuple[str, str], tuple[str, datetime]] = {}
+_SESSION_ID_CACHE_MAX_SIZE = 1024
+_SESSION_ID_CACHE_TTL = timedelta(seconds=30)
+
+
+def _cache_session_id(session: "RedshiftSession", now: datetime) -> None:
+    """Remember a session's ID until the cache TTL or the session expires."""
+    if len(_SESSION_ID_CACHE) >= _SESSION_ID_CACHE_MAX_SIZE:
+        for stale_key in [k for k, (_, exp) in _SESSION_ID_CACHE.items() if exp <= now]:
+            del _SESSION_ID_CACHE[stale_key]
+        if len(_SESSION_ID_CACHE) >= _SESSION_ID_CACHE_MAX_SIZE:
+            _SESSION_ID_CACHE.clear()
+    _SESSION_ID_CACHE[(session.tenant_id, session.db_user)] = (
+        session.session_id,
+        min(now + _SESSION_ID_CACHE_TTL, session.expires_at),
+    )
+
+
+def _forget_session_id(session_id: str) -> None:
+    """Drop cached entries that point at a session."""
+    for key in [k for k, (cached_id, _) in _SESSION_ID_CACHE.items() if cached_id == session_id]:
+        _SESSION_ID_CACHE.pop(key, None)
+
 
 class SessionError(Exception):
     """Base exception for session operations."""
@@ -102,13 +128,18 @@ class SessionService:
     def __init__(self) -> None:
         """Initialize session service."""
         self.settings = get_settings()
-        self.dynamodb = boto3.resource("dynamodb", region_name=self.settings.aws_region)
-        self.table = self.dynamodb.Table(self.settings.dynamodb_sessions_table_name)
+        self.dynamodb = get_resource("dynamodb", self.settings.aws_region)
+        self.table = get_table(self.settings.dynamodb_sessions_table_name, self.settings.aws_region)
 
     @tracer.capture_method
     def get_active_session(self, tenant_id: str, db_user: str) -> RedshiftSession | None:
         """Get an active session for a tenant and db_user.
 
+        Expiry is checked by DynamoDB: the GSI is sorted by ``expires_at``, so
+        the key condition skips expired sessions that TTL has not removed
+        yet, and idle sessions are filtered out by ``last_used_at``. The
+        session expiring last is returned first.
+
         Args:
             tenant_id: Tenant identifier
             db_user: Database user
@@ -116,14 +147,21 @@ class SessionService:
         Returns:
             Active session if found, None otherwise
         """
+        now = datetime.now(UTC)
+        idle_cutoff = now - timedelta(seconds=self.settings.redshift_session_idle_timeout_seconds)
         try:
-            # Query sessions by tenant using GSI
+            # Query live sessions by tenant using GSI
             response = self.table.query(
                 IndexName="gsi1-tenant",
-                KeyConditionExpression=Key("tenant_id").eq(tenant_id),
-                FilterExpression=Attr("db_user").eq(db_user) & Attr("is_active").eq(True),
+                KeyConditionExpression=Key("tenant_id").eq(tenant_id)
+                & Key("expires_at").gt(now.isoformat()),
+                FilterExpression=Attr("db_user").eq(db_user)
+                & Attr("is_active").eq(True)
+                & Attr("last_used_at").gte(idle_cutoff.isoformat()),
+                ScanIndexForward=False,
             )
 
+            # Items are live as of the query; re-check in case one lapsed since
             for item in response.get("Items", []):
                 session = RedshiftSession.from_dict(item)
                 if not session.is_expired and not session.is_idle_expired:
@@ -181,6 +219,7 @@ class SessionService:
 
         try:
             self.table.put_item(Item=session.to_dict())
+            _cache_session_id(session, now)
             logger.info(
                 "Created new session",
                 extra={
@@ -223,6 +262,7 @@ class SessionService:
         Args:
             session_id: Session ID to invalidate
         """
+        _forget_session_id(session_id)
         try:
             self.table.update_item(
                 Key={"session_id": session_id},
@@ -244,6 +284,7 @@ class SessionService:
         Args:
             session_id: Session ID to delete
         """
+        _forget_session_id(session_id)
         try:
             self.table.delete_item(Key={"session_id": session_id})
             logger.info("Session deleted", extra={"session_id": session_id})
@@ -258,6 +299,9 @@ class SessionService:
     def cleanup_expired_sessions(self, tenant_id: str) -> int:
         """Clean up expired sessions for a tenant.
 
+        Expired sessions are deleted with BatchWriteItem, 25 per request,
+        rather than one DeleteItem call each.
+
         Args:
             tenant_id: Tenant identifier
 
@@ -271,11 +315,18 @@ class SessionService:
                 KeyConditionExpression=Key("tenant_id").eq(tenant_id),
             )
 
+            expired_ids = []
             for item in response.get("Items", []):
                 session = RedshiftSession.from_dict(item)
                 if session.is_expired or session.is_idle_expired:
-                    self.delete_session(session.session_id)
-                    cleaned += 1
+                    expired_ids.append(session.session_id)
+
+            if expired_ids:
+                with self.table.batch_writer(overwrite_by_pkeys=["session_id"]) as batch:
+                    for session_id in expired_ids:
+                        _forget_session_id(session_id)
+                        batch.delete_item(Key={"session_id": session_id})
+                cleaned = len(expired_ids)
 
             if cleaned > 0:
                 logger.info(
@@ -299,6 +350,9 @@ class SessionService:
     ) -> tuple[str | None, bool]:
         """Get an existing session ID or indicate a new one is needed.
 
+        A session found or created in the last few seconds is returned from
+        an in-process cache without querying DynamoDB.
+
         Args:
             tenant_id: Tenant identifier
             db_user: Database user
@@ -307,8 +361,14 @@ class SessionService:
             Tuple of (session_id or None, is_new_session)
             If session_id is None, caller should create a new session
         """
+        now = datetime.now(UTC)
+        cached = _SESSION_ID_CACHE.get((tenant_id, db_user))
+        if cached is not None and cached[1] > now:
+            return cached[0], False
+
         existing = self.get_active_session(tenant_id, db_user)
         if existing:
             self.update_last_used(existing.session_id)
+            _cache_session_id(existing, now)
             return existing.session_id, False
         return None, True
@@ -1,5 +1,6 @@
 """Utilities package for Redshift Spectra."""
 
+from spectra.utils.aws import get_client, get_resource, get_table
 from spectra.utils.config import Settings, get_settings
 
-__all__ = ["Settings", "get_settings"]
+__all__ = ["Settings", "get_client", "get_resource", "get_settings", "get_table"]
@@ -7,9 +7,9 @@ import time
 from dataclasses import dataclass
 from typing import Any
 
-import boto3
 from aws_lambda_powertools import Logger
 
+from spectra.utils.aws import get_client
 from spectra.utils.config import get_settings
 
 logger = Logger()
@@ -159,6 +159,9 @@ def validate_api_key(api_key: str) -> dict[str, Any]:
 def get_secret(secret_arn: str) -> dict[str, Any]:
     """Retrieve secret from AWS Secrets Manager.
 
+    Uses the shared per-process client, so warm invocations reuse its
+    kept-alive connection.
+
     Args:
         secret_arn: ARN of the secret
 
@@ -166,7 +169,7 @@ def get_secret(secret_arn: str) -> dict[str, Any]:
         Secret value as dictionary
     """
     settings = get_settings()
-    client = boto3.client("secretsmanager", region_name=settings.aws_region)
+    client = get_client("secretsmanager", settings.aws_region)
 
     response = client.get_secret_value(SecretId=secret_arn)
 
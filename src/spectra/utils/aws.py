@@ -0,0 +1,161 @@
+"""Shared boto3 clients and resources.
+
+Creating a boto3 client loads service models and builds a botocore session,
+which costs tens of milliseconds. Clients, resources and DynamoDB tables are
+cached per process and region so services instantiated per request reuse them across
+warm Lambda invocations.
+"""
+
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import lru_cache
+from typing import Any
+
+import boto3
+from boto3.dynamodb.types import TypeDeserializer, TypeSerializer
+from botocore.config import Config
+
+# boto3's default session is not thread-safe while creating clients
+_create_lock = threading.Lock()
+
+# Shared by every client so pool sizing and retry behaviour are set in one place.
+# The pool is larger than botocore's default of 10 so managed S3 transfers and
+# threaded fan-out do not queue for connections. TCP keep-alive stops idle
+# pooled connections from being dropped between warm invocations, so the next
+# request skips a fresh TLS handshake.
+_CLIENT_CONFIG = Config(
+    max_pool_connections=50,
+    retries={"mode": "adaptive"},
+    tcp_keepalive=True,
+)
+
+# Counters of the count_aws_calls blocks active in the current context,
+# innermost last; every API call made through a cached client bumps each one
+_active_call_counters: ContextVar[tuple["AwsCallCounter", ...]] = ContextVar(
+    "_active_call_counters", default=()
+)
+
+# Shared converters for items read and written through low-level DynamoDB clients
+_serializer = TypeSerializer()
+_deserializer = TypeDeserializer()
+
+
+class AwsCallCounter:
+    """Number of AWS API calls made while a ``count_aws_calls`` block was active."""
+
+    __slots__ = ("count",)
+
+    def __init__(self) -> None:
+        self.count = 0
+
+
+def _count_call(**_kwargs: Any) -> None:
+    """botocore ``before-call`` handler feeding the active call counters."""
+    for counter in _active_call_counters.get():
+        counter.count += 1
+
+
+@contextmanager
+def count_aws_calls() -> Iterator[AwsCallCounter]:
+    """Count the AWS API calls made through cached clients inside the block.
+
+    Calls are counted where botocore makes them, so nested helpers and
+    paginated requests are included. Blocks may nest; each counts the calls
+    made inside it. Calls made from other threads are not counted.
+
+    Yields:
+        Counter whose ``count`` is updated as calls are made
+    """
+    counter = AwsCallCounter()
+    token = _active_call_counters.set((*_active_call_counters.get(), counter))
+    try:
+        yield counter
+    finally:
+        _active_call_counters.reset(token)
+
+
+@lru_cache(maxsize=16)
+def get_client(service_name: str, region_name: str) -> Any:
+    """Get a cached low-level boto3 client.
+
+    Args:
+        service_name: AWS service name (e.g., "s3")
+        region_name: AWS region
+
+    Returns:
+        boto3 client shared by all callers in this process
+    """
+    with _create_lock:
+        client = boto3.client(service_name, region_name=region_name, config=_CLIENT_CONFIG)
+    client.meta.events.register("before-call", _count_call)
+    return client
+
+
+@lru_cache(maxsize=16)
+def get_resource(service_name: str, region_name: str) -> Any:
+    """Get a cached boto3 service resource.
+
+    Args:
+        service_name: AWS service name (e.g., "dynamodb")
+        region_name: AWS region
+
+    Returns:
+        boto3 service resource shared by all callers in this process
+    """
+    with _create_lock:
+        resource = boto3.resource(service_name, region_name=region_name, config=_CLIENT_CONFIG)
+    resource.meta.client.meta.events.register("before-call", _count_call)
+    return resource
+
+
+@lru_cache(maxsize=16)
+def get_table(table_name: str, region_name: str) -> Any:
+    """Get a cached DynamoDB Table resource.
+
+    Building a Table object costs most of a millisecond, which adds up when
+    several services are created per request.
+
+    Args:
+        table_name: DynamoDB table name
+        region_name: AWS region
+
+    Returns:
+        Table resource shared by all callers in this process
+    """
+    return get_resource("dynamodb", region_name).Table(table_name)
+
+
+def serialize_item(item: dict[str, Any]) -> dict[str, Any]:
+    """Convert a plain item to low-level DynamoDB attribute values.
+
+    String attributes, the common case, are wrapped directly; everything else
+    goes through the generic serializer.
+
+    Args:
+        item: Item with plain Python values
+
+    Returns:
+        Item in the low-level client's AttributeValue format
+    """
+    serialize = _serializer.serialize
+    return {
+        key: {"S": value} if type(value) is str else serialize(value) for key, value in item.items()
+    }
+
+
+def deserialize_item(item: dict[str, Any]) -> dict[str, Any]:
+    """Convert a low-level DynamoDB item to plain Python values.
+
+    String attributes are unwrapped directly and only the remaining types go
+    through the generic deserializer.
+
+    Args:
+        item: Item in the low-level client's AttributeValue format
+
+    Returns:
+        Item with plain Python values
+    """
+    deserialize = _deserializer.deserialize
+    return {key: value["S"] if "S" in value else deserialize(value) for key, value in item.items()}
@@ -63,6 +63,12 @@ class Settings(BaseSettings):
     presigned_url_expiry: int = Field(
         default=3600, description="Presigned URL expiration in seconds"
     )
+    unload_iam_role_arn: str | None = Field(
+        default=None, description="IAM role Redshift assumes to UNLOAD results to S3"
+    )
+    unload_max_file_size_mb: int = Field(
+        default=512, description="Maximum size of each file written by UNLOAD, in MB"
+    )
 
     # Query Configuration
     result_size_threshold: int = Field(
@@ -43,6 +43,21 @@ resource "aws_dynamodb_table" "jobs" {
     type = "S"
   }
 
+  attribute {
+    name = "pending_status"
+    type = "S"
+  }
+
+  attribute {
+    name = "batch_shard"
+    type = "S"
+  }
+
+  attribute {
+    name = "updated_at"
+    type = "S"
+  }
+
   # Global Secondary Indexes
 
   # GSI1: Query by tenant and status (for listing jobs by tenant)
@@ -77,6 +92,33 @@ resource "aws_dynamodb_table" "jobs" {
     write_capacity = var.jobs_table_billing_mode == "PROVISIONED" ? var.jobs_table_write_capacity : null
   }
 
+  # Batch members sharded as "<batch_id>#<0-15>" (one shard per 50 jobs) so a
+  # large batch is read with parallel queries; only jobs created with a
+  # batch_id are indexed. Older batch jobs need scripts/backfill_job_batch_shard.py
+  global_secondary_index {
+    name            = "batch-shard-index"
+    hash_key        = "batch_shard"
+    range_key       = "created_at"
+    projection_type = "ALL"
+
+    read_capacity  = var.jobs_table_billing_mode == "PROVISIONED" ? var.jobs_table_read_capacity : null
+    write_capacity = var.jobs_table_billing_mode == "PROVISIONED" ? var.jobs_table_write_capacity : null
+  }
+
+  # Sparse index of SUBMITTED/RUNNING jobs for the status poller; the key
+  # attribute is removed when a job leaves those states. After deploying the
+  # index and the service, run scripts/backfill_job_pending_status.py so jobs
+  # already pending at deploy time are polled.
+  global_secondary_index {
+    name            = "pending-index"
+    hash_key        = "pending_status"
+    range_key       = "updated_at"
+    projection_type = "ALL"
+
+    read_capacity  = var.jobs_table_billing_mode == "PROVISIONED" ? var.jobs_table_read_capacity : null
+    write_capacity = var.jobs_table_billing_mode == "PROVISIONED" ? var.jobs_table_write_capacity : null
+  }
+
   # TTL configuration
   ttl {
     attribute_name = "ttl"
@@ -124,10 +166,17 @@ resource "aws_dynamodb_table" "sessions" {
     type = "S"
   }
 
-  # GSI: Query sessions by tenant
+  attribute {
+    name = "expires_at"
+    type = "S"
+  }
+
+  # GSI: Query sessions by tenant, sorted by expiry so live sessions are
+  # selected by the key condition
   global_secondary_index {
     name            = "gsi1-tenant"
     hash_key        = "tenant_id"
+    range_key       = "expires_at"
     projection_type = "ALL"
 
     read_capacity  = var.sessions_table_billing_mode == "PROVISIONED" ? var.sessions_table_read_capacity : null
@@ -185,6 +234,11 @@ resource "aws_dynamodb_table" "bulk_jobs" {
     type = "S"
   }
 
+  attribute {
+    name = "tenant_op"
+    type = "S"
+  }
+
   attribute {
     name = "operation"
     type = "S"
@@ -206,6 +260,18 @@ resource "aws_dynamodb_table" "bulk_jobs" {
     write_capacity = var.jobs_table_billing_mode == "PROVISIONED" ? var.jobs_table_write_capacity : null
   }
 
+  # Query by "tenant#operation" and state. Jobs created before tenant_op
+  # existed need scripts/backfill_bulk_tenant_op.py to be listed by operation.
+  global_secondary_index {
+    name            = "tenant-op-state-index"
+    hash_key        = "tenant_op"
+    range_key       = "state"
+    projection_type = "ALL"
+
+    read_capacity  = var.jobs_table_billing_mode == "PROVISIONED" ? var.jobs_table_read_capacity : null
+    write_capacity = var.jobs_table_billing_mode == "PROVISIONED" ? var.jobs_table_write_capacity : null
+  }
+
   # GSI2: Query by tenant and operation type
   global_secondary_index {
     name            = "gsi2-tenant-operation"
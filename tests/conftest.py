@@ -37,6 +37,31 @@ os.environ.update(
 # =============================================================================
 
 
+@pytest.fixture(autouse=True)
+def reset_aws_clients() -> Generator[None, None, None]:
+    """Drop cached boto3 clients, tables and module-level lookups so each test sees its own mocks."""
+    from spectra.services.export import _BUCKET_REGIONS, _PRESIGNED_URL_CACHE
+    from spectra.services.redshift import _CSV_RESULTS_SUPPORTED
+    from spectra.services.session import _SESSION_ID_CACHE
+    from spectra.utils.aws import get_client, get_resource, get_table
+
+    get_client.cache_clear()
+    get_resource.cache_clear()
+    get_table.cache_clear()
+    _PRESIGNED_URL_CACHE.clear()
+    _BUCKET_REGIONS.clear()
+    _SESSION_ID_CACHE.clear()
+    _CSV_RESULTS_SUPPORTED.clear()
+    yield
+    get_client.cache_clear()
+    get_resource.cache_clear()
+    get_table.cache_clear()
+    _PRESIGNED_URL_CACHE.clear()
+    _BUCKET_REGIONS.clear()
+    _SESSION_ID_CACHE.clear()
+    _CSV_RESULTS_SUPPORTED.clear()
+
+
 @pytest.fixture
 def aws_credentials() -> None:
     """Mock AWS credentials for moto."""
@@ -84,12 +109,14 @@ def mock_dynamodb(aws_credentials: None) -> Generator[Any, None, None]:
             AttributeDefinitions=[
                 {"AttributeName": "session_id", "AttributeType": "S"},
                 {"AttributeName": "tenant_id", "AttributeType": "S"},
+                {"AttributeName": "expires_at", "AttributeType": "S"},
             ],
             GlobalSecondaryIndexes=[
                 {
                     "IndexName": "gsi1-tenant",
                     "KeySchema": [
                         {"AttributeName": "tenant_id", "KeyType": "HASH"},
+                        {"AttributeName": "expires_at", "KeyType": "RANGE"},
                     ],
                     "Projection": {"ProjectionType": "ALL"},
                 }
@@ -49,6 +49,7 @@ def mock_aws_services(aws_credentials: None) -> Generator[dict[str, Any], None,
                 {"AttributeName": "job_id", "AttributeType": "S"},
                 {"AttributeName": "tenant_id", "AttributeType": "S"},
                 {"AttributeName": "state", "AttributeType": "S"},
+                {"AttributeName": "tenant_op", "AttributeType": "S"},
             ],
             GlobalSecondaryIndexes=[
                 {
@@ -57,13 +58,21 @@ def mock_aws_services(aws_credentials: None) -> Generator[dict[str, Any], None,
                     "Projection": {"ProjectionType": "ALL"},
                 },
                 {
-                    "IndexName": "tenant-state-index",
+                    "IndexName": "gsi1-tenant-state",
                     "KeySchema": [
                         {"AttributeName": "tenant_id", "KeyType": "HASH"},
                         {"AttributeName": "state", "KeyType": "RANGE"},
                     ],
                     "Projection": {"ProjectionType": "ALL"},
                 },
+                {
+                    "IndexName": "tenant-op-state-index",
+                    "KeySchema": [
+                        {"AttributeName": "tenant_op", "KeyType": "HASH"},
+                        {"AttributeName": "state", "KeyType": "RANGE"},
+                    ],
+                    "Projection": {"ProjectionType": "ALL"},
+                },
             ],
             BillingMode="PAY_PER_REQUEST",
         )
@@ -75,11 +84,15 @@ def mock_aws_services(aws_credentials: None) -> Generator[dict[str, Any], None,
             AttributeDefinitions=[
                 {"AttributeName": "session_id", "AttributeType": "S"},
                 {"AttributeName": "tenant_id", "AttributeType": "S"},
+                {"AttributeName": "expires_at", "AttributeType": "S"},
             ],
             GlobalSecondaryIndexes=[
                 {
                     "IndexName": "gsi1-tenant",
-                    "KeySchema": [{"AttributeName": "tenant_id", "KeyType": "HASH"}],
+                    "KeySchema": [
+                        {"AttributeName": "tenant_id", "KeyType": "HASH"},
+                        {"AttributeName": "expires_at", "KeyType": "RANGE"},
+                    ],
                     "Projection": {"ProjectionType": "ALL"},
                 }
             ],
@@ -313,6 +326,89 @@ class TestBulkJobManagementIntegration:
         jobs_b, _ = bulk_service.list_jobs("list-tenant-B")
         assert len(jobs_b) == 2
 
+    def test_round_trip_annotations_count_calls(self, mock_aws_services: dict[str, Any]) -> None:
+        """Test round-trip annotations count the AWS calls each method made."""
+        from unittest.mock import call, patch
+
+        from spectra.services.bulk import BulkJobService
+
+        bulk_service = BulkJobService()
+        job = bulk_service.create_job(
+            tenant_id="trace-tenant",
+            db_user="user_trace",
+            operation=BulkOperation.INSERT,
+            object_name="target_table",
+        )
+
+        with patch("spectra.services.bulk.tracer.put_annotation") as put_annotation:
+            bulk_service.get_upload_url(
+                job.id, "trace-tenant", DataFormat.CSV, CompressionType.NONE
+            )
+            bulk_service.close_job(job.id, "trace-tenant")
+
+        # Nested get_job calls annotate their own subsegment first. URL signing
+        # is local, so get_upload_url counts only its job lookup, and
+        # update_job_state counts only its conditional update
+        assert put_annotation.call_args_list == [
+            call(key="aws_round_trips", value=1),
+            call(key="aws_round_trips", value=1),
+            call(key="aws_round_trips", value=1),
+        ]
+
+    def test_backfill_tenant_op_lists_older_jobs(self, mock_aws_services: dict[str, Any]) -> None:
+        """Test jobs written without tenant_op are listed by operation once backfilled."""
+        from spectra.services.bulk import BulkJobService
+
+        bulk_service = BulkJobService()
+        job = bulk_service.create_job(
+            tenant_id="backfill-tenant",
+            db_user="user_backfill",
+            operation=BulkOperation.INSERT,
+            object_name="target_table",
+        )
+        # Simulate an item written before tenant_op existed
+        bulk_service.table.update_item(Key={"job_id": job.id}, UpdateExpression="REMOVE tenant_op")
+        assert bulk_service.list_jobs("backfill-tenant", operation=BulkOperation.INSERT)[0] == []
+        # Listings without an operation filter do not depend on tenant_op
+        jobs, _ = bulk_service.list_jobs("backfill-tenant", state=BulkJobState.OPEN)
+        assert [listed.id for listed in jobs] == [job.id]
+
+        assert bulk_service.backfill_tenant_op() == 1
+        assert bulk_service.backfill_tenant_op() == 0
+
+        jobs, _ = bulk_service.list_jobs("backfill-tenant", operation=BulkOperation.INSERT)
+        assert [listed.id for listed in jobs] == [job.id]
+
+    def test_list_jobs_by_state_and_operation(self, mock_aws_services: dict[str, Any]) -> None:
+        """Test state/operation filters follow state transitions."""
+        from spectra.services.bulk import BulkJobService
+
+        bulk_service = BulkJobService()
+
+        insert_job = bulk_service.create_job(
+            tenant_id="filter-tenant",
+            db_user="user_filter",
+            operation=BulkOperation.INSERT,
+            object_name="target_table",
+        )
+        bulk_service.create_job(
+            tenant_id="filter-tenant",
+            db_user="user_filter",
+            operation=BulkOperation.DELETE,
+            object_name="target_table",
+        )
+        bulk_service.close_job(insert_job.id, "filter-tenant")
+
+        open_jobs, _ = bulk_service.list_jobs("filter-tenant", state=BulkJobState.OPEN)
+        assert [job.operation for job in open_jobs] == [BulkOperation.DELETE]
+
+        closed_inserts, _ = bulk_service.list_jobs(
+            "filter-tenant",
+            state=BulkJobState.UPLOAD_COMPLETE,
+            operation=BulkOperation.INSERT,
+        )
+        assert [job.id for job in closed_inserts] == [insert_job.id]
+
     def test_get_job_with_tenant_validation(self, mock_aws_services: dict[str, Any]) -> None:
         """Test that job retrieval validates tenant access."""
         from spectra.services.bulk import BulkJobNotFoundError, BulkJobService
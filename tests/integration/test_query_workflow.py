@@ -46,13 +46,33 @@ def mock_aws_services(aws_credentials: None) -> Generator[dict[str, Any], None,
             AttributeDefinitions=[
                 {"AttributeName": "job_id", "AttributeType": "S"},
                 {"AttributeName": "tenant_id", "AttributeType": "S"},
+                {"AttributeName": "batch_shard", "AttributeType": "S"},
+                {"AttributeName": "created_at", "AttributeType": "S"},
+                {"AttributeName": "pending_status", "AttributeType": "S"},
+                {"AttributeName": "updated_at", "AttributeType": "S"},
             ],
             GlobalSecondaryIndexes=[
                 {
                     "IndexName": "tenant-index",
                     "KeySchema": [{"AttributeName": "tenant_id", "KeyType": "HASH"}],
                     "Projection": {"ProjectionType": "ALL"},
-                }
+                },
+                {
+                    "IndexName": "batch-shard-index",
+                    "KeySchema": [
+                        {"AttributeName": "batch_shard", "KeyType": "HASH"},
+                        {"AttributeName": "created_at", "KeyType": "RANGE"},
+                    ],
+                    "Projection": {"ProjectionType": "ALL"},
+                },
+                {
+                    "IndexName": "pending-index",
+                    "KeySchema": [
+                        {"AttributeName": "pending_status", "KeyType": "HASH"},
+                        {"AttributeName": "updated_at", "KeyType": "RANGE"},
+                    ],
+                    "Projection": {"ProjectionType": "ALL"},
+                },
             ],
             BillingMode="PAY_PER_REQUEST",
         )
@@ -64,11 +84,15 @@ def mock_aws_services(aws_credentials: None) -> Generator[dict[str, Any], None,
             AttributeDefinitions=[
                 {"AttributeName": "session_id", "AttributeType": "S"},
                 {"AttributeName": "tenant_id", "AttributeType": "S"},
+                {"AttributeName": "expires_at", "AttributeType": "S"},
             ],
             GlobalSecondaryIndexes=[
                 {
                     "IndexName": "gsi1-tenant",
-                    "KeySchema": [{"AttributeName": "tenant_id", "KeyType": "HASH"}],
+                    "KeySchema": [
+                        {"AttributeName": "tenant_id", "KeyType": "HASH"},
+                        {"AttributeName": "expires_at", "KeyType": "RANGE"},
+                    ],
                     "Projection": {"ProjectionType": "ALL"},
                 }
             ],
@@ -148,7 +172,7 @@ class TestQueryWorkflowIntegration:
         from spectra.models.job import JobStatus
         from spectra.services.job import JobService
 
-        with patch("boto3.client", return_value=mock_redshift_client):
+        with patch("spectra.services.redshift.get_client", return_value=mock_redshift_client):
             job_service = JobService()
 
             # Create a job
@@ -174,7 +198,7 @@ class TestQueryWorkflowIntegration:
         from spectra.models.job import JobResult, JobStatus
         from spectra.services.job import JobService
 
-        with patch("boto3.client", return_value=mock_redshift_client):
+        with patch("spectra.services.redshift.get_client", return_value=mock_redshift_client):
             job_service = JobService()
 
             # Create job
@@ -189,6 +213,7 @@ class TestQueryWorkflowIntegration:
                 job_id=job.job_id,
                 status=JobStatus.SUBMITTED,
                 statement_id="stmt-123",
+                echo=True,
             )
             assert job.status == JobStatus.SUBMITTED
 
@@ -196,6 +221,7 @@ class TestQueryWorkflowIntegration:
             job = job_service.update_job_status(
                 job_id=job.job_id,
                 status=JobStatus.RUNNING,
+                echo=True,
             )
             assert job.status == JobStatus.RUNNING
 
@@ -205,6 +231,7 @@ class TestQueryWorkflowIntegration:
                 job_id=job.job_id,
                 status=JobStatus.COMPLETED,
                 result=result,
+                echo=True,
             )
             assert job.status == JobStatus.COMPLETED
 
@@ -214,7 +241,7 @@ class TestQueryWorkflowIntegration:
         """Test that jobs are isolated by tenant."""
         from spectra.services.job import JobNotFoundError, JobService
 
-        with patch("boto3.client", return_value=mock_redshift_client):
+        with patch("spectra.services.redshift.get_client", return_value=mock_redshift_client):
             job_service = JobService()
 
             # Create job for tenant A
@@ -238,6 +265,97 @@ class TestQueryWorkflowIntegration:
             with pytest.raises(JobNotFoundError):
                 job_service.get_job(job_b.job_id, tenant_id="tenant-A")
 
+    def test_backfill_pending_status(self, mock_aws_services: dict[str, Any]) -> None:
+        """Test jobs pending before the pending-index existed are polled once backfilled."""
+        from spectra.models.job import JobStatus
+        from spectra.services.job import JobService
+
+        job_service = JobService()
+        jobs = job_service.create_jobs_bulk(
+            tenant_id="integration-tenant",
+            db_user="user_integration",
+            sqls=["SELECT 1", "SELECT 2", "SELECT 3"],
+        )
+        job_service.update_jobs_status(
+            [
+                (jobs[0].job_id, JobStatus.RUNNING),
+                (jobs[1].job_id, JobStatus.SUBMITTED),
+                (jobs[2].job_id, JobStatus.COMPLETED),
+            ]
+        )
+        # Simulate items written before pending_status existed
+        for job in jobs:
+            mock_aws_services["jobs_table"].update_item(
+                Key={"job_id": job.job_id}, UpdateExpression="REMOVE pending_status"
+            )
+        assert job_service.get_pending_jobs() == []
+
+        assert job_service.backfill_pending_status() == 2
+        assert job_service.backfill_pending_status() == 0
+
+        pending = {job.job_id: job.status for job in job_service.get_pending_jobs()}
+        assert pending == {
+            jobs[0].job_id: JobStatus.RUNNING,
+            jobs[1].job_id: JobStatus.SUBMITTED,
+        }
+
+    def test_bulk_create_and_status_update(self, mock_aws_services: dict[str, Any]) -> None:
+        """Test batched job creation and transactional status updates."""
+        from botocore.exceptions import ClientError
+
+        from spectra.models.job import JobStatus
+        from spectra.services.job import JobService
+
+        job_service = JobService()
+
+        jobs = job_service.create_jobs_bulk(
+            tenant_id="integration-tenant",
+            db_user="user_integration",
+            sqls=[f"SELECT {i}" for i in range(30)],
+            batch_id="batch-1",
+        )
+        job_service.update_jobs_status([(job.job_id, JobStatus.RUNNING) for job in jobs])
+
+        batch_jobs = job_service.list_batch_jobs("batch-1", "integration-tenant")
+        assert {job.job_id for job in batch_jobs} == {job.job_id for job in jobs}
+        assert job_service.list_batch_jobs("batch-1", "other-tenant") == []
+
+        stored = job_service.get_job(jobs[-1].job_id)
+        assert stored.status == JobStatus.RUNNING
+        assert stored.batch_id == "batch-1"
+        assert stored.started_at is not None
+        item = mock_aws_services["jobs_table"].get_item(Key={"job_id": jobs[0].job_id})["Item"]
+        assert item["pending_status"] == "RUNNING"
+
+        # Larger batches spread over more shards, all of which are read
+        large = job_service.create_jobs_bulk(
+            tenant_id="integration-tenant",
+            db_user="user_integration",
+            sqls=[f"SELECT {i}" for i in range(120)],
+            batch_id="batch-2",
+        )
+        batch_jobs = job_service.list_batch_jobs("batch-2", "integration-tenant")
+        assert {job.job_id for job in batch_jobs} == {job.job_id for job in large}
+
+        # Batch jobs written before batch_shard existed are listed once backfilled
+        legacy = job_service.create_job(
+            tenant_id="integration-tenant",
+            sql="SELECT 1",
+            db_user="user_integration",
+            batch_id="batch-legacy",
+        )
+        mock_aws_services["jobs_table"].update_item(
+            Key={"job_id": legacy.job_id}, UpdateExpression="REMOVE batch_shard, batch_shards"
+        )
+        assert job_service.list_batch_jobs("batch-legacy", "integration-tenant") == []
+        assert job_service.backfill_batch_shard() == 1
+        batch_jobs = job_service.list_batch_jobs("batch-legacy", "integration-tenant")
+        assert [job.job_id for job in batch_jobs] == [legacy.job_id]
+
+        # Unknown jobs cancel the transaction instead of creating stub items
+        with pytest.raises(ClientError):
+            job_service.update_jobs_status([("job-missing", JobStatus.FAILED)])
+
 
 # =============================================================================
 # Session Management Integration Tests
@@ -454,7 +572,7 @@ class TestEndToEndWorkflow:
         from spectra.models.job import JobResult, JobStatus
         from spectra.services.job import JobService
 
-        with patch("boto3.client", return_value=mock_redshift_client):
+        with patch("spectra.services.redshift.get_client", return_value=mock_redshift_client):
             job_service = JobService()
 
             # Step 1: Submit query (sync mode - job record for audit)
@@ -473,12 +591,14 @@ class TestEndToEndWorkflow:
                 job_id=job.job_id,
                 status=JobStatus.SUBMITTED,
                 statement_id="stmt-e2e-123",
+                echo=True,
             )
 
             # Step 3: Update to running
             job = job_service.update_job_status(
                 job_id=job.job_id,
                 status=JobStatus.RUNNING,
+                echo=True,
             )
 
             # Step 4: Complete with result (sync execution returns inline)
@@ -491,6 +611,7 @@ class TestEndToEndWorkflow:
                 job_id=job.job_id,
                 status=JobStatus.COMPLETED,
                 result=result,
+                echo=True,
             )
 
             assert job.status == JobStatus.COMPLETED
@@ -504,7 +625,7 @@ class TestEndToEndWorkflow:
         from spectra.models.job import JobError, JobStatus
         from spectra.services.job import JobService
 
-        with patch("boto3.client", return_value=mock_redshift_client):
+        with patch("spectra.services.redshift.get_client", return_value=mock_redshift_client):
             job_service = JobService()
 
             # Submit query
@@ -519,6 +640,7 @@ class TestEndToEndWorkflow:
                 job_id=job.job_id,
                 status=JobStatus.SUBMITTED,
                 statement_id="stmt-failed-123",
+                echo=True,
             )
 
             # Update to failed
@@ -532,6 +654,7 @@ class TestEndToEndWorkflow:
                 job_id=job.job_id,
                 status=JobStatus.FAILED,
                 error=error,
+                echo=True,
             )
 
             assert job.status == JobStatus.FAILED
@@ -564,7 +687,7 @@ class TestSyncQueryExecution:
         from spectra.services.job import JobService
         from spectra.utils.sql_validator import inject_limit
 
-        with patch("boto3.client", return_value=mock_redshift_client):
+        with patch("spectra.services.redshift.get_client", return_value=mock_redshift_client):
             job_service = JobService()
 
             # Test LIMIT injection
@@ -619,7 +742,7 @@ class TestSyncQueryExecution:
         """Test truncation detection with LIMIT+1 strategy."""
         from spectra.services.job import JobService
 
-        with patch("boto3.client", return_value=mock_redshift_client):
+        with patch("spectra.services.redshift.get_client", return_value=mock_redshift_client):
             JobService()  # Initialize service (not used directly)
 
             # Simulate receiving max_rows + 1 records (indicating truncation)
@@ -641,7 +764,7 @@ class TestSyncQueryExecution:
         from spectra.models.job import JobStatus
         from spectra.services.job import JobService
 
-        with patch("boto3.client", return_value=mock_redshift_client):
+        with patch("spectra.services.redshift.get_client", return_value=mock_redshift_client):
             job_service = JobService()
 
             # Create job
@@ -656,6 +779,7 @@ class TestSyncQueryExecution:
             job = job_service.update_job_status(
                 job_id=job.job_id,
                 status=JobStatus.TIMEOUT,
+                echo=True,
             )
 
             assert job.status == JobStatus.TIMEOUT
@@ -796,6 +920,7 @@ class TestQueryJobAudit:
             job_id=job.job_id,
             status=JobStatus.SUBMITTED,
             statement_id="stmt-123",
+            echo=True,
         )
         assert job.status == JobStatus.SUBMITTED
 
@@ -803,6 +928,7 @@ class TestQueryJobAudit:
         job = job_service.update_job_status(
             job_id=job.job_id,
             status=JobStatus.RUNNING,
+            echo=True,
         )
         assert job.status == JobStatus.RUNNING
 
@@ -812,6 +938,7 @@ class TestQueryJobAudit:
             job_id=job.job_id,
             status=JobStatus.COMPLETED,
             result=result,
+            echo=True,
         )
         assert job.status == JobStatus.COMPLETED
         assert job.result.location == "inline"
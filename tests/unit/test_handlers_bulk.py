@@ -200,6 +200,28 @@ class TestBulkHandler:
 
                 assert result["statusCode"] == 404
 
+    def test_list_bulk_jobs_invalid_cursor(self, mock_context):
+        """Test listing with a cursor that cannot be decoded is a bad request."""
+        from spectra.handlers.bulk import app
+        from spectra.services.bulk import InvalidPageTokenError
+
+        event = create_bulk_event(method="GET")
+        event["queryStringParameters"] = {"cursor": "not-a-cursor"}
+
+        with patch("spectra.handlers.bulk.extract_tenant_context") as mock_ctx:
+            ctx = MagicMock()
+            ctx.tenant_id = "tenant-123"
+            mock_ctx.return_value = ctx
+
+            with patch("spectra.handlers.bulk.BulkJobService") as mock_svc:
+                mock_svc.return_value.list_jobs.side_effect = InvalidPageTokenError(
+                    "Malformed pagination token"
+                )
+
+                result = app.resolve(event, mock_context)
+
+                assert result["statusCode"] == 400
+
 
 class TestBulkHandlerIntegration:
     """Integration tests for Bulk Lambda handler with mocked AWS services."""
@@ -144,6 +144,37 @@ class TestQueryHandler:
                             assert body["metadata"]["row_count"] == 3
                             assert body["metadata"]["truncated"] is False
 
+    def test_submit_query_columnar_layout(self, sample_job, mock_context):
+        """Test columnar layout returns column names once plus row arrays."""
+        from spectra.handlers.query import app
+
+        event = create_query_event(body={"sql": "SELECT * FROM users", "data_layout": "columnar"})
+
+        with (
+            patch("spectra.handlers.query.extract_tenant_context") as mock_ctx,
+            patch("spectra.handlers.query._get_sql_validator") as mock_validator,
+            patch("spectra.handlers.query.JobService") as mock_job_svc,
+            patch("spectra.handlers.query.RedshiftService") as mock_rs,
+        ):
+            mock_ctx.return_value = MagicMock(
+                tenant_id="tenant-123", db_user="user_tenant_123", db_group=None
+            )
+            mock_validator.return_value.validate.return_value = MagicMock(warnings=[])
+            mock_job_svc.return_value.create_job.return_value = sample_job
+            mock_rs.return_value.execute_statement.return_value = "stmt-123"
+            mock_rs.return_value.get_all_statement_results.return_value = {
+                "columns": [{"name": "id", "type": "int4"}, {"name": "name", "type": "varchar"}],
+                "records": [{"id": 1, "name": "a"}, {"id": 2, "name": None}],
+                "total_rows": 2,
+            }
+
+            result = app.resolve(event, mock_context)
+
+        assert result["statusCode"] == 200
+        body = json.loads(result["body"])
+        assert body["data"] == {"columns": ["id", "name"], "rows": [[1, "a"], [2, None]]}
+        assert body["metadata"]["row_count"] == 2
+
     def test_submit_query_truncated(self, sample_job, mock_context):
         """Test query execution with truncated results."""
         from spectra.handlers.query import app
@@ -186,3 +186,55 @@ class TestResultHandler:
                 body = json.loads(result["body"])
                 assert body["status"] == "FAILED"
                 assert "error" in body
+
+    def test_get_result_csv_export_uses_arrow(self, mock_context):
+        """Test large CSV results are exported straight from an Arrow table."""
+        import pyarrow as pa
+
+        from spectra.handlers.result import app, settings
+
+        now = datetime.now(UTC)
+        job = Job(
+            job_id="job-123",
+            tenant_id="tenant-123",
+            status=JobStatus.COMPLETED,
+            sql="SELECT 1",
+            sql_hash="abc",
+            db_user="user",
+            created_at=now,
+            updated_at=now,
+            output_format="csv",
+            statement_id="stmt-123",
+        )
+        table = pa.table({"id": ["1", "2"]})
+        row_count = settings.result_size_threshold + 1
+
+        with (
+            patch("spectra.handlers.result.extract_tenant_context") as mock_ctx,
+            patch("spectra.handlers.result.JobService") as mock_svc,
+            patch("spectra.handlers.result.ExportService") as mock_export,
+            patch("spectra.handlers.result.RedshiftService") as mock_rs,
+        ):
+            mock_ctx.return_value = MagicMock(tenant_id="tenant-123")
+            mock_svc.return_value.get_job.return_value = job
+            mock_rs.return_value.get_all_statement_results_arrow.return_value = {
+                "columns": [{"name": "id", "type": "int4"}],
+                "table": table,
+                "total_rows": row_count,
+            }
+            mock_export.return_value.write_arrow_results.return_value = "s3://bucket/key.csv"
+            mock_export.return_value.generate_presigned_url.return_value = (
+                "https://example.com/key.csv",
+                now,
+            )
+
+            result = app.resolve(create_result_event(job_id="job-123"), mock_context)
+
+        assert result["statusCode"] == 200
+        body = json.loads(result["body"])
+        assert body["download_url"] == "https://example.com/key.csv"
+        assert body["row_count"] == row_count
+        mock_rs.return_value.get_all_statement_results.assert_not_called()
+        export_kwargs = mock_export.return_value.write_arrow_results.call_args.kwargs
+        assert export_kwargs["table"] is table
+        assert export_kwargs["format"] == "csv"
@@ -162,6 +162,56 @@ class TestProcessQueryJob:
             assert "No statement ID" in result["reason"]
 
 
+class TestProcessPendingJobs:
+    """Tests for polling all pending query jobs."""
+
+    def test_process_pending_jobs_describes_statements_once(self):
+        """Test pending jobs share one batched describe and reuse the results."""
+        from spectra.handlers.worker import process_pending_jobs
+        from spectra.models.job import Job, JobStatus
+
+        now = datetime.now(UTC)
+        jobs = [
+            Job(
+                job_id=f"job-{i}",
+                tenant_id="tenant-123",
+                status=JobStatus.RUNNING,
+                sql="SELECT 1",
+                sql_hash="abc123",
+                db_user="user_tenant_123",
+                statement_id=f"stmt-{i}",
+                created_at=now,
+                updated_at=now,
+            )
+            for i in range(3)
+        ]
+
+        with (
+            patch("spectra.handlers.worker.JobService") as mock_job_svc,
+            patch("spectra.handlers.worker.RedshiftService") as mock_rs_svc,
+            patch("spectra.handlers.worker.process_query_job") as mock_process,
+        ):
+            mock_job_svc.return_value.get_pending_jobs.return_value = jobs
+            mock_rs_svc.return_value.describe_statements.return_value = {
+                "stmt-0": {"status": "STARTED"},
+                "stmt-2": {"status": "FINISHED"},
+            }
+            mock_process.return_value = {"status": "processing"}
+
+            results = process_pending_jobs(limit=10)
+
+        mock_job_svc.return_value.get_pending_jobs.assert_called_once_with(limit=10)
+        mock_rs_svc.return_value.describe_statements.assert_called_once_with(
+            ["stmt-0", "stmt-1", "stmt-2"]
+        )
+        assert results[1] == {"status": "skipped", "reason": "Statement not found"}
+        assert mock_process.call_count == 2
+        last_call = mock_process.call_args
+        assert last_call.args == ("job-2", "tenant-123")
+        assert last_call.kwargs["job"] is jobs[2]
+        assert last_call.kwargs["statement_info"] == {"status": "FINISHED"}
+
+
 class TestProcessBulkJob:
     """Tests for bulk job processing function."""
 
@@ -398,6 +448,19 @@ class TestWorkerHandler:
             assert result["completed"] == 1
             mock_process.assert_called_once_with("job-123", "tenant-123")
 
+    def test_handler_poll_event(self, mock_context):
+        """Test handler with a scheduled poll event."""
+        from spectra.handlers.worker import handler
+
+        with patch("spectra.handlers.worker.process_pending_jobs") as mock_poll:
+            mock_poll.return_value = [{"status": "completed"}, {"status": "processing"}]
+
+            result = handler({"job_type": "poll", "limit": 25}, mock_context)
+
+            assert result["processed"] == 2
+            assert result["completed"] == 1
+            mock_poll.assert_called_once_with(limit=25)
+
     def test_handler_unknown_event_format(self, mock_context):
         """Test handler with unknown event format."""
         from spectra.handlers.worker import handler
@@ -11,6 +11,8 @@ Tests cover:
 from datetime import UTC, datetime
 
 import pytest
+from boto3.dynamodb.types import TypeSerializer
+from pydantic import ValidationError
 
 from spectra.models.job import Job, JobError, JobResult, JobState, JobStatus
 
@@ -65,6 +67,17 @@ class TestJobResult:
         )
         assert result.location == "inline"
 
+    def test_low_cardinality_strings_interned(self) -> None:
+        """Test format and inline location share one string object per value."""
+        first = JobResult(
+            row_count=1, location="".join(["in", "line"]), format="".join(["c", "sv"])
+        )
+        second = JobResult(
+            row_count=2, location="".join(["in", "line"]), format="".join(["c", "sv"])
+        )
+        assert first.location is second.location
+        assert first.format is second.format
+
     def test_with_columns(self) -> None:
         """Test result with column metadata."""
         result = JobResult(
@@ -88,6 +101,20 @@ class TestJobResult:
         assert result.download_url is not None
         assert result.download_url_expires == expires
 
+    def test_dynamo_map_is_cached_and_skips_none(self) -> None:
+        """Test the DynamoDB map is built once and omits None values."""
+        expires = datetime(2024, 1, 15, 11, tzinfo=UTC)
+        result = JobResult(row_count=5, location="s3://b/k.json", download_url_expires=expires)
+
+        dynamo_map = result.dynamo_map
+
+        assert result.dynamo_map is dynamo_map
+        assert "size_bytes" not in dynamo_map
+        assert dynamo_map["download_url_expires"] == "2024-01-15T11:00:00+00:00"
+        assert result == JobResult(
+            row_count=5, location="s3://b/k.json", download_url_expires=expires
+        )
+
 
 class TestJobError:
     """Tests for JobError model."""
@@ -119,6 +146,31 @@ class TestJobError:
         )
         assert error.redshift_error_code == "42703"
 
+    def test_error_is_immutable_and_code_interned(self) -> None:
+        """Test errors are frozen and share code strings."""
+        first = JobError(code="".join(["QUERY_", "FAILED"]), message="a")
+        second = JobError(code="".join(["QUERY_", "FAILED"]), message="b")
+        assert first.code is second.code
+        with pytest.raises(ValidationError):
+            first.code = "OTHER"
+
+    def test_dynamo_map_converts_nested_details(self) -> None:
+        """Test values nested in free-form details are made serializable."""
+        at = datetime(2024, 1, 15, 10, 30, tzinfo=UTC)
+        error = JobError(
+            code="QUERY_FAILED",
+            message="m",
+            details={"at": at, "attempts": [{"at": at, "status": JobStatus.FAILED}]},
+        )
+
+        dynamo_map = error.dynamo_map
+
+        assert dynamo_map["details"] == {
+            "at": "2024-01-15T10:30:00Z",
+            "attempts": [{"at": "2024-01-15T10:30:00Z", "status": "FAILED"}],
+        }
+        TypeSerializer().serialize(dynamo_map)
+
 
 class TestJob:
     """Tests for Job model."""
@@ -188,6 +240,20 @@ class TestJob:
         assert item["status"] == "QUEUED"
         assert "created_at" in item
 
+    def test_to_dynamo_item_nested_and_none(self, sample_job: Job) -> None:
+        """Test nested models and datetimes are converted and None values dropped."""
+        expires = datetime(2024, 1, 1, 12, 0, 0, tzinfo=UTC)
+        sample_job.result = JobResult(
+            row_count=5, location="s3://bucket/key.json", download_url_expires=expires
+        )
+        item = sample_job.to_dynamo_item()
+        assert item["created_at"] == sample_job.created_at.isoformat()
+        assert item["result"]["download_url_expires"] == expires.isoformat()
+        assert item["result"]["row_count"] == 5
+        assert "download_url" not in item["result"]
+        assert "statement_id" not in item
+        assert Job.from_dynamo_item(item).result == sample_job.result
+
     def test_from_dynamo_item(self) -> None:
         """Test creation from DynamoDB item."""
         item = {
@@ -205,6 +271,28 @@ class TestJob:
         assert job.status == JobStatus.COMPLETED
         assert isinstance(job.created_at, datetime)
 
+    def test_from_dynamo_item_leaves_item_untouched(self) -> None:
+        """Test nested timestamps are parsed without mutating the source item."""
+        item = {
+            "job_id": "job-xyz789",
+            "tenant_id": "tenant-456",
+            "status": "COMPLETED",
+            "sql": "SELECT 1",
+            "sql_hash": "xyz789",
+            "db_user": "analyst",
+            "created_at": "2024-01-15T10:00:00+00:00",
+            "updated_at": "2024-01-15T10:01:00+00:00",
+            "result": {
+                "row_count": 1,
+                "location": "s3://bucket/key.json",
+                "download_url_expires": "2024-01-15T11:00:00+00:00",
+            },
+        }
+        job = Job.from_dynamo_item(item)
+        assert job.result.download_url_expires == datetime(2024, 1, 15, 11, tzinfo=UTC)
+        assert item["created_at"] == "2024-01-15T10:00:00+00:00"
+        assert item["result"]["download_url_expires"] == "2024-01-15T11:00:00+00:00"
+
     def test_job_with_result(self) -> None:
         """Test job with result attached."""
         now = datetime.now(UTC)
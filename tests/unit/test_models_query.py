@@ -4,6 +4,7 @@ Tests cover:
 - QueryParameter validation
 - QueryRequest validation (sync-only API)
 - QueryResponse serialization
+- ColumnarData result layout
 - ResultMetadata for truncation handling
 - BulkQueryItem validation
 - Edge cases and error handling
@@ -14,6 +15,9 @@ from pydantic import ValidationError
 
 from spectra.models.query import (
     BulkQueryItem,
+    BulkQueryRequest,
+    ColumnarData,
+    DataLayout,
     QueryParameter,
     QueryRequest,
     QueryResponse,
@@ -55,6 +59,11 @@ class TestQueryParameter:
         with pytest.raises(ValidationError):
             QueryParameter(name="123param", value=1)
 
+    def test_non_ascii_name_rejected(self) -> None:
+        """Test that non-ASCII identifiers are rejected."""
+        with pytest.raises(ValidationError):
+            QueryParameter(name="größe", value=1)
+
     def test_empty_name_rejected(self) -> None:
         """Test that empty parameter name is rejected."""
         with pytest.raises(ValidationError):
@@ -412,6 +421,32 @@ class TestQueryResponse:
         assert response.data[0]["amount"] == 99.99
         assert response.data[0]["active"] is True
 
+    def test_response_with_columnar_data(self) -> None:
+        """Test columnar data serializes column names once."""
+        response = QueryResponse(
+            job_id="job-columnar",
+            status="COMPLETED",
+            data=ColumnarData(columns=["id", "name"], rows=[[1, "a"], [2, None]]),
+        )
+        data = response.model_dump(mode="json")
+        assert data["data"] == {"columns": ["id", "name"], "rows": [[1, "a"], [2, None]]}
+
+
+class TestColumnarData:
+    """Tests for ColumnarData model."""
+
+    def test_default_layout_is_records(self) -> None:
+        """Test requests keep the row-object layout unless asked otherwise."""
+        request = QueryRequest(sql="SELECT 1")
+        assert request.data_layout == DataLayout.RECORDS
+
+    def test_from_records_round_trip(self) -> None:
+        """Test conversion from and back to row dictionaries."""
+        records = [{"id": 1, "name": "a"}, {"id": 2}]
+        data = ColumnarData.from_records(["id", "name"], records)
+        assert data.rows == [[1, "a"], [2, None]]
+        assert data.records() == [{"id": 1, "name": "a"}, {"id": 2, "name": None}]
+
 
 class TestBulkQueryItem:
     """Tests for BulkQueryItem model."""
@@ -447,3 +482,20 @@ class TestBulkQueryItem:
             parameters=[QueryParameter(name="id", value=123)],
         )
         assert len(item.parameters) == 1
+
+    def test_invalid_parameter_names_reported_together(self) -> None:
+        """Test every invalid parameter name in a bulk request is reported at once."""
+        with pytest.raises(ValidationError) as exc_info:
+            BulkQueryRequest(
+                queries=[
+                    {"id": "q1", "sql": "SELECT 1", "parameters": [{"name": "1bad", "value": 1}]},
+                    {"id": "q2", "sql": "SELECT 2", "parameters": [{"name": "ok", "value": 1}]},
+                    {"id": "q3", "sql": "SELECT 3", "parameters": [{"name": "a b", "value": 1}]},
+                ]
+            )
+
+        locations = [error["loc"] for error in exc_info.value.errors()]
+        assert locations == [
+            ("queries", 0, "parameters", 0, "name"),
+            ("queries", 2, "parameters", 0, "name"),
+        ]
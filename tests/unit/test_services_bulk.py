@@ -3,13 +3,18 @@
 Tests for the BulkJobService class that manages bulk import/export operations.
 """
 
+import base64
+import json
 from datetime import UTC, datetime
 from typing import Any
 from unittest.mock import MagicMock, patch
 
 import pytest
+from boto3.dynamodb.types import TypeSerializer
+from botocore.exceptions import ClientError
 
 from spectra.models.bulk import (
+    BulkJobCreateRequest,
     BulkJobState,
     BulkOperation,
     CompressionType,
@@ -19,8 +24,17 @@ from spectra.services.bulk import (
     BulkJobNotFoundError,
     BulkJobService,
     BulkJobStateError,
+    InvalidPageTokenError,
 )
 
+_serializer = TypeSerializer()
+
+
+def _marshal(item: dict[str, Any]) -> dict[str, Any]:
+    """Convert a plain item to the low-level DynamoDB client format."""
+    return {key: _serializer.serialize(value) for key, value in item.items()}
+
+
 # =============================================================================
 # BulkJobService Tests
 # =============================================================================
@@ -39,9 +53,17 @@ class TestBulkJobService:
         """Create a mock S3 client."""
         return MagicMock()
 
+    @pytest.fixture
+    def mock_dynamodb_client(self) -> MagicMock:
+        """Create a mock low-level DynamoDB client."""
+        return MagicMock()
+
     @pytest.fixture
     def bulk_service(
-        self, mock_dynamodb_table: MagicMock, mock_s3_client: MagicMock
+        self,
+        mock_dynamodb_table: MagicMock,
+        mock_dynamodb_client: MagicMock,
+        mock_s3_client: MagicMock,
     ) -> BulkJobService:
         """Create a BulkJobService with mocked dependencies."""
         with patch("boto3.resource") as mock_resource, patch("boto3.client") as mock_client:
@@ -49,6 +71,7 @@ class TestBulkJobService:
             mock_client.return_value = mock_s3_client
             service = BulkJobService()
             service.table = mock_dynamodb_table
+            service.dynamodb_client = mock_dynamodb_client
             service.s3_client = mock_s3_client
             return service
 
@@ -58,6 +81,7 @@ class TestBulkJobService:
 
         assert job_id.startswith("bulk-")
         assert len(job_id) == 21  # "bulk-" + 16 hex chars
+        int(job_id[5:], 16)
 
     def test_generate_job_id_uniqueness(self) -> None:
         """Test that bulk job IDs are unique."""
@@ -89,6 +113,22 @@ class TestBulkJobService:
         ext = BulkJobService._get_file_extension(DataFormat.CSV, CompressionType.ZSTD)
         assert ext == ".csv.zst"
 
+    def test_get_file_extension_from_stored_values(self) -> None:
+        """Test lookup with the plain strings stored on BulkJobInfo."""
+        ext = BulkJobService._get_file_extension("JSON", "BZIP2")  # type: ignore[arg-type]
+        assert ext == ".json.bz2"
+
+    def test_get_content_type_header(self) -> None:
+        """Test upload Content-Type for plain and compressed files."""
+        assert (
+            BulkJobService._get_content_type_header(DataFormat.JSON, CompressionType.NONE)
+            == "application/json"
+        )
+        assert (
+            BulkJobService._get_content_type_header(DataFormat.CSV, CompressionType.GZIP)
+            == "application/octet-stream"
+        )
+
     def test_create_query_job(
         self, bulk_service: BulkJobService, mock_dynamodb_table: MagicMock
     ) -> None:
@@ -127,6 +167,25 @@ class TestBulkJobService:
         assert job_info.operation == BulkOperation.INSERT
         assert job_info.object == "target_table"
 
+    def test_content_url_derived_not_stored(
+        self, bulk_service: BulkJobService, mock_dynamodb_table: MagicMock
+    ) -> None:
+        """Test content_url is computed from job fields rather than persisted."""
+        job_info = bulk_service.create_job(
+            tenant_id="tenant-123",
+            db_user="user_tenant_123",
+            operation=BulkOperation.INSERT,
+            object_name="target_table",
+            compression=CompressionType.NONE,
+        )
+
+        stored_item = mock_dynamodb_table.put_item.call_args.kwargs["Item"]
+        assert "content_url" not in stored_item
+        bucket = bulk_service.settings.s3_bucket_name
+        assert job_info.content_url == (
+            f"s3://{bucket}/bulk/tenant-123/{job_info.id}/input/data.csv"
+        )
+
     def test_create_upsert_job(
         self, bulk_service: BulkJobService, mock_dynamodb_table: MagicMock
     ) -> None:
@@ -162,47 +221,253 @@ class TestBulkJobService:
                 operation=BulkOperation.INSERT,
             )
 
-    def test_get_job_found(
+    def test_create_jobs_bulk(
+        self, bulk_service: BulkJobService, mock_dynamodb_table: MagicMock
+    ) -> None:
+        """Test creating several jobs through the batch writer."""
+        batch = mock_dynamodb_table.batch_writer.return_value.__enter__.return_value
+        specs = [
+            BulkJobCreateRequest(operation=BulkOperation.QUERY, query="SELECT 1"),
+            BulkJobCreateRequest(operation=BulkOperation.INSERT, object="target_table"),
+        ]
+
+        jobs = bulk_service.create_jobs_bulk("tenant-123", "user_tenant_123", specs)
+
+        assert [job.operation for job in jobs] == [BulkOperation.QUERY, BulkOperation.INSERT]
+        assert len({job.id for job in jobs}) == 2
+        assert batch.put_item.call_count == 2
+        mock_dynamodb_table.batch_writer.assert_called_once_with(overwrite_by_pkeys=["job_id"])
+        mock_dynamodb_table.put_item.assert_not_called()
+
+    def test_create_jobs_bulk_validates_before_writing(
         self, bulk_service: BulkJobService, mock_dynamodb_table: MagicMock
+    ) -> None:
+        """Test that an invalid spec prevents any write."""
+        specs = [
+            BulkJobCreateRequest(operation=BulkOperation.INSERT, object="target_table"),
+            BulkJobCreateRequest(operation=BulkOperation.UPSERT, object="target_table"),
+        ]
+
+        with pytest.raises(ValueError, match="external_id_field"):
+            bulk_service.create_jobs_bulk("tenant-123", "user_tenant_123", specs)
+
+        mock_dynamodb_table.batch_writer.assert_not_called()
+
+    def test_get_job_found(
+        self, bulk_service: BulkJobService, mock_dynamodb_client: MagicMock
     ) -> None:
         """Test getting an existing bulk job."""
         job_data = self._make_bulk_job_item("bulk-123", "tenant-123")
-        mock_dynamodb_table.get_item.return_value = {"Item": job_data}
+        mock_dynamodb_client.get_item.return_value = {"Item": _marshal(job_data)}
 
         job_info = bulk_service.get_job("bulk-123", "tenant-123")
 
         assert job_info.id == "bulk-123"
         assert job_info.created_by_id == "tenant-123"
+        assert mock_dynamodb_client.get_item.call_args.kwargs["Key"] == {
+            "job_id": {"S": "bulk-123"}
+        }
 
     def test_get_job_not_found(
-        self, bulk_service: BulkJobService, mock_dynamodb_table: MagicMock
+        self, bulk_service: BulkJobService, mock_dynamodb_client: MagicMock
     ) -> None:
         """Test getting a non-existent bulk job."""
-        mock_dynamodb_table.get_item.return_value = {}
+        mock_dynamodb_client.get_item.return_value = {}
 
         with pytest.raises(BulkJobNotFoundError):
             bulk_service.get_job("non-existent", "tenant-123")
 
     def test_get_job_tenant_validation(
-        self, bulk_service: BulkJobService, mock_dynamodb_table: MagicMock
+        self, bulk_service: BulkJobService, mock_dynamodb_client: MagicMock
     ) -> None:
         """Test that tenant ID is validated."""
         job_data = self._make_bulk_job_item("bulk-123", "tenant-123")
-        mock_dynamodb_table.get_item.return_value = {"Item": job_data}
+        mock_dynamodb_client.get_item.return_value = {"Item": _marshal(job_data)}
 
         with pytest.raises(BulkJobNotFoundError):
             bulk_service.get_job("bulk-123", "different-tenant")
 
-    def test_list_jobs(self, bulk_service: BulkJobService, mock_dynamodb_table: MagicMock) -> None:
+    def test_get_jobs_batches_and_filters_tenant(
+        self, bulk_service: BulkJobService, mock_dynamodb_client: MagicMock
+    ) -> None:
+        """Test batched lookup resubmits unprocessed keys and drops other tenants' jobs."""
+        table = bulk_service.settings.dynamodb_bulk_table_name
+        job1 = _marshal(self._make_bulk_job_item("bulk-1", "tenant-123"))
+        job2 = _marshal(self._make_bulk_job_item("bulk-2", "tenant-123"))
+        foreign = _marshal(self._make_bulk_job_item("bulk-3", "other-tenant"))
+        unprocessed = {table: {"Keys": [{"job_id": {"S": "bulk-1"}}]}}
+        mock_dynamodb_client.batch_get_item.side_effect = [
+            {"Responses": {table: [job2, foreign]}, "UnprocessedKeys": unprocessed},
+            {"Responses": {table: [job1]}, "UnprocessedKeys": {}},
+        ]
+
+        with patch("spectra.services.bulk.time.sleep") as sleep:
+            jobs = bulk_service.get_jobs(
+                ["bulk-1", "bulk-2", "bulk-3", "bulk-missing"], "tenant-123"
+            )
+
+        assert [job.id for job in jobs] == ["bulk-1", "bulk-2"]
+        assert mock_dynamodb_client.batch_get_item.call_count == 2
+        assert mock_dynamodb_client.batch_get_item.call_args.kwargs["RequestItems"] == unprocessed
+        sleep.assert_called_once()
+
+    def test_get_jobs_caps_unprocessed_retries(
+        self, bulk_service: BulkJobService, mock_dynamodb_client: MagicMock
+    ) -> None:
+        """Test persistently unprocessed keys are retried with growing delays, then dropped."""
+        table = bulk_service.settings.dynamodb_bulk_table_name
+        job1 = _marshal(self._make_bulk_job_item("bulk-1", "tenant-123"))
+        unprocessed = {table: {"Keys": [{"job_id": {"S": "bulk-2"}}]}}
+        mock_dynamodb_client.batch_get_item.side_effect = [
+            {"Responses": {table: [job1]}, "UnprocessedKeys": unprocessed}
+        ] + [{"Responses": {}, "UnprocessedKeys": unprocessed}] * 5
+
+        with (
+            patch("spectra.services.bulk.time.sleep") as sleep,
+            patch("spectra.services.bulk.random.uniform", side_effect=lambda _low, high: high),
+        ):
+            jobs = bulk_service.get_jobs(["bulk-1", "bulk-2"], "tenant-123")
+
+        assert [job.id for job in jobs] == ["bulk-1"]
+        assert mock_dynamodb_client.batch_get_item.call_count == 6
+        assert [c.args[0] for c in sleep.call_args_list] == [0.05, 0.1, 0.2, 0.4, 0.8]
+
+    def test_item_to_job_info_defaults(self, bulk_service: BulkJobService) -> None:
+        """Test that raw item strings are converted and missing fields defaulted."""
+        item = {
+            "job_id": "bulk-123",
+            "tenant_id": "tenant-123",
+            "operation": "query",
+            "state": "Open",
+            "created_at": "2024-01-01T00:00:00+00:00",
+            "updated_at": "2024-01-02T00:00:00+00:00",
+        }
+
+        job_info = bulk_service._item_to_job_info(item)
+
+        assert job_info.operation == BulkOperation.QUERY
+        assert job_info.state == BulkJobState.OPEN
+        assert job_info.content_type == DataFormat.CSV
+        assert job_info.compression == CompressionType.GZIP
+        assert job_info.system_modstamp == datetime(2024, 1, 2, tzinfo=UTC)
+        assert job_info.job_type == "V2Query"
+
+    def test_list_jobs(self, bulk_service: BulkJobService, mock_dynamodb_client: MagicMock) -> None:
         """Test listing bulk jobs for a tenant."""
         job1 = self._make_bulk_job_item("bulk-1", "tenant-123")
         job2 = self._make_bulk_job_item("bulk-2", "tenant-123")
-        mock_dynamodb_table.query.return_value = {"Items": [job1, job2]}
+        mock_dynamodb_client.query.return_value = {"Items": [_marshal(job1), _marshal(job2)]}
 
         jobs, _next_key = bulk_service.list_jobs("tenant-123")
 
         assert len(jobs) == 2
         assert jobs[0].id == "bulk-1"
+        assert jobs[0].created_at.isoformat() == job1["created_at"]
+
+    def test_list_jobs_with_filters(
+        self, bulk_service: BulkJobService, mock_dynamodb_client: MagicMock
+    ) -> None:
+        """Test state and operation filters become key conditions."""
+        mock_dynamodb_client.query.return_value = {
+            "Items": [],
+            "LastEvaluatedKey": {
+                "job_id": {"S": "bulk-9"},
+                "tenant_op": {"S": "tenant-123#insert"},
+                "state": {"S": "Open"},
+            },
+        }
+
+        _jobs, next_token = bulk_service.list_jobs(
+            "tenant-123", state=BulkJobState.OPEN, operation=BulkOperation.INSERT
+        )
+
+        params = mock_dynamodb_client.query.call_args.kwargs
+        assert params["IndexName"] == "tenant-op-state-index"
+        assert params["KeyConditionExpression"] == "tenant_op = :tenant_op AND #state = :state"
+        assert "FilterExpression" not in params
+        assert params["ExpressionAttributeValues"] == {
+            ":tenant_op": {"S": "tenant-123#insert"},
+            ":state": {"S": "Open"},
+        }
+
+        bulk_service.list_jobs("tenant-123", state=BulkJobState.OPEN)
+        params = mock_dynamodb_client.query.call_args.kwargs
+        assert params["IndexName"] == "gsi1-tenant-state"
+        assert params["KeyConditionExpression"] == "tenant_id = :tenant_id AND #state = :state"
+
+        bulk_service.list_jobs("tenant-123", operation=BulkOperation.INSERT)
+        params = mock_dynamodb_client.query.call_args.kwargs
+        assert params["KeyConditionExpression"] == "tenant_op = :tenant_op"
+        assert "FilterExpression" not in params
+
+        bulk_service.list_jobs(
+            "tenant-123",
+            state=BulkJobState.OPEN,
+            operation=BulkOperation.INSERT,
+            next_token=next_token,
+        )
+        assert mock_dynamodb_client.query.call_args.kwargs["ExclusiveStartKey"] == {
+            "job_id": {"S": "bulk-9"},
+            "tenant_op": {"S": "tenant-123#insert"},
+            "state": {"S": "Open"},
+        }
+
+    def test_list_jobs_next_token_is_url_safe(
+        self, bulk_service: BulkJobService, mock_dynamodb_client: MagicMock
+    ) -> None:
+        """Test that pagination tokens need no URL escaping."""
+        last_key = {
+            "job_id": {"S": "bulk-??>"},
+            "tenant_id": {"S": "tenant-123"},
+            "state": {"S": "Open"},
+        }
+        mock_dynamodb_client.query.return_value = {"Items": [], "LastEvaluatedKey": last_key}
+
+        _jobs, next_token = bulk_service.list_jobs("tenant-123")
+
+        assert next_token is not None
+        assert not set(next_token) & set("+/=")
+
+        bulk_service.list_jobs("tenant-123", next_token=next_token)
+        assert mock_dynamodb_client.query.call_args.kwargs["ExclusiveStartKey"] == last_key
+
+    @pytest.mark.parametrize(
+        "next_token",
+        [
+            "a",
+            "%%%",
+            base64.urlsafe_b64encode(b"\xff\xfe").decode(),
+            base64.urlsafe_b64encode(b"[1, 2]").decode(),
+            # Key of an index listings no longer use
+            base64.urlsafe_b64encode(
+                json.dumps(
+                    {
+                        "job_id": {"S": "bulk-1"},
+                        "tenant_id": {"S": "tenant-123"},
+                        "state_op": {"S": "Open#insert"},
+                    }
+                ).encode()
+            ).decode(),
+            # Another tenant's key
+            base64.urlsafe_b64encode(
+                json.dumps(
+                    {
+                        "job_id": {"S": "bulk-1"},
+                        "tenant_id": {"S": "tenant-456"},
+                        "state": {"S": "Open"},
+                    }
+                ).encode()
+            ).decode(),
+        ],
+    )
+    def test_list_jobs_rejects_invalid_next_token(
+        self, bulk_service: BulkJobService, mock_dynamodb_client: MagicMock, next_token: str
+    ) -> None:
+        """Test that tokens which cannot resume this listing are rejected before querying."""
+        with pytest.raises(InvalidPageTokenError):
+            bulk_service.list_jobs("tenant-123", next_token=next_token)
+
+        mock_dynamodb_client.query.assert_not_called()
 
     def _make_bulk_job_item(self, job_id: str, tenant_id: str) -> dict[str, Any]:
         """Create a sample bulk job item for testing."""
@@ -222,6 +487,146 @@ class TestBulkJobService:
             "ttl": int(now.timestamp() + 86400 * 7),
         }
 
+    def test_list_result_files(
+        self,
+        bulk_service: BulkJobService,
+        mock_dynamodb_client: MagicMock,
+        mock_s3_client: MagicMock,
+    ) -> None:
+        """Test listing result files with presigned download URLs."""
+        now = datetime.now(UTC)
+        mock_dynamodb_client.get_item.return_value = {
+            "Item": _marshal(
+                {
+                    "job_id": "bulk-123",
+                    "tenant_id": "tenant-123",
+                    "operation": "query",
+                    "state": "JobComplete",
+                    "created_at": now.isoformat(),
+                    "updated_at": now.isoformat(),
+                }
+            )
+        }
+        mock_s3_client.get_paginator.return_value.paginate.return_value = [
+            {
+                "Contents": [
+                    {
+                        "Key": "bulk/tenant-123/bulk-123/results/part-0.csv",
+                        "Size": 10,
+                        "LastModified": now,
+                    },
+                ]
+            },
+            {
+                "Contents": [
+                    {
+                        "Key": "bulk/tenant-123/bulk-123/results/part-1.csv",
+                        "Size": 20,
+                        "LastModified": now,
+                    },
+                ]
+            },
+            {},
+        ]
+        mock_s3_client.generate_presigned_url.side_effect = lambda _op, Params, **_kwargs: (
+            f"https://signed/{Params['Key']}"
+        )
+
+        files = bulk_service.list_result_files("bulk-123", "tenant-123")
+
+        assert [f["size"] for f in files] == [10, 20]
+        assert (
+            files[1]["download_url"] == "https://signed/bulk/tenant-123/bulk-123/results/part-1.csv"
+        )
+        assert files[0]["last_modified"] == now.isoformat()
+        mock_s3_client.get_paginator.assert_called_once_with("list_objects_v2")
+
+    def test_get_download_url_with_fetched_job(
+        self,
+        bulk_service: BulkJobService,
+        mock_dynamodb_client: MagicMock,
+        mock_s3_client: MagicMock,
+    ) -> None:
+        """Test a caller-supplied job skips the lookup but still checks the tenant."""
+        item = {**self._make_bulk_job_item("bulk-123", "tenant-123"), "state": "JobComplete"}
+        job = bulk_service._item_to_job_info(item)
+        mock_s3_client.generate_presigned_url.return_value = "https://signed"
+
+        url = bulk_service.get_download_url("bulk-123", "tenant-123", job=job)
+
+        assert url == "https://signed"
+        mock_dynamodb_client.get_item.assert_not_called()
+        assert mock_s3_client.generate_presigned_url.call_args.kwargs["Params"]["Key"] == (
+            "bulk/tenant-123/bulk-123/results/data.csv.gz"
+        )
+        with pytest.raises(BulkJobNotFoundError):
+            bulk_service.get_download_url("bulk-123", "other-tenant", job=job)
+
+    def test_iter_result_files_is_lazy(
+        self,
+        bulk_service: BulkJobService,
+        mock_dynamodb_client: MagicMock,
+        mock_s3_client: MagicMock,
+    ) -> None:
+        """Test files are presigned only as the iterator is consumed."""
+        now = datetime.now(UTC)
+        mock_dynamodb_client.get_item.return_value = {
+            "Item": _marshal(
+                {
+                    "job_id": "bulk-123",
+                    "tenant_id": "tenant-123",
+                    "operation": "query",
+                    "state": "JobComplete",
+                    "created_at": now.isoformat(),
+                    "updated_at": now.isoformat(),
+                }
+            )
+        }
+        mock_s3_client.get_paginator.return_value.paginate.return_value = [
+            {
+                "Contents": [
+                    {"Key": f"results/part-{i}.csv", "Size": i, "LastModified": now}
+                    for i in range(3)
+                ]
+            }
+        ]
+
+        files = bulk_service.iter_result_files("bulk-123", "tenant-123")
+
+        mock_dynamodb_client.get_item.assert_called_once()
+        mock_s3_client.generate_presigned_url.assert_not_called()
+        assert next(files)["key"] == "results/part-0.csv"
+        assert mock_s3_client.generate_presigned_url.call_count == 1
+
+    def test_iter_result_files_validates_job_eagerly(
+        self, bulk_service: BulkJobService, mock_dynamodb_client: MagicMock
+    ) -> None:
+        """Test a missing job is reported before iteration starts."""
+        mock_dynamodb_client.get_item.return_value = {}
+
+        with pytest.raises(BulkJobNotFoundError):
+            bulk_service.iter_result_files("bulk-missing", "tenant-123")
+
+    def test_update_job_progress_uses_atomic_add(
+        self, bulk_service: BulkJobService, mock_dynamodb_table: MagicMock
+    ) -> None:
+        """Test progress counters are incremented with ADD."""
+        bulk_service.update_job_progress("bulk-123", records_processed=10, error_message="bad row")
+
+        update_kwargs = mock_dynamodb_table.update_item.call_args.kwargs
+        assert update_kwargs["UpdateExpression"].startswith(
+            "ADD number_records_processed :processed, number_records_failed :failed SET"
+        )
+        assert update_kwargs["ExpressionAttributeValues"][":error"] == "bad row"
+
+    def test_update_job_progress_skips_empty_update(
+        self, bulk_service: BulkJobService, mock_dynamodb_table: MagicMock
+    ) -> None:
+        """Test nothing is written when there is no progress to record."""
+        bulk_service.update_job_progress("bulk-123")
+
+        mock_dynamodb_table.update_item.assert_not_called()
+
 
 class TestBulkJobStateTransitions:
     """Tests for bulk job state transitions."""
@@ -236,9 +641,17 @@ class TestBulkJobStateTransitions:
         """Create a mock S3 client."""
         return MagicMock()
 
+    @pytest.fixture
+    def mock_dynamodb_client(self) -> MagicMock:
+        """Create a mock low-level DynamoDB client."""
+        return MagicMock()
+
     @pytest.fixture
     def bulk_service(
-        self, mock_dynamodb_table: MagicMock, mock_s3_client: MagicMock
+        self,
+        mock_dynamodb_table: MagicMock,
+        mock_dynamodb_client: MagicMock,
+        mock_s3_client: MagicMock,
     ) -> BulkJobService:
         """Create a BulkJobService with mocked dependencies."""
         with patch("boto3.resource") as mock_resource, patch("boto3.client") as mock_client:
@@ -246,11 +659,15 @@ class TestBulkJobStateTransitions:
             mock_client.return_value = mock_s3_client
             service = BulkJobService()
             service.table = mock_dynamodb_table
+            service.dynamodb_client = mock_dynamodb_client
             service.s3_client = mock_s3_client
             return service
 
     def test_update_job_state_open_to_upload_complete(
-        self, bulk_service: BulkJobService, mock_dynamodb_table: MagicMock
+        self,
+        bulk_service: BulkJobService,
+        mock_dynamodb_table: MagicMock,
+        mock_dynamodb_client: MagicMock,
     ) -> None:
         """Test transitioning from Open to UploadComplete."""
         now = datetime.now(UTC)
@@ -267,8 +684,6 @@ class TestBulkJobStateTransitions:
             "created_at": now.isoformat(),
             "updated_at": now.isoformat(),
         }
-        # Mock get_item for get_job call
-        mock_dynamodb_table.get_item.return_value = {"Item": current_job}
         # Mock update_item for state transition
         updated_job = {**current_job, "state": "UploadComplete"}
         mock_dynamodb_table.update_item.return_value = {"Attributes": updated_job}
@@ -281,6 +696,122 @@ class TestBulkJobStateTransitions:
 
         assert job_info.state == BulkJobState.UPLOAD_COMPLETE
         mock_dynamodb_table.update_item.assert_called_once()
+        update_kwargs = mock_dynamodb_table.update_item.call_args.kwargs
+        assert update_kwargs["ExpressionAttributeValues"] == {
+            ":state": "UploadComplete",
+            ":now": update_kwargs["ExpressionAttributeValues"][":now"],
+            ":tenant_id": "tenant-123",
+            ":from0": "Open",
+        }
+        # Transition is enforced by the update's condition, not a prior read
+        mock_dynamodb_client.get_item.assert_not_called()
+
+    @pytest.mark.parametrize(
+        ("current", "new", "expected"),
+        [
+            (BulkJobState.OPEN, BulkJobState.UPLOAD_COMPLETE, True),
+            (BulkJobState.OPEN, BulkJobState.IN_PROGRESS, False),
+            (BulkJobState.IN_PROGRESS, BulkJobState.FAILED, True),
+            (BulkJobState.UPLOAD_COMPLETE, BulkJobState.ABORTED, True),
+            (BulkJobState.JOB_COMPLETE, BulkJobState.ABORTED, False),
+            (BulkJobState.ABORTED, BulkJobState.OPEN, False),
+        ],
+    )
+    def test_is_valid_transition(
+        self, current: BulkJobState, new: BulkJobState, expected: bool
+    ) -> None:
+        """Test the precomputed transition table."""
+        assert BulkJobService._is_valid_transition(current, new) is expected
+
+    @pytest.mark.parametrize(
+        ("method", "expected_state"),
+        [("close_job", "UploadComplete"), ("abort_job", "Aborted")],
+    )
+    def test_close_and_abort_write_once(
+        self,
+        bulk_service: BulkJobService,
+        mock_dynamodb_table: MagicMock,
+        mock_dynamodb_client: MagicMock,
+        method: str,
+        expected_state: str,
+    ) -> None:
+        """Test closing or aborting a job is a single conditional write."""
+        now = datetime.now(UTC).isoformat()
+        mock_dynamodb_table.update_item.return_value = {
+            "Attributes": {
+                "job_id": "bulk-123",
+                "tenant_id": "tenant-123",
+                "operation": "upsert",
+                "state": expected_state,
+                "created_at": now,
+                "updated_at": now,
+            }
+        }
+
+        job_info = getattr(bulk_service, method)("bulk-123", "tenant-123")
+
+        assert job_info.state == expected_state
+        mock_dynamodb_table.update_item.assert_called_once()
+        mock_dynamodb_client.get_item.assert_not_called()
+
+    def test_update_job_state_invalid_transition(
+        self,
+        bulk_service: BulkJobService,
+        mock_dynamodb_table: MagicMock,
+        mock_dynamodb_client: MagicMock,
+    ) -> None:
+        """Test a failed condition on an existing job raises BulkJobStateError."""
+        now = datetime.now(UTC)
+        mock_dynamodb_table.update_item.side_effect = ClientError(
+            {"Error": {"Code": "ConditionalCheckFailedException", "Message": "failed"}},
+            "UpdateItem",
+        )
+        mock_dynamodb_client.get_item.return_value = {
+            "Item": _marshal(
+                {
+                    "job_id": "bulk-123",
+                    "tenant_id": "tenant-123",
+                    "operation": "insert",
+                    "state": "Open",
+                    "created_at": now.isoformat(),
+                    "updated_at": now.isoformat(),
+                }
+            )
+        }
+
+        with pytest.raises(BulkJobStateError) as exc_info:
+            bulk_service.update_job_state(
+                job_id="bulk-123",
+                tenant_id="tenant-123",
+                new_state=BulkJobState.JOB_COMPLETE,
+            )
+
+        assert exc_info.value.current_state == "Open"
+        update_kwargs = mock_dynamodb_table.update_item.call_args.kwargs
+        assert update_kwargs["ConditionExpression"] == (
+            "tenant_id = :tenant_id AND #state IN (:from0)"
+        )
+        assert update_kwargs["ExpressionAttributeValues"][":from0"] == "InProgress"
+
+    def test_update_job_state_missing_job(
+        self,
+        bulk_service: BulkJobService,
+        mock_dynamodb_table: MagicMock,
+        mock_dynamodb_client: MagicMock,
+    ) -> None:
+        """Test a failed condition on a missing job raises BulkJobNotFoundError."""
+        mock_dynamodb_table.update_item.side_effect = ClientError(
+            {"Error": {"Code": "ConditionalCheckFailedException", "Message": "failed"}},
+            "UpdateItem",
+        )
+        mock_dynamodb_client.get_item.return_value = {}
+
+        with pytest.raises(BulkJobNotFoundError):
+            bulk_service.update_job_state(
+                job_id="bulk-missing",
+                tenant_id="tenant-123",
+                new_state=BulkJobState.ABORTED,
+            )
 
 
 class TestBulkJobExceptions:
@@ -4,13 +4,29 @@ Tests for the ExportService class that handles S3 export operations.
 """
 
 import json
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 from unittest.mock import MagicMock, patch
 
 import pytest
+from boto3.exceptions import S3UploadFailedError
 from botocore.exceptions import ClientError
 
-from spectra.services.export import ExportError, ExportService
+from spectra.services.export import ExportError, ExportService, _date_prefix
+
+
+def _put_body(mock_s3_client: MagicMock) -> bytes:
+    """Return the body passed to the mocked put_object."""
+    return mock_s3_client.put_object.call_args.kwargs["Body"]
+
+
+def _capture_uploads(mock_s3_client: MagicMock) -> list[bytes]:
+    """Collect bodies passed to the mocked upload_fileobj while they are still open."""
+    bodies: list[bytes] = []
+    mock_s3_client.upload_fileobj.side_effect = lambda fileobj, *_args, **_kwargs: bodies.append(
+        fileobj.read()
+    )
+    return bodies
+
 
 # =============================================================================
 # ExportService Tests
@@ -22,8 +38,10 @@ class TestExportService:
 
     @pytest.fixture
     def mock_s3_client(self) -> MagicMock:
-        """Create a mock S3 client."""
-        return MagicMock()
+        """Create a mock S3 client whose buckets live in the default region."""
+        client = MagicMock()
+        client.get_bucket_location.return_value = {"LocationConstraint": None}
+        return client
 
     @pytest.fixture
     def export_service(self, mock_s3_client: MagicMock) -> ExportService:
@@ -38,8 +56,6 @@ class TestExportService:
         self, export_service: ExportService, mock_s3_client: MagicMock
     ) -> None:
         """Test writing JSON results to S3."""
-        mock_s3_client.put_object.return_value = {}
-
         data = [
             {"id": 1, "name": "Alice", "amount": 100.50},
             {"id": 2, "name": "Bob", "amount": 200.75},
@@ -55,20 +71,56 @@ class TestExportService:
         assert "job-123" in s3_uri
         assert s3_uri.endswith(".json")
         mock_s3_client.put_object.assert_called_once()
+        mock_s3_client.upload_fileobj.assert_not_called()
+        call_kwargs = mock_s3_client.put_object.call_args.kwargs
+        assert call_kwargs["ContentType"] == "application/json"
+        assert call_kwargs["Metadata"]["row_count"] == "2"
 
         # Verify the body is valid JSON with expected structure
-        call_args = mock_s3_client.put_object.call_args
-        body = call_args.kwargs["Body"]
-        parsed = json.loads(body.decode("utf-8"))
+        parsed = json.loads(_put_body(mock_s3_client))
         assert parsed["row_count"] == 2
         assert len(parsed["data"]) == 2
 
+    def test_write_json_results_streams_large_results(
+        self, export_service: ExportService, mock_s3_client: MagicMock
+    ) -> None:
+        """Test that results above the buffered limit go through a managed upload."""
+        bodies = _capture_uploads(mock_s3_client)
+        data = [{"id": 1, "name": "Alice"}, {"id": 2, "name": "Bob"}]
+
+        with patch("spectra.services.export._JSON_BUFFERED_MAX_ROWS", 1):
+            export_service.write_json_results(
+                job_id="job-123",
+                tenant_id="tenant-456",
+                data=data,
+            )
+
+        mock_s3_client.put_object.assert_not_called()
+        extra_args = mock_s3_client.upload_fileobj.call_args.kwargs["ExtraArgs"]
+        assert extra_args["ContentType"] == "application/json"
+        assert extra_args["Metadata"]["row_count"] == "2"
+        parsed = json.loads(bodies[0].decode("utf-8"))
+        assert parsed["data"] == data
+
+    def test_write_json_results_without_orjson(
+        self, export_service: ExportService, mock_s3_client: MagicMock
+    ) -> None:
+        """Test that the stdlib encoder produces the same output as orjson."""
+        created = datetime(2024, 1, 15, 10, 30, tzinfo=UTC)
+        data = [{"id": 1, "name": "Zoë", "created": created}]
+
+        export_service.write_json_results(job_id="job-123", tenant_id="tenant-456", data=data)
+        with patch("spectra.services.export.orjson", None):
+            export_service.write_json_results(job_id="job-123", tenant_id="tenant-456", data=data)
+
+        bodies = [call.kwargs["Body"] for call in mock_s3_client.put_object.call_args_list]
+        encoded_data = '"data":[{"id":1,"name":"Zoë","created":"2024-01-15 10:30:00+00:00"}]'
+        assert all(encoded_data.encode("utf-8") in body for body in bodies)
+
     def test_write_json_results_with_metadata(
         self, export_service: ExportService, mock_s3_client: MagicMock
     ) -> None:
         """Test writing JSON results with custom metadata."""
-        mock_s3_client.put_object.return_value = {}
-
         data = [{"id": 1}]
         metadata = {"source": "dashboard", "user": "admin"}
 
@@ -79,9 +131,7 @@ class TestExportService:
             metadata=metadata,
         )
 
-        call_args = mock_s3_client.put_object.call_args
-        body = call_args.kwargs["Body"]
-        parsed = json.loads(body.decode("utf-8"))
+        parsed = json.loads(_put_body(mock_s3_client))
         assert parsed["metadata"] == metadata
 
     def test_write_json_results_error(
@@ -100,11 +150,29 @@ class TestExportService:
                 data=[{"id": 1}],
             )
 
+    def test_write_json_results_stream_error(
+        self, export_service: ExportService, mock_s3_client: MagicMock
+    ) -> None:
+        """Test handling of a failed managed upload when streaming JSON."""
+        mock_s3_client.upload_fileobj.side_effect = S3UploadFailedError(
+            "Failed to upload: An error occurred (AccessDenied)"
+        )
+
+        with (
+            patch("spectra.services.export._JSON_BUFFERED_MAX_ROWS", 0),
+            pytest.raises(ExportError, match="Failed to export"),
+        ):
+            export_service.write_json_results(
+                job_id="job-123",
+                tenant_id="tenant-456",
+                data=[{"id": 1}],
+            )
+
     def test_write_csv_results(
         self, export_service: ExportService, mock_s3_client: MagicMock
     ) -> None:
         """Test writing CSV results to S3."""
-        mock_s3_client.put_object.return_value = {}
+        bodies = _capture_uploads(mock_s3_client)
 
         columns = ["id", "name", "amount"]
         data = [
@@ -121,11 +189,13 @@ class TestExportService:
 
         assert s3_uri.startswith("s3://")
         assert s3_uri.endswith(".csv")
-        mock_s3_client.put_object.assert_called_once()
+        mock_s3_client.upload_fileobj.assert_called_once()
+        extra_args = mock_s3_client.upload_fileobj.call_args.kwargs["ExtraArgs"]
+        assert extra_args["ContentType"] == "text/csv"
+        assert extra_args["Metadata"]["row_count"] == "2"
 
         # Verify the CSV content
-        call_args = mock_s3_client.put_object.call_args
-        body = call_args.kwargs["Body"].decode("utf-8")
+        body = bodies[0].decode("utf-8")
         lines = body.strip().replace("\r\n", "\n").replace("\r", "\n").split("\n")
         assert lines[0] == "id,name,amount"
         assert len(lines) == 3  # header + 2 data rows
@@ -134,9 +204,8 @@ class TestExportService:
         self, export_service: ExportService, mock_s3_client: MagicMock
     ) -> None:
         """Test handling of S3 error when writing CSV."""
-        mock_s3_client.put_object.side_effect = ClientError(
-            {"Error": {"Code": "AccessDenied", "Message": "Access Denied"}},
-            "PutObject",
+        mock_s3_client.upload_fileobj.side_effect = S3UploadFailedError(
+            "Failed to upload: An error occurred (AccessDenied)"
         )
 
         with pytest.raises(ExportError):
@@ -147,6 +216,112 @@ class TestExportService:
                 data=[{"id": 1}],
             )
 
+    def test_write_csv_results_from_generator(
+        self, export_service: ExportService, mock_s3_client: MagicMock
+    ) -> None:
+        """Test that CSV rows can be produced lazily by a generator."""
+        bodies = _capture_uploads(mock_s3_client)
+
+        export_service.write_csv_results(
+            job_id="job-123",
+            tenant_id="tenant-456",
+            columns=["id"],
+            data=({"id": i} for i in range(3)),
+        )
+
+        extra_args = mock_s3_client.upload_fileobj.call_args.kwargs["ExtraArgs"]
+        assert extra_args["Metadata"]["row_count"] == "3"
+        assert bodies[0].decode("utf-8").split("\r\n") == ["id", "0", "1", "2", ""]
+
+    def test_write_csv_results_row_shapes(
+        self, export_service: ExportService, mock_s3_client: MagicMock
+    ) -> None:
+        """Test dict rows are projected onto the columns and sequences written as-is."""
+        bodies = _capture_uploads(mock_s3_client)
+
+        export_service.write_csv_results(
+            job_id="job-123",
+            tenant_id="tenant-456",
+            columns=["id", "name"],
+            data=[{"name": "a", "id": 1, "extra": "x"}, {"id": 2}, [3, "c"], (4, "d")],
+        )
+
+        assert bodies[0].decode("utf-8").split("\r\n") == [
+            "id,name",
+            "1,a",
+            "2,",
+            "3,c",
+            "4,d",
+            "",
+        ]
+
+    def test_export_results_positional_rows_parquet(
+        self, export_service: ExportService, mock_s3_client: MagicMock
+    ) -> None:
+        """Test positional rows are written to Parquet column-wise."""
+        import pyarrow.parquet as pq
+
+        mock_s3_client.head_object.return_value = {"ContentLength": 10}
+
+        export_service.export_results(
+            job_id="job-123",
+            tenant_id="tenant-456",
+            results={
+                "column_info": [{"name": "id"}, {"name": "name"}],
+                "records": [[1, "a"], [2, None]],
+            },
+            format="parquet",
+        )
+
+        written = pq.read_table(mock_s3_client.put_object.call_args.kwargs["Body"])
+        assert written.to_pydict() == {"id": [1, 2], "name": ["a", None]}
+
+    def test_write_arrow_results_parquet(
+        self, export_service: ExportService, mock_s3_client: MagicMock
+    ) -> None:
+        """Test writing an Arrow table to S3 as Parquet."""
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        table = pa.table({"id": ["1", "2"], "name": ["Alice", None]})
+
+        s3_uri = export_service.write_arrow_results(
+            job_id="job-123", tenant_id="tenant-456", table=table, format="parquet"
+        )
+
+        assert s3_uri.endswith("results.parquet")
+        call_args = mock_s3_client.put_object.call_args
+        assert call_args.kwargs["Metadata"]["row_count"] == "2"
+        written = pq.read_table(call_args.kwargs["Body"])
+        assert written.to_pylist() == table.to_pylist()
+
+    def test_write_arrow_results_csv(
+        self, export_service: ExportService, mock_s3_client: MagicMock
+    ) -> None:
+        """Test writing an Arrow table to S3 as CSV."""
+        import pyarrow as pa
+
+        table = pa.table({"id": ["1"], "name": ["Alice"]})
+
+        s3_uri = export_service.write_arrow_results(
+            job_id="job-123", tenant_id="tenant-456", table=table, format="csv"
+        )
+
+        assert s3_uri.endswith("results.csv")
+        call_args = mock_s3_client.put_object.call_args
+        assert call_args.kwargs["ContentType"] == "text/csv"
+        body = call_args.kwargs["Body"].read()
+        assert body.decode("utf-8").splitlines()[0] == '"id","name"'
+
+    def test_write_arrow_results_unsupported_format(self, export_service: ExportService) -> None:
+        """Test Arrow export rejects formats other than Parquet and CSV."""
+        import pyarrow as pa
+
+        with pytest.raises(ExportError, match="Unsupported"):
+            export_service.write_arrow_results(
+                job_id="job-123", tenant_id="tenant-456", table=pa.table({}), format="json"
+            )
+
     def test_generate_presigned_url(
         self, export_service: ExportService, mock_s3_client: MagicMock
     ) -> None:
@@ -181,6 +356,35 @@ class TestExportService:
         # Should use settings.presigned_url_expiry as default
         mock_s3_client.generate_presigned_url.assert_called_once()
 
+    def test_generate_presigned_url_reuses_cached_url(
+        self, export_service: ExportService, mock_s3_client: MagicMock
+    ) -> None:
+        """Test a presigned URL is reused while most of its lifetime remains."""
+        mock_s3_client.generate_presigned_url.side_effect = ["https://url/1", "https://url/2"]
+
+        first = export_service.generate_presigned_url("s3://bucket/key.json", expiry_seconds=3600)
+        second = export_service.generate_presigned_url("s3://bucket/key.json", expiry_seconds=3600)
+
+        assert first == second
+        mock_s3_client.generate_presigned_url.assert_called_once()
+
+    def test_generate_presigned_url_refreshes_aging_url(
+        self, export_service: ExportService, mock_s3_client: MagicMock
+    ) -> None:
+        """Test a cached URL past half its lifetime is re-signed."""
+        mock_s3_client.generate_presigned_url.side_effect = ["https://url/1", "https://url/2"]
+        export_service.generate_presigned_url("s3://bucket/key.json", expiry_seconds=3600)
+
+        aged = datetime.now(UTC) + timedelta(minutes=31)
+        with patch("spectra.services.export.datetime") as mock_datetime:
+            mock_datetime.now.return_value = aged
+            url, expires_at = export_service.generate_presigned_url(
+                "s3://bucket/key.json", expiry_seconds=3600
+            )
+
+        assert url == "https://url/2"
+        assert expires_at == aged + timedelta(seconds=3600)
+
     def test_generate_presigned_url_error(
         self, export_service: ExportService, mock_s3_client: MagicMock
     ) -> None:
@@ -195,6 +399,51 @@ class TestExportService:
                 s3_uri="s3://bucket/key.json",
             )
 
+    def test_generate_presigned_url_other_region_bucket(
+        self, export_service: ExportService, mock_s3_client: MagicMock
+    ) -> None:
+        """Test buckets in another region are signed by a client for that region."""
+        mock_s3_client.get_bucket_location.return_value = {"LocationConstraint": "eu-west-2"}
+        regional_client = MagicMock()
+        regional_client.generate_presigned_url.side_effect = ["https://url/1", "https://url/2"]
+
+        with patch(
+            "spectra.services.export.get_client", return_value=regional_client
+        ) as mock_get_client:
+            export_service.generate_presigned_url("s3://eu-bucket/a.json")
+            export_service.generate_presigned_url("s3://eu-bucket/b.json")
+
+        mock_get_client.assert_called_with("s3", "eu-west-2")
+        mock_s3_client.get_bucket_location.assert_called_once_with(Bucket="eu-bucket")
+        mock_s3_client.generate_presigned_url.assert_not_called()
+        assert regional_client.generate_presigned_url.call_count == 2
+
+    def test_failed_region_lookup_is_not_cached(
+        self, export_service: ExportService, mock_s3_client: MagicMock
+    ) -> None:
+        """Test a failed location lookup falls back once and is retried next time."""
+        mock_s3_client.get_bucket_location.side_effect = [
+            ClientError({"Error": {"Code": "SlowDown", "Message": "Slow"}}, "GetBucketLocation"),
+            {"LocationConstraint": "eu-west-2"},
+        ]
+        regional_client = MagicMock()
+
+        with patch("spectra.services.export.get_client", return_value=regional_client):
+            assert export_service._client_for_bucket("eu-bucket") is mock_s3_client
+            assert export_service._client_for_bucket("eu-bucket") is regional_client
+            assert export_service._client_for_bucket("eu-bucket") is regional_client
+
+        assert mock_s3_client.get_bucket_location.call_count == 2
+
+    def test_export_bucket_skips_region_lookup(
+        self, export_service: ExportService, mock_s3_client: MagicMock
+    ) -> None:
+        """Test the export bucket uses the default client without a location lookup."""
+        export_service.delete_export("s3://test-bucket/results/job-123.json")
+
+        mock_s3_client.get_bucket_location.assert_not_called()
+        mock_s3_client.delete_object.assert_called_once()
+
     def test_get_object_info(
         self, export_service: ExportService, mock_s3_client: MagicMock
     ) -> None:
@@ -212,14 +461,113 @@ class TestExportService:
         assert info.get("size_bytes") == 1024
         mock_s3_client.head_object.assert_called_once()
 
+    def test_list_exports(self, export_service: ExportService, mock_s3_client: MagicMock) -> None:
+        """Test an export page uses a single LIST call and returns the next token."""
+        mock_s3_client.list_objects_v2.return_value = {
+            "Contents": [
+                {
+                    "Key": "exports/tenant-456/a.json",
+                    "Size": 10,
+                    "LastModified": datetime(2024, 1, 15, tzinfo=UTC),
+                }
+            ],
+            "NextContinuationToken": "token-2",
+        }
+
+        exports, next_token = export_service.list_exports_page("tenant-456", next_token="token-1")
+
+        assert next_token == "token-2"
+        assert exports[0]["size_bytes"] == 10
+        assert "content_type" not in exports[0]
+        assert mock_s3_client.list_objects_v2.call_args.kwargs["ContinuationToken"] == "token-1"
+        mock_s3_client.head_object.assert_not_called()
+
+        # list_exports keeps returning a plain list of the first page
+        assert export_service.list_exports("tenant-456") == exports
+        assert "ContinuationToken" not in mock_s3_client.list_objects_v2.call_args.kwargs
+
+    def test_list_exports_fetch_metadata(
+        self, export_service: ExportService, mock_s3_client: MagicMock
+    ) -> None:
+        """Test metadata is fetched per object only when requested."""
+        mock_s3_client.list_objects_v2.return_value = {
+            "Contents": [
+                {"Key": key, "Size": 1, "LastModified": datetime(2024, 1, 15, tzinfo=UTC)}
+                for key in ("exports/tenant-456/a.csv", "exports/tenant-456/gone.csv")
+            ],
+        }
+
+        def head_object(Bucket: str, Key: str) -> dict:
+            if Key.endswith("gone.csv"):
+                raise ClientError({"Error": {"Code": "404", "Message": "Not Found"}}, "HeadObject")
+            return {"ContentType": "text/csv", "Metadata": {"job_id": "job-1"}}
+
+        mock_s3_client.head_object.side_effect = head_object
+
+        exports, next_token = export_service.list_exports_page("tenant-456", fetch_metadata=True)
+
+        assert next_token is None
+        assert exports[0]["content_type"] == "text/csv"
+        assert exports[0]["metadata"] == {"job_id": "job-1"}
+        assert "content_type" not in exports[1]
+        assert mock_s3_client.head_object.call_count == 2
+
+    def test_iter_exports_streams_pages(
+        self, export_service: ExportService, mock_s3_client: MagicMock
+    ) -> None:
+        """Test exports are yielded page by page through the paginator."""
+        pages = [
+            {"Contents": [{"Key": "exports/tenant-456/a.json", "Size": 1, "LastModified": None}]},
+            {},
+            {"Contents": [{"Key": "exports/tenant-456/b.json", "Size": 2, "LastModified": None}]},
+        ]
+        paginator = mock_s3_client.get_paginator.return_value
+        paginator.paginate.return_value = iter(pages)
+
+        exports = export_service.iter_exports("tenant-456", page_size=500)
+
+        first = next(exports)
+        assert first["s3_uri"] == "s3://test-bucket/exports/tenant-456/a.json"
+        assert [e["size_bytes"] for e in exports] == [2]
+        mock_s3_client.get_paginator.assert_called_once_with("list_objects_v2")
+        assert paginator.paginate.call_args.kwargs["PaginationConfig"] == {"PageSize": 500}
+        mock_s3_client.list_objects_v2.assert_not_called()
+
+    def test_export_via_unload(self, export_service: ExportService) -> None:
+        """Test UNLOAD exports write under the job prefix and return it as the location."""
+        export_service.settings = export_service.settings.model_copy(
+            update={"unload_iam_role_arn": "arn:aws:iam::123456789012:role/unload"}
+        )
+
+        with patch("spectra.services.export.RedshiftService") as mock_redshift:
+            mock_redshift.return_value.execute_unload.return_value = "stmt-1"
+            result = export_service.export_via_unload(
+                "job-123", "tenant-456", "SELECT 1", "user_tenant_456", format="csv"
+            )
+
+        assert result["statement_id"] == "stmt-1"
+        assert result["format"] == "CSV"
+        assert result["location"] == export_service.build_unload_path("tenant-456", "job-123")
+        kwargs = mock_redshift.return_value.execute_unload.call_args.kwargs
+        assert kwargs["s3_path"] == result["location"]
+        assert kwargs["file_format"] == "CSV"
+        assert kwargs["max_file_size_mb"] == 512
+
+    def test_export_via_unload_requires_role(self, export_service: ExportService) -> None:
+        """Test UNLOAD exports fail clearly when no IAM role is configured."""
+        with pytest.raises(ExportError, match="unload_iam_role_arn"):
+            export_service.export_via_unload("job-123", "tenant-456", "SELECT 1", "user")
+
 
 class TestExportServiceEdgeCases:
     """Tests for ExportService edge cases."""
 
     @pytest.fixture
     def mock_s3_client(self) -> MagicMock:
-        """Create a mock S3 client."""
-        return MagicMock()
+        """Create a mock S3 client whose buckets live in the default region."""
+        client = MagicMock()
+        client.get_bucket_location.return_value = {"LocationConstraint": None}
+        return client
 
     @pytest.fixture
     def export_service(self, mock_s3_client: MagicMock) -> ExportService:
@@ -234,17 +582,13 @@ class TestExportServiceEdgeCases:
         self, export_service: ExportService, mock_s3_client: MagicMock
     ) -> None:
         """Test writing empty JSON results."""
-        mock_s3_client.put_object.return_value = {}
-
         export_service.write_json_results(
             job_id="job-123",
             tenant_id="tenant-456",
             data=[],
         )
 
-        call_args = mock_s3_client.put_object.call_args
-        body = call_args.kwargs["Body"]
-        parsed = json.loads(body.decode("utf-8"))
+        parsed = json.loads(_put_body(mock_s3_client))
         assert parsed["row_count"] == 0
         assert parsed["data"] == []
 
@@ -252,7 +596,7 @@ class TestExportServiceEdgeCases:
         self, export_service: ExportService, mock_s3_client: MagicMock
     ) -> None:
         """Test writing empty CSV results."""
-        mock_s3_client.put_object.return_value = {}
+        bodies = _capture_uploads(mock_s3_client)
 
         export_service.write_csv_results(
             job_id="job-123",
@@ -261,8 +605,7 @@ class TestExportServiceEdgeCases:
             data=[],
         )
 
-        call_args = mock_s3_client.put_object.call_args
-        body = call_args.kwargs["Body"].decode("utf-8")
+        body = bodies[0].decode("utf-8")
         lines = body.strip().split("\n")
         assert len(lines) == 1  # Only header
 
@@ -270,8 +613,6 @@ class TestExportServiceEdgeCases:
         self, export_service: ExportService, mock_s3_client: MagicMock
     ) -> None:
         """Test writing JSON with special characters."""
-        mock_s3_client.put_object.return_value = {}
-
         data = [
             {"id": 1, "name": "Test 'quoted'", "description": "Line1\nLine2"},
             {"id": 2, "name": "Unicode: 日本語", "emoji": "🎉"},
@@ -283,16 +624,14 @@ class TestExportServiceEdgeCases:
             data=data,
         )
 
-        call_args = mock_s3_client.put_object.call_args
-        body = call_args.kwargs["Body"]
-        parsed = json.loads(body.decode("utf-8"))
+        parsed = json.loads(_put_body(mock_s3_client).decode("utf-8"))
         assert parsed["data"][1]["name"] == "Unicode: 日本語"
 
     def test_write_csv_special_characters(
         self, export_service: ExportService, mock_s3_client: MagicMock
     ) -> None:
         """Test writing CSV with special characters (quoting)."""
-        mock_s3_client.put_object.return_value = {}
+        bodies = _capture_uploads(mock_s3_client)
 
         data = [
             {"id": 1, "name": "Contains, comma"},
@@ -306,12 +645,30 @@ class TestExportServiceEdgeCases:
             data=data,
         )
 
-        call_args = mock_s3_client.put_object.call_args
-        body = call_args.kwargs["Body"].decode("utf-8")
+        body = bodies[0].decode("utf-8")
         # CSV should properly escape these
         assert '"Contains, comma"' in body or "Contains, comma" in body
 
 
+class TestDatePrefix:
+    """Tests for the cached key date prefix."""
+
+    def test_matches_strftime(self) -> None:
+        """Test the prefix matches the UTC date."""
+        assert _date_prefix() == datetime.now(UTC).strftime("%Y/%m/%d")
+
+    def test_refreshes_on_day_rollover(self) -> None:
+        """Test the cached prefix changes when the UTC day changes."""
+        midnight = datetime(2024, 2, 29, tzinfo=UTC).timestamp()
+
+        with patch("spectra.services.export.time.time", return_value=midnight - 1):
+            before = _date_prefix()
+        with patch("spectra.services.export.time.time", return_value=midnight):
+            after = _date_prefix()
+
+        assert (before, after) == ("2024/02/28", "2024/02/29")
+
+
 class TestExportExceptions:
     """Tests for export exception classes."""
 
@@ -8,6 +8,7 @@ from typing import Any
 from unittest.mock import MagicMock, patch
 
 import pytest
+from boto3.dynamodb.conditions import Key
 from botocore.exceptions import ClientError
 
 from spectra.models.job import JobError, JobResult, JobStatus
@@ -16,6 +17,7 @@ from spectra.services.job import (
     JobNotFoundError,
     JobService,
 )
+from spectra.utils.aws import serialize_item
 
 # =============================================================================
 # JobService Tests
@@ -31,12 +33,20 @@ class TestJobService:
         return MagicMock()
 
     @pytest.fixture
-    def job_service(self, mock_dynamodb_table: MagicMock) -> JobService:
+    def mock_dynamodb_client(self) -> MagicMock:
+        """Create a mock low-level DynamoDB client."""
+        return MagicMock()
+
+    @pytest.fixture
+    def job_service(
+        self, mock_dynamodb_table: MagicMock, mock_dynamodb_client: MagicMock
+    ) -> JobService:
         """Create a JobService with mocked dependencies."""
-        with patch("boto3.resource") as mock_resource:
+        with patch("boto3.resource") as mock_resource, patch("boto3.client"):
             mock_resource.return_value.Table.return_value = mock_dynamodb_table
             service = JobService()
             service.table = mock_dynamodb_table
+            service.dynamodb_client = mock_dynamodb_client
             return service
 
     def test_generate_job_id(self) -> None:
@@ -65,9 +75,22 @@ class TestJobService:
         assert hash1 != hash3
         assert len(hash1) == 16
 
-    def test_create_job(self, job_service: JobService, mock_dynamodb_table: MagicMock) -> None:
+    def test_hash_sql_batch_matches_hash_sql(self) -> None:
+        """Test batch hashing gives the same hashes as hashing one by one."""
+        sqls = ["SELECT 1", "select  1", "SELECT 2", "SELECT 1"]
+
+        assert JobService.hash_sql_batch(sqls) == [JobService.hash_sql(sql) for sql in sqls]
+
+    def test_hash_sql_normalizes_unicode_whitespace(self) -> None:
+        """Test that any whitespace run, including non-ASCII, hashes like a space."""
+        expected = JobService.hash_sql("select * from t")
+
+        assert JobService.hash_sql("SELECT\t*\nFROM\u00a0t ") == expected
+        assert JobService.hash_sql("select\x1c*\u2003from t") == expected
+
+    def test_create_job(self, job_service: JobService, mock_dynamodb_client: MagicMock) -> None:
         """Test creating a new job."""
-        mock_dynamodb_table.put_item.return_value = {}
+        mock_dynamodb_client.put_item.return_value = {}
 
         job = job_service.create_job(
             tenant_id="tenant-123",
@@ -83,13 +106,17 @@ class TestJobService:
         assert job.status == JobStatus.QUEUED
         assert job.sql == "SELECT * FROM sales LIMIT 100"
         assert job.db_user == "user_tenant_123"
-        mock_dynamodb_table.put_item.assert_called_once()
+        mock_dynamodb_client.put_item.assert_called_once()
+        call_kwargs = mock_dynamodb_client.put_item.call_args.kwargs
+        assert call_kwargs["ConditionExpression"] == "attribute_not_exists(job_id)"
+        assert call_kwargs["Item"]["tenant_id"] == {"S": "tenant-123"}
+        assert call_kwargs["Item"]["async_mode"] == {"BOOL": True}
 
     def test_create_job_with_metadata(
-        self, job_service: JobService, mock_dynamodb_table: MagicMock
+        self, job_service: JobService, mock_dynamodb_client: MagicMock
     ) -> None:
         """Test creating a job with custom metadata."""
-        mock_dynamodb_table.put_item.return_value = {}
+        mock_dynamodb_client.put_item.return_value = {}
 
         job = job_service.create_job(
             tenant_id="tenant-123",
@@ -119,10 +146,10 @@ class TestJobService:
         assert exc_info.value.existing_job_id == "existing-job-123"
 
     def test_create_job_with_batch_id(
-        self, job_service: JobService, mock_dynamodb_table: MagicMock
+        self, job_service: JobService, mock_dynamodb_client: MagicMock
     ) -> None:
         """Test creating a job with batch ID."""
-        mock_dynamodb_table.put_item.return_value = {}
+        mock_dynamodb_client.put_item.return_value = {}
 
         job = job_service.create_job(
             tenant_id="tenant-123",
@@ -132,32 +159,37 @@ class TestJobService:
         )
 
         assert job.batch_id == "batch-456"
+        item = mock_dynamodb_client.put_item.call_args.kwargs["Item"]
+        assert item["batch_shard"] == {"S": "batch-456#0"}
+        assert item["batch_shards"] == {"N": "1"}
 
-    def test_get_job_found(self, job_service: JobService, mock_dynamodb_table: MagicMock) -> None:
+    def test_get_job_found(self, job_service: JobService, mock_dynamodb_client: MagicMock) -> None:
         """Test getting an existing job."""
         job_data = self._make_job_item("job-123", "tenant-123")
-        mock_dynamodb_table.get_item.return_value = {"Item": job_data}
+        mock_dynamodb_client.get_item.return_value = {"Item": serialize_item(job_data)}
 
         job = job_service.get_job("job-123")
 
         assert job.job_id == "job-123"
         assert job.tenant_id == "tenant-123"
+        assert job.timeout_seconds == 900
+        assert mock_dynamodb_client.get_item.call_args.kwargs["Key"] == {"job_id": {"S": "job-123"}}
 
     def test_get_job_not_found(
-        self, job_service: JobService, mock_dynamodb_table: MagicMock
+        self, job_service: JobService, mock_dynamodb_client: MagicMock
     ) -> None:
         """Test getting a non-existent job."""
-        mock_dynamodb_table.get_item.return_value = {}
+        mock_dynamodb_client.get_item.return_value = {}
 
         with pytest.raises(JobNotFoundError):
             job_service.get_job("non-existent-job")
 
     def test_get_job_tenant_validation(
-        self, job_service: JobService, mock_dynamodb_table: MagicMock
+        self, job_service: JobService, mock_dynamodb_client: MagicMock
     ) -> None:
         """Test that tenant ID is validated when provided."""
         job_data = self._make_job_item("job-123", "tenant-123")
-        mock_dynamodb_table.get_item.return_value = {"Item": job_data}
+        mock_dynamodb_client.get_item.return_value = {"Item": serialize_item(job_data)}
 
         with pytest.raises(JobNotFoundError):
             job_service.get_job("job-123", tenant_id="different-tenant")
@@ -175,6 +207,7 @@ class TestJobService:
             job_id="job-123",
             status=JobStatus.SUBMITTED,
             statement_id="stmt-456",
+            echo=True,
         )
 
         assert job.status == JobStatus.SUBMITTED
@@ -298,25 +331,131 @@ class TestJobService:
         job1["batch_id"] = "batch-456"
         job2 = self._make_job_item("job-2", "tenant-123")
         job2["batch_id"] = "batch-456"
-        mock_dynamodb_table.query.return_value = {"Items": [job1, job2]}
+        pages = {
+            None: {"Items": [job1], "LastEvaluatedKey": {"job_id": "job-1"}},
+            "job-1": {"Items": [job2]},
+        }
+        mock_dynamodb_table.query.side_effect = lambda **kwargs: (
+            pages[kwargs.get("ExclusiveStartKey", {}).get("job_id")]
+            if kwargs["KeyConditionExpression"] == Key("batch_shard").eq("batch-456#0")
+            else {"Items": []}
+        )
 
         jobs = job_service.list_batch_jobs("batch-456", "tenant-123")
 
-        assert len(jobs) == 2
-        mock_dynamodb_table.query.assert_called_once()
+        assert [job.job_id for job in jobs] == ["job-1", "job-2"]
+        # A single-shard batch is read with shard 0's two pages only
+        assert mock_dynamodb_table.query.call_count == 2
+
+    def test_list_batch_jobs_reads_recorded_shards(
+        self, job_service: JobService, mock_dynamodb_table: MagicMock
+    ) -> None:
+        """Test the shard count recorded in shard 0 sizes the fan-out."""
+        shards = {}
+        for shard in range(3):
+            item = self._make_job_item(f"job-{shard}", "tenant-123")
+            item.update(batch_id="batch-456", batch_shards=3)
+            shards[f"batch-456#{shard}"] = {"Items": [item]}
+        mock_dynamodb_table.query.side_effect = lambda **kwargs: shards[
+            kwargs["KeyConditionExpression"].get_expression()["values"][1]
+        ]
+
+        jobs = job_service.list_batch_jobs("batch-456", "tenant-123")
+
+        assert sorted(job.job_id for job in jobs) == ["job-0", "job-1", "job-2"]
+        assert mock_dynamodb_table.query.call_count == 3
 
     def test_get_pending_jobs(
         self, job_service: JobService, mock_dynamodb_table: MagicMock
     ) -> None:
         """Test getting pending jobs."""
-        job1 = self._make_job_item("job-1", "tenant-123")
-        job1["status"] = "SUBMITTED"
-        mock_dynamodb_table.scan.return_value = {"Items": [job1]}
+        submitted = self._make_job_item("job-1", "tenant-123")
+        submitted["status"] = "SUBMITTED"
+        submitted["updated_at"] = "2024-01-15T10:05:00+00:00"
+        running = self._make_job_item("job-2", "tenant-123")
+        running["status"] = "RUNNING"
+        running["updated_at"] = "2024-01-15T10:00:00+00:00"
+        by_condition = [
+            (Key("pending_status").eq("SUBMITTED"), [submitted]),
+            (Key("pending_status").eq("RUNNING"), [running]),
+        ]
+        mock_dynamodb_table.query.side_effect = lambda **kwargs: {
+            "Items": next(
+                items
+                for condition, items in by_condition
+                if condition == kwargs["KeyConditionExpression"]
+            )
+        }
 
-        jobs = job_service.get_pending_jobs()
+        jobs = job_service.get_pending_jobs(limit=1)
 
-        assert len(jobs) == 1
-        mock_dynamodb_table.scan.assert_called_once()
+        assert [job.job_id for job in jobs] == ["job-2"]
+        assert mock_dynamodb_table.query.call_count == 2
+        assert {c.kwargs["IndexName"] for c in mock_dynamodb_table.query.call_args_list} == {
+            "pending-index"
+        }
+        mock_dynamodb_table.scan.assert_not_called()
+
+    def test_update_job_status_tracks_pending_index(
+        self, job_service: JobService, mock_dynamodb_table: MagicMock
+    ) -> None:
+        """Test pending jobs enter the sparse index and finished jobs leave it."""
+        mock_dynamodb_table.update_item.return_value = {
+            "Attributes": self._make_job_item("job-1", "tenant-123")
+        }
+
+        job_service.update_job_status("job-1", JobStatus.RUNNING)
+        running_expr = mock_dynamodb_table.update_item.call_args.kwargs["UpdateExpression"]
+        job_service.update_job_status("job-1", JobStatus.COMPLETED)
+        completed_expr = mock_dynamodb_table.update_item.call_args.kwargs["UpdateExpression"]
+
+        assert "pending_status = :status" in running_expr
+        assert "REMOVE" not in running_expr
+        assert completed_expr.endswith(" REMOVE pending_status")
+
+    def test_update_job_status_skips_unchanged_status(
+        self, job_service: JobService, mock_dynamodb_table: MagicMock
+    ) -> None:
+        """Test a bare transition to the current status is a conditional no-op."""
+        mock_dynamodb_table.update_item.side_effect = ClientError(
+            {"Error": {"Code": "ConditionalCheckFailedException", "Message": ""}},
+            "UpdateItem",
+        )
+
+        assert job_service.update_job_running("job-1") is None
+
+        call_kwargs = mock_dynamodb_table.update_item.call_args.kwargs
+        assert (
+            call_kwargs["ConditionExpression"] == "attribute_exists(job_id) AND #status <> :status"
+        )
+        assert call_kwargs["ReturnValues"] == "NONE"
+
+    def test_update_job_status_with_result_is_unconditional(
+        self, job_service: JobService, mock_dynamodb_table: MagicMock
+    ) -> None:
+        """Test transitions carrying a result are always written and can echo the item."""
+        item = self._make_job_item("job-1", "tenant-123")
+        mock_dynamodb_table.update_item.return_value = {"Attributes": item}
+
+        job = job_service.update_job_result_location("job-1", "s3://bucket/key", echo=True)
+
+        call_kwargs = mock_dynamodb_table.update_item.call_args.kwargs
+        assert "ConditionExpression" not in call_kwargs
+        assert call_kwargs["ReturnValues"] == "ALL_NEW"
+        assert job is not None and job.job_id == "job-1"
+
+    def test_update_jobs_status_chunks_transactions(self, job_service: JobService) -> None:
+        """Test status updates are sent in transactions of at most 100 items."""
+        updates = [(f"job-{i}", JobStatus.FAILED) for i in range(150)]
+
+        job_service.update_jobs_status(updates)
+
+        client = job_service.dynamodb.meta.client
+        sizes = [len(c.kwargs["TransactItems"]) for c in client.transact_write_items.call_args_list]
+        assert sizes == [100, 50]
+        first = client.transact_write_items.call_args.kwargs["TransactItems"][0]["Update"]
+        assert first["ConditionExpression"] == "attribute_exists(job_id)"
+        assert first["UpdateExpression"].endswith(" REMOVE pending_status")
 
     def _make_job_item(self, job_id: str, tenant_id: str) -> dict[str, Any]:
         """Create a sample job item for testing."""
@@ -346,20 +485,27 @@ class TestJobServiceErrors:
         return MagicMock()
 
     @pytest.fixture
-    def job_service(self, mock_dynamodb_table: MagicMock) -> JobService:
+    def mock_dynamodb_client(self) -> MagicMock:
+        """Create a mock low-level DynamoDB client."""
+        return MagicMock()
+
+    @pytest.fixture
+    def job_service(
+        self, mock_dynamodb_table: MagicMock, mock_dynamodb_client: MagicMock
+    ) -> JobService:
         """Create a JobService with mocked dependencies."""
-        with patch("boto3.resource") as mock_resource:
+        with patch("boto3.resource") as mock_resource, patch("boto3.client"):
             mock_resource.return_value.Table.return_value = mock_dynamodb_table
             service = JobService()
             service.table = mock_dynamodb_table
+            service.dynamodb_client = mock_dynamodb_client
             return service
 
     def test_create_job_conditional_check_failure(
-        self, job_service: JobService, mock_dynamodb_table: MagicMock
+        self, job_service: JobService, mock_dynamodb_client: MagicMock
     ) -> None:
         """Test handling of conditional check failure on create."""
-        mock_dynamodb_table.query.return_value = {"Items": []}
-        mock_dynamodb_table.put_item.side_effect = ClientError(
+        mock_dynamodb_client.put_item.side_effect = ClientError(
             {"Error": {"Code": "ConditionalCheckFailedException", "Message": ""}},
             "PutItem",
         )
@@ -372,10 +518,10 @@ class TestJobServiceErrors:
             )
 
     def test_get_job_client_error(
-        self, job_service: JobService, mock_dynamodb_table: MagicMock
+        self, job_service: JobService, mock_dynamodb_client: MagicMock
     ) -> None:
         """Test handling of client error on get."""
-        mock_dynamodb_table.get_item.side_effect = ClientError(
+        mock_dynamodb_client.get_item.side_effect = ClientError(
             {"Error": {"Code": "InternalServerError", "Message": "Error"}},
             "GetItem",
         )
@@ -409,3 +555,14 @@ class TestJobServiceErrors:
 
         with pytest.raises(ClientError):
             job_service.list_jobs("tenant-123")
+
+
+class TestJobServiceDynamoDB:
+    """Tests for JobService against a moto DynamoDB table."""
+
+    def test_update_job_status_unknown_job_creates_nothing(self, mock_dynamodb: Any) -> None:
+        """Test a bare status change for an unknown job ID does not create an item."""
+        JobService().update_job_running("job-missing")
+
+        table = mock_dynamodb.Table("spectra-jobs")
+        assert "Item" not in table.get_item(Key={"job_id": "job-missing"})
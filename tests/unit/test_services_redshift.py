@@ -3,6 +3,8 @@
 Tests for the RedshiftService class that handles query execution via Data API.
 """
 
+import threading
+from typing import Any
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -70,6 +72,11 @@ class TestRedshiftService:
 
         assert statement_id == "stmt-123"
         mock_redshift_client.execute_statement.assert_called_once()
+        call_kwargs = mock_redshift_client.execute_statement.call_args.kwargs
+        settings = redshift_service.settings
+        assert call_kwargs["Database"] == settings.redshift_database
+        assert call_kwargs["ClusterIdentifier"] == settings.redshift_cluster_id
+        assert call_kwargs["DbUser"] == "user_tenant_123"
 
     def test_execute_statement_with_session_reuse(
         self,
@@ -208,6 +215,62 @@ class TestRedshiftService:
         call_args = mock_redshift_client.execute_statement.call_args
         assert call_args.kwargs["WithEvent"] is True
 
+    def test_execute_unload_options(
+        self,
+        redshift_service: RedshiftService,
+        mock_redshift_client: MagicMock,
+        mock_session_service: MagicMock,
+    ) -> None:
+        """Test UNLOAD runs in parallel with the requested file size cap."""
+        mock_session_service.get_or_create_session_id.return_value = (None, True)
+        mock_redshift_client.execute_statement.return_value = {"Id": "stmt-unload"}
+
+        statement_id = redshift_service.execute_unload(
+            sql="SELECT * FROM sales WHERE region = 'EU'",
+            s3_path="s3://bucket/exports/tenant-123/job-1/",
+            db_user="user_tenant_123",
+            iam_role="arn:aws:iam::123456789012:role/unload",
+            max_file_size_mb=512,
+        )
+
+        unload_sql = mock_redshift_client.execute_statement.call_args.kwargs["Sql"]
+        assert statement_id == "stmt-unload"
+        assert "UNLOAD ('SELECT * FROM sales WHERE region = ''EU''')" in unload_sql
+        assert "PARALLEL ON" in unload_sql
+        assert "MAXFILESIZE 512 MB" in unload_sql
+
+    def test_execute_unload_partition_by(
+        self,
+        redshift_service: RedshiftService,
+        mock_redshift_client: MagicMock,
+        mock_session_service: MagicMock,
+    ) -> None:
+        """Test UNLOAD partition columns are rendered into the options."""
+        mock_session_service.get_or_create_session_id.return_value = (None, True)
+        mock_redshift_client.execute_statement.return_value = {"Id": "stmt-unload"}
+
+        redshift_service.execute_unload(
+            sql="SELECT * FROM sales",
+            s3_path="s3://bucket/exports/",
+            db_user="user_tenant_123",
+            iam_role="arn:aws:iam::123456789012:role/unload",
+            file_format="CSV",
+            partition_by=["region", "day"],
+        )
+
+        unload_sql = mock_redshift_client.execute_statement.call_args.kwargs["Sql"]
+        assert "FORMAT CSV" in unload_sql
+        assert "PARTITION BY (region, day)" in unload_sql
+        assert "MAXFILESIZE" not in unload_sql
+
+    def test_map_status(self, redshift_service: RedshiftService) -> None:
+        """Test Redshift statuses map to job statuses, defaulting to RUNNING."""
+        assert redshift_service.map_status("PICKED") == "RUNNING"
+        assert redshift_service.map_status("FINISHED") == "COMPLETED"
+        assert redshift_service.map_status("ABORTED") == "CANCELLED"
+        assert redshift_service.map_status("UNKNOWN") == "RUNNING"
+        assert RedshiftService.map_status("FAILED") == "FAILED"
+
 
 class TestRedshiftServiceErrors:
     """Tests for RedshiftService error handling."""
@@ -300,6 +363,69 @@ class TestRedshiftServiceErrors:
 
         assert statement_id == "stmt-123"
         mock_session_service.invalidate_session.assert_called_once_with("bad-session")
+        retry_kwargs = mock_redshift_client.execute_statement.call_args.kwargs
+        assert "SessionId" not in retry_kwargs
+        mock_session_service.get_or_create_session_id.assert_called_once()
+
+    def test_session_error_retried_only_once(
+        self,
+        redshift_service: RedshiftService,
+        mock_redshift_client: MagicMock,
+        mock_session_service: MagicMock,
+    ) -> None:
+        """Test a session error on the sessionless retry is raised, not retried again."""
+        mock_session_service.get_or_create_session_id.return_value = ("bad-session", False)
+        mock_redshift_client.execute_statement.side_effect = ClientError(
+            {"Error": {"Code": "ValidationException", "Message": "Session limit reached"}},
+            "ExecuteStatement",
+        )
+
+        with pytest.raises(QueryExecutionError):
+            redshift_service.execute_statement(
+                sql="SELECT * FROM sales",
+                db_user="user_tenant_123",
+                tenant_id="tenant-123",
+            )
+
+        assert mock_redshift_client.execute_statement.call_count == 2
+
+    @pytest.mark.parametrize(
+        ("message", "retried"),
+        [
+            ("The session is busy", True),
+            ("SessionId abc has expired", True),
+            ("Table MySessionLog does not exist", False),
+        ],
+    )
+    def test_session_error_detection(
+        self,
+        redshift_service: RedshiftService,
+        mock_redshift_client: MagicMock,
+        mock_session_service: MagicMock,
+        message: str,
+        retried: bool,
+    ) -> None:
+        """Test only messages about the session itself trigger the sessionless retry."""
+        mock_session_service.get_or_create_session_id.return_value = ("session-1", False)
+        mock_redshift_client.execute_statement.side_effect = [
+            ClientError(
+                {"Error": {"Code": "ValidationException", "Message": message}},
+                "ExecuteStatement",
+            ),
+            {"Id": "stmt-123"},
+        ]
+
+        if retried:
+            redshift_service.execute_statement(
+                sql="SELECT 1", db_user="user_tenant_123", tenant_id="tenant-123"
+            )
+        else:
+            with pytest.raises(QueryExecutionError):
+                redshift_service.execute_statement(
+                    sql="SELECT 1", db_user="user_tenant_123", tenant_id="tenant-123"
+                )
+
+        assert mock_redshift_client.execute_statement.call_count == (2 if retried else 1)
 
 
 class TestRedshiftExceptions:
@@ -399,6 +525,108 @@ class TestGetAllStatementResults:
         assert len(result["columns"]) == 2
         assert result["records"][0] == {"id": "1", "name": "Alice"}
 
+    def test_get_all_results_csv_line_handling(
+        self,
+        redshift_service: RedshiftService,
+        mock_redshift_client: MagicMock,
+    ) -> None:
+        """Test quoted line breaks and non-newline separators stay inside values."""
+        mock_redshift_client.get_statement_result_v2.return_value = {
+            "ColumnMetadata": [
+                {"name": "id", "typeName": "int4"},
+                {"name": "note", "typeName": "varchar"},
+            ],
+            "FormattedRecords": '1,"line\r\nbreak"\n2,page\x0cfeed\u2028sep\n3,',
+            "TotalNumRows": 3,
+        }
+
+        result = redshift_service.get_all_statement_results("stmt-123")
+
+        assert result["records"] == [
+            {"id": "1", "note": "line\r\nbreak"},
+            {"id": "2", "note": "page\x0cfeed\u2028sep"},
+            {"id": "3", "note": None},
+        ]
+
+    def test_get_all_results_unquoted_csv_split(
+        self,
+        redshift_service: RedshiftService,
+        mock_redshift_client: MagicMock,
+    ) -> None:
+        """Test quote-free pages parse like the CSV reader, skipping ragged rows."""
+        mock_redshift_client.get_statement_result_v2.return_value = {
+            "ColumnMetadata": [
+                {"name": "id", "typeName": "int4"},
+                {"name": "note", "typeName": "varchar"},
+            ],
+            "FormattedRecords": "1,page\x0cfeed\u2028sep\nbad\n3,\n4,a,b\n5, x ",
+        }
+
+        with patch("spectra.services.redshift.csv.reader") as mock_reader:
+            result = redshift_service.get_all_statement_results("stmt-123")
+
+        assert result["records"] == [
+            {"id": "1", "note": "page\x0cfeed\u2028sep"},
+            {"id": "3", "note": None},
+            {"id": "5", "note": " x "},
+        ]
+        mock_reader.assert_not_called()
+
+    def test_get_all_results_large_page_parsed_by_arrow(
+        self,
+        redshift_service: RedshiftService,
+        mock_redshift_client: MagicMock,
+    ) -> None:
+        """Test large CSV pages parse to the same records through pyarrow."""
+        mock_redshift_client.get_statement_result_v2.return_value = {
+            "ColumnMetadata": [
+                {"name": "id", "typeName": "int4"},
+                {"name": "note", "typeName": "varchar"},
+            ],
+            "FormattedRecords": '1,"a, ""b"""\n2,\n3,x,extra\n4,"line\nbreak"\n',
+            "TotalNumRows": 4,
+        }
+
+        small = redshift_service.get_all_statement_results("stmt-123")
+        with patch("spectra.services.redshift._ARROW_PARSE_MIN_CHARS", 1):
+            large = redshift_service.get_all_statement_results("stmt-123")
+
+        assert (
+            large["records"]
+            == small["records"]
+            == [
+                {"id": "1", "note": 'a, "b"'},
+                {"id": "2", "note": None},
+                {"id": "4", "note": "line\nbreak"},
+            ]
+        )
+
+    def test_get_all_results_mid_size_page_uses_loaded_arrow(
+        self,
+        redshift_service: RedshiftService,
+        mock_redshift_client: MagicMock,
+    ) -> None:
+        """Test pages below the cold threshold use pyarrow once it is imported."""
+        import pyarrow.csv  # noqa: F401
+
+        from spectra.services import redshift
+
+        mock_redshift_client.get_statement_result_v2.return_value = {
+            "ColumnMetadata": [{"name": "id", "typeName": "int4"}],
+            "FormattedRecords": "1\n\n",
+        }
+
+        with (
+            patch("spectra.services.redshift._ARROW_PARSE_MIN_CHARS_LOADED", 1),
+            patch(
+                "spectra.services.redshift._csv_to_arrow", wraps=redshift._csv_to_arrow
+            ) as csv_to_arrow,
+        ):
+            result = redshift_service.get_all_statement_results("stmt-123")
+
+        csv_to_arrow.assert_called_once()
+        assert result["records"] == [{"id": "1"}]
+
     def test_get_all_results_multiple_pages(
         self,
         redshift_service: RedshiftService,
@@ -436,6 +664,125 @@ class TestGetAllStatementResults:
         ids = [r["id"] for r in result["records"]]
         assert ids == ["1", "2", "3", "4", "5", "6", "7", "8", "9"]
 
+    def test_iter_statement_results_fetches_pages_lazily(
+        self,
+        redshift_service: RedshiftService,
+        mock_redshift_client: MagicMock,
+    ) -> None:
+        """Test records are yielded page by page, fetching the next page on demand."""
+        mock_redshift_client.get_statement_result_v2.side_effect = [
+            {
+                "ColumnMetadata": [{"name": "id", "typeName": "int4"}],
+                "FormattedRecords": "1\n2\n",
+                "NextToken": "token-page-2",
+            },
+            {"ColumnMetadata": [], "FormattedRecords": "3\n"},
+        ]
+
+        rows = redshift_service.iter_statement_results("stmt-123")
+
+        assert next(rows) == {"id": "1"}
+        assert mock_redshift_client.get_statement_result_v2.call_count == 1
+        assert list(rows) == [{"id": "2"}, {"id": "3"}]
+        second_call = mock_redshift_client.get_statement_result_v2.call_args_list[1]
+        assert second_call.kwargs["NextToken"] == "token-page-2"
+
+    def test_iter_statement_result_raw(
+        self,
+        redshift_service: RedshiftService,
+        mock_redshift_client: MagicMock,
+    ) -> None:
+        """Test each page's CSV text is yielded as returned, without parsing."""
+        mock_redshift_client.get_statement_result_v2.side_effect = [
+            {
+                "ColumnMetadata": [{"name": "id", "typeName": "int4"}],
+                "FormattedRecords": "1\n2\n",
+                "NextToken": "token-page-2",
+            },
+            {"ColumnMetadata": [], "FormattedRecords": "3\n"},
+        ]
+
+        with patch.object(redshift_service, "_parse_csv_result") as mock_parse:
+            pages = list(redshift_service.iter_statement_result_raw("stmt-123"))
+
+        columns = [{"name": "id", "type": "int4", "label": "id"}]
+        assert pages == [(columns, "1\n2\n"), (columns, "3\n")]
+        mock_parse.assert_not_called()
+
+    def test_iter_statement_result_raw_typed_fallback(
+        self,
+        redshift_service: RedshiftService,
+        mock_redshift_client: MagicMock,
+    ) -> None:
+        """Test typed pages are written out as CSV when CSV results are rejected."""
+        mock_redshift_client.get_statement_result_v2.side_effect = ClientError(
+            {"Error": {"Code": "ValidationException", "Message": "CSV not supported"}},
+            "GetStatementResultV2",
+        )
+        mock_redshift_client.get_statement_result.return_value = {
+            "ColumnMetadata": [
+                {"name": "id", "typeName": "int4"},
+                {"name": "name", "typeName": "varchar"},
+            ],
+            "Records": [
+                [{"longValue": 1}, {"stringValue": "a,b"}],
+                [{"longValue": 2}, {"isNull": True}],
+            ],
+        }
+
+        pages = list(redshift_service.iter_statement_result_raw("stmt-123"))
+
+        assert [text for _, text in pages] == ['1,"a,b"\n2,\n']
+
+    def test_get_all_results_parses_while_fetching_next_page(
+        self,
+        redshift_service: RedshiftService,
+        mock_redshift_client: MagicMock,
+    ) -> None:
+        """Test a page is parsed on a worker thread when another page follows."""
+        parse_threads: list[int] = []
+        parse_csv = redshift_service._parse_csv_result
+
+        def record_thread(*args: Any) -> dict[str, Any]:
+            parse_threads.append(threading.get_ident())
+            return parse_csv(*args)
+
+        mock_redshift_client.get_statement_result_v2.side_effect = [
+            {
+                "ColumnMetadata": [{"name": "id", "typeName": "int4"}],
+                "FormattedRecords": "1\n2\n",
+                "NextToken": "token-page-2",
+            },
+            {"ColumnMetadata": [], "FormattedRecords": "3\n"},
+        ]
+
+        with patch.object(redshift_service, "_parse_csv_result", side_effect=record_thread):
+            result = redshift_service.get_all_statement_results("stmt-123")
+
+        assert result["records"] == [{"id": "1"}, {"id": "2"}, {"id": "3"}]
+        assert parse_threads[0] != threading.get_ident()
+        assert parse_threads[1] == threading.get_ident()
+
+    def test_get_all_results_reuses_first_page_columns(
+        self,
+        redshift_service: RedshiftService,
+        mock_redshift_client: MagicMock,
+    ) -> None:
+        """Test column metadata is parsed once and reused for later pages."""
+        mock_redshift_client.get_statement_result_v2.side_effect = [
+            {
+                "ColumnMetadata": [{"name": "id", "typeName": "int4"}],
+                "FormattedRecords": "1\n",
+                "NextToken": "token-page-2",
+            },
+            {"ColumnMetadata": [], "FormattedRecords": "2\n"},
+        ]
+
+        result = redshift_service.get_all_statement_results("stmt-123")
+
+        assert result["records"] == [{"id": "1"}, {"id": "2"}]
+        assert [c["name"] for c in result["columns"]] == ["id"]
+
     def test_get_all_results_with_max_rows(
         self,
         redshift_service: RedshiftService,
@@ -539,6 +886,205 @@ class TestGetAllStatementResults:
         assert len(result["records"]) == 2
         assert result["format"] == "TYPED"
 
+    def test_csv_fallback_remembered_for_cluster(
+        self,
+        redshift_service: RedshiftService,
+        mock_redshift_client: MagicMock,
+    ) -> None:
+        """Test a cluster that rejected CSV results is not asked for CSV again."""
+        mock_redshift_client.get_statement_result_v2.side_effect = ClientError(
+            {"Error": {"Code": "ValidationException", "Message": "CSV not supported"}},
+            "GetStatementResultV2",
+        )
+        mock_redshift_client.get_statement_result.return_value = {
+            "ColumnMetadata": [{"name": "id", "typeName": "int4"}],
+            "Records": [[{"longValue": 1}]],
+        }
+
+        redshift_service.get_all_statement_results("stmt-1")
+        second = redshift_service.get_all_statement_results("stmt-2")
+        arrow = redshift_service.get_all_statement_results_arrow("stmt-3")
+
+        assert mock_redshift_client.get_statement_result_v2.call_count == 1
+        assert second["records"] == [{"id": 1}]
+        assert arrow["table"].to_pylist() == [{"id": 1}]
+
+    def test_parse_typed_result_field_types(self, redshift_service: RedshiftService) -> None:
+        """Test every typed field is unwrapped and unnamed extra cells get positional names."""
+        result = redshift_service._parse_typed_result(
+            {
+                "ColumnMetadata": [
+                    {"name": "s"},
+                    {"name": "l"},
+                    {"name": "d"},
+                    {"name": "b"},
+                    {"name": "blob"},
+                    {"name": "n"},
+                ],
+                "Records": [
+                    [
+                        {"stringValue": "x"},
+                        {"longValue": 1},
+                        {"doubleValue": 1.5},
+                        {"booleanValue": False},
+                        {"blobValue": b"\x00"},
+                        {"isNull": True},
+                        {"stringValue": "extra"},
+                    ]
+                ],
+            }
+        )
+
+        assert result["records"] == [
+            {"s": "x", "l": 1, "d": 1.5, "b": False, "blob": b"\x00", "n": None, "col_6": "extra"}
+        ]
+        assert [c["name"] for c in result["columns"]] == ["s", "l", "d", "b", "blob", "n"]
+
+    def test_parse_typed_result_known_column_types(self, redshift_service: RedshiftService) -> None:
+        """Test cells of known column types are read by type, with nulls and extra cells."""
+        result = redshift_service._parse_typed_result(
+            {
+                "ColumnMetadata": [
+                    {"name": "id", "typeName": "int8"},
+                    {"name": "price", "typeName": "float8"},
+                    {"name": "name", "typeName": "varchar"},
+                ],
+                "Records": [
+                    [{"longValue": 1}, {"doubleValue": 2.5}, {"isNull": True}],
+                    [{"longValue": 2}, {"isNull": True}, {"stringValue": "b"}, {"longValue": 9}],
+                ],
+            }
+        )
+
+        assert result["records"] == [
+            {"id": 1, "price": 2.5, "name": None},
+            {"id": 2, "price": None, "name": "b", "col_3": 9},
+        ]
+
+    def test_get_all_results_arrow_multiple_pages(
+        self,
+        redshift_service: RedshiftService,
+        mock_redshift_client: MagicMock,
+    ) -> None:
+        """Test CSV pages are parsed into a single Arrow table."""
+        mock_redshift_client.get_statement_result_v2.side_effect = [
+            {
+                "ColumnMetadata": [
+                    {"name": "id", "typeName": "int4"},
+                    {"name": "note", "typeName": "varchar"},
+                ],
+                "FormattedRecords": '1,"a, b"\n2,\n',
+                "TotalNumRows": 4,
+                "NextToken": "token-page-2",
+            },
+            {
+                "ColumnMetadata": [
+                    {"name": "id", "typeName": "int4"},
+                    {"name": "note", "typeName": "varchar"},
+                ],
+                "FormattedRecords": '3,"line\nbreak"\n4,d\n',
+                "TotalNumRows": 4,
+            },
+        ]
+
+        result = redshift_service.get_all_statement_results_arrow("stmt-123", max_rows=3)
+
+        assert result["pages_fetched"] == 2
+        assert result["total_rows"] == 4
+        assert [c["name"] for c in result["columns"]] == ["id", "note"]
+        assert result["table"].to_pylist() == [
+            {"id": 1, "note": "a, b"},
+            {"id": 2, "note": None},
+            {"id": 3, "note": "line\nbreak"},
+        ]
+
+    def test_get_all_results_arrow_integer_columns(
+        self,
+        redshift_service: RedshiftService,
+        mock_redshift_client: MagicMock,
+    ) -> None:
+        """Test integer CSV columns are parsed to int64 with empty values as nulls."""
+        import pyarrow as pa
+
+        metadata = [
+            {"name": "big", "typeName": "int8"},
+            {"name": "price", "typeName": "float8"},
+        ]
+        mock_redshift_client.get_statement_result_v2.side_effect = [
+            {
+                "ColumnMetadata": metadata,
+                "FormattedRecords": "9007199254740993,1.50\n,2\n",
+                "NextToken": "token-page-2",
+            },
+            {"ColumnMetadata": metadata, "FormattedRecords": ""},
+        ]
+
+        result = redshift_service.get_all_statement_results_arrow("stmt-123")
+
+        assert result["table"].schema.types == [pa.int64(), pa.string()]
+        assert result["table"].to_pydict() == {
+            "big": [9007199254740993, None],
+            "price": ["1.50", "2"],
+        }
+
+    def test_get_all_results_arrow_typed_fallback(
+        self,
+        redshift_service: RedshiftService,
+        mock_redshift_client: MagicMock,
+    ) -> None:
+        """Test Arrow results fall back to typed records when CSV is unsupported."""
+        mock_redshift_client.get_statement_result_v2.side_effect = ClientError(
+            {"Error": {"Code": "ValidationException", "Message": "CSV not supported"}},
+            "GetStatementResultV2",
+        )
+        mock_redshift_client.get_statement_result.return_value = {
+            "ColumnMetadata": [{"name": "id", "typeName": "int4"}],
+            "Records": [[{"longValue": 1}], [{"longValue": 2}]],
+            "TotalNumRows": 2,
+        }
+
+        result = redshift_service.get_all_statement_results_arrow("stmt-123")
+
+        assert result["table"].to_pylist() == [{"id": 1}, {"id": 2}]
+        assert "records" not in result
+
+    def test_get_all_results_arrow_typed_fallback_pages(
+        self,
+        redshift_service: RedshiftService,
+        mock_redshift_client: MagicMock,
+    ) -> None:
+        """Test typed pages are appended column-wise and trimmed to max_rows."""
+        mock_redshift_client.get_statement_result_v2.side_effect = ClientError(
+            {"Error": {"Code": "ValidationException", "Message": "CSV not supported"}},
+            "GetStatementResultV2",
+        )
+        metadata = [{"name": "id", "typeName": "int4"}, {"name": "name", "typeName": "varchar"}]
+        mock_redshift_client.get_statement_result.side_effect = [
+            {
+                "ColumnMetadata": metadata,
+                "Records": [[{"longValue": 1}, {"stringValue": "a"}]],
+                "TotalNumRows": 3,
+                "NextToken": "token-2",
+            },
+            {
+                "ColumnMetadata": metadata,
+                "Records": [
+                    [{"longValue": 2}, {"isNull": True}],
+                    [{"longValue": 3}, {"stringValue": "c"}],
+                ],
+                "TotalNumRows": 3,
+            },
+        ]
+
+        result = redshift_service.get_all_statement_results_arrow("stmt-123", max_rows=2)
+
+        assert result["table"].to_pydict() == {"id": [1, 2], "name": ["a", None]}
+        assert result["format"] == "TYPED"
+        assert result["pages_fetched"] == 2
+        assert result["total_rows"] == 3
+        second_call = mock_redshift_client.get_statement_result.call_args_list[1]
+        assert second_call.kwargs == {"Id": "stmt-123", "NextToken": "token-2"}
+
 
 class TestWaitForStatement:
     """Tests for wait_for_statement method."""
@@ -586,6 +1132,129 @@ class TestWaitForStatement:
         assert result["status"] == "FINISHED"
         assert result["result_rows"] == 100
 
+    def test_wait_for_statement_polls_quickly_at_first(
+        self,
+        redshift_service: RedshiftService,
+        mock_redshift_client: MagicMock,
+    ) -> None:
+        """Test short queries are polled every ~50ms before backing off."""
+        mock_redshift_client.describe_statement.side_effect = [
+            {"Id": "stmt-123", "Status": "STARTED"},
+        ] * 12 + [{"Id": "stmt-123", "Status": "FINISHED"}]
+
+        with patch("spectra.services.redshift.time.sleep") as mock_sleep:
+            redshift_service.wait_for_statement("stmt-123", timeout_seconds=10)
+
+        sleeps = [c.args[0] for c in mock_sleep.call_args_list]
+        assert len(sleeps) == 12
+        assert all(0.04 <= s <= 0.06 for s in sleeps[:10])
+        assert 0.08 <= sleeps[10] <= 0.12
+        assert 0.16 <= sleeps[11] <= 0.24
+
+    def test_describe_statements(
+        self,
+        redshift_service: RedshiftService,
+        mock_redshift_client: MagicMock,
+    ) -> None:
+        """Test several statements are described at once, skipping missing ones."""
+
+        def describe_statement(Id: str) -> dict:
+            if Id == "stmt-gone":
+                raise ClientError(
+                    {"Error": {"Code": "ResourceNotFoundException", "Message": "Not found"}},
+                    "DescribeStatement",
+                )
+            return {"Id": Id, "Status": "FINISHED"}
+
+        mock_redshift_client.describe_statement.side_effect = describe_statement
+
+        descriptions = redshift_service.describe_statements(
+            ["stmt-1", "stmt-gone", "stmt-2", "stmt-1"]
+        )
+
+        assert list(descriptions) == ["stmt-1", "stmt-2"]
+        assert descriptions["stmt-2"]["status"] == "FINISHED"
+        assert mock_redshift_client.describe_statement.call_count == 3
+        assert redshift_service.describe_statements([]) == {}
+
+    def test_execute_statements(
+        self,
+        redshift_service: RedshiftService,
+        mock_redshift_client: MagicMock,
+        mock_session_service: MagicMock,
+    ) -> None:
+        """Test several statements are submitted at once without session reuse."""
+        mock_redshift_client.execute_statement.side_effect = lambda **kwargs: {
+            "Id": f"stmt-{kwargs['Sql'][-1]}"
+        }
+
+        statement_ids = redshift_service.execute_statements(
+            ["SELECT 1", "SELECT 2", "SELECT 3"], "user_tenant_123", tenant_id="tenant-123"
+        )
+
+        assert statement_ids == ["stmt-1", "stmt-2", "stmt-3"]
+        for call in mock_redshift_client.execute_statement.call_args_list:
+            assert "SessionId" not in call.kwargs
+            assert "SessionKeepAliveSeconds" not in call.kwargs
+        mock_session_service.get_or_create_session_id.assert_not_called()
+        assert redshift_service.execute_statements([], "user_tenant_123") == []
+
+    def test_wait_for_statements(
+        self,
+        redshift_service: RedshiftService,
+        mock_redshift_client: MagicMock,
+    ) -> None:
+        """Test statements are polled together until all of them finish."""
+        statuses = {"stmt-1": ["STARTED", "FINISHED"], "stmt-2": ["FINISHED"]}
+        mock_redshift_client.describe_statement.side_effect = lambda Id: {
+            "Id": Id,
+            "Status": statuses[Id].pop(0),
+        }
+
+        with patch("spectra.services.redshift.time.sleep") as mock_sleep:
+            descriptions = redshift_service.wait_for_statements(["stmt-1", "stmt-2"])
+
+        assert list(descriptions) == ["stmt-1", "stmt-2"]
+        assert all(d["status"] == "FINISHED" for d in descriptions.values())
+        assert mock_redshift_client.describe_statement.call_count == 3
+        mock_sleep.assert_called_once()
+
+    def test_wait_for_statements_failed(
+        self,
+        redshift_service: RedshiftService,
+        mock_redshift_client: MagicMock,
+    ) -> None:
+        """Test waiting on several statements stops at the first failure."""
+        mock_redshift_client.describe_statement.side_effect = lambda Id: {
+            "Id": Id,
+            "Status": "FAILED" if Id == "stmt-2" else "STARTED",
+            "Error": "Syntax error",
+        }
+
+        with pytest.raises(QueryExecutionError) as exc_info:
+            redshift_service.wait_for_statements(["stmt-1", "stmt-2"])
+
+        assert exc_info.value.details == {"statement_id": "stmt-2", "error": "Syntax error"}
+
+    def test_describe_statement_reuses_terminal_description(
+        self,
+        redshift_service: RedshiftService,
+        mock_redshift_client: MagicMock,
+    ) -> None:
+        """Test a finished statement is not described again after waiting on it."""
+        mock_redshift_client.describe_statement.side_effect = [
+            {"Id": "stmt-123", "Status": "STARTED"},
+            {"Id": "stmt-123", "Status": "FINISHED", "ResultRows": 5},
+        ]
+
+        with patch("spectra.services.redshift.time.sleep"):
+            redshift_service.wait_for_statement("stmt-123", timeout_seconds=10)
+        description = redshift_service.describe_statement("stmt-123")
+
+        assert description["status"] == "FINISHED"
+        assert description["result_rows"] == 5
+        assert mock_redshift_client.describe_statement.call_count == 2
+
     def test_wait_for_statement_timeout(
         self,
         redshift_service: RedshiftService,
@@ -4,6 +4,7 @@ Tests for the SessionService class that manages Redshift session reuse.
 """
 
 from datetime import UTC, datetime, timedelta
+from typing import Any
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -162,6 +163,7 @@ class TestSessionService:
         assert session is not None
         assert session.session_id == "session-123"
         mock_dynamodb_table.query.assert_called_once()
+        assert mock_dynamodb_table.query.call_args.kwargs["ScanIndexForward"] is False
 
     def test_get_active_session_not_found(
         self, session_service: SessionService, mock_dynamodb_table: MagicMock
@@ -320,6 +322,34 @@ class TestSessionService:
         assert session_id is None
         assert is_new is True
 
+    def test_get_or_create_session_id_cached(
+        self, session_service: SessionService, mock_dynamodb_table: MagicMock
+    ) -> None:
+        """Test a freshly created session is reused without querying DynamoDB."""
+        session_service.create_session("session-123", "tenant-456", "user_tenant_456")
+
+        session_id, is_new = session_service.get_or_create_session_id(
+            "tenant-456", "user_tenant_456"
+        )
+
+        assert (session_id, is_new) == ("session-123", False)
+        mock_dynamodb_table.query.assert_not_called()
+
+    def test_invalidate_session_clears_cache(
+        self, session_service: SessionService, mock_dynamodb_table: MagicMock
+    ) -> None:
+        """Test an invalidated session is no longer served from the cache."""
+        mock_dynamodb_table.query.return_value = {"Items": []}
+        session_service.create_session("session-123", "tenant-456", "user_tenant_456")
+
+        session_service.invalidate_session("session-123")
+        session_id, is_new = session_service.get_or_create_session_id(
+            "tenant-456", "user_tenant_456"
+        )
+
+        assert (session_id, is_new) == (None, True)
+        mock_dynamodb_table.query.assert_called_once()
+
     def test_cleanup_expired_sessions(
         self, session_service: SessionService, mock_dynamodb_table: MagicMock
     ) -> None:
@@ -347,11 +377,64 @@ class TestSessionService:
                 },
             ]
         }
-        mock_dynamodb_table.delete_item.return_value = {}
+        batch = mock_dynamodb_table.batch_writer.return_value.__enter__.return_value
 
         cleaned = session_service.cleanup_expired_sessions("tenant-456")
 
         assert cleaned == 1
-        mock_dynamodb_table.delete_item.assert_called_once_with(
-            Key={"session_id": "session-expired"}
+        batch.delete_item.assert_called_once_with(Key={"session_id": "session-expired"})
+        mock_dynamodb_table.delete_item.assert_not_called()
+
+    def test_cleanup_expired_sessions_batch_error(
+        self, session_service: SessionService, mock_dynamodb_table: MagicMock
+    ) -> None:
+        """Test a failed batch delete is logged and reports nothing cleaned."""
+        now = datetime.now(UTC)
+        mock_dynamodb_table.query.return_value = {
+            "Items": [
+                {
+                    "session_id": "session-expired",
+                    "tenant_id": "tenant-456",
+                    "db_user": "user_tenant_456",
+                    "created_at": (now - timedelta(hours=2)).isoformat(),
+                    "expires_at": (now - timedelta(hours=1)).isoformat(),
+                    "last_used_at": (now - timedelta(hours=2)).isoformat(),
+                    "is_active": True,
+                }
+            ]
+        }
+        mock_dynamodb_table.batch_writer.return_value.__exit__.side_effect = ClientError(
+            {"Error": {"Code": "InternalServerError", "Message": "Error"}},
+            "BatchWriteItem",
         )
+
+        assert session_service.cleanup_expired_sessions("tenant-456") == 0
+
+
+class TestSessionServiceDynamoDB:
+    """Tests for SessionService against a moto DynamoDB table."""
+
+    def test_get_active_session_skips_expired_and_idle(self, mock_dynamodb: Any) -> None:
+        """Test expired and idle sessions are filtered out by the query itself."""
+        now = datetime.now(UTC)
+        table = mock_dynamodb.Table("spectra-sessions")
+        for session_id, expires_at, last_used_at in [
+            ("session-expired", now - timedelta(minutes=1), now),
+            ("session-idle", now + timedelta(hours=1), now - timedelta(hours=1)),
+            ("session-live", now + timedelta(minutes=30), now),
+        ]:
+            table.put_item(
+                Item=RedshiftSession(
+                    session_id=session_id,
+                    tenant_id="tenant-456",
+                    db_user="user_tenant_456",
+                    created_at=now - timedelta(hours=2),
+                    expires_at=expires_at,
+                    last_used_at=last_used_at,
+                ).to_dict()
+            )
+
+        session = SessionService().get_active_session("tenant-456", "user_tenant_456")
+
+        assert session is not None
+        assert session.session_id == "session-live"
@@ -277,6 +277,17 @@ class TestGetSecret:
             with pytest.raises(ValueError, match="Secret does not contain a string"):
                 get_secret("arn:aws:secretsmanager:us-east-1:123:secret:test")
 
+    def test_get_secret_reuses_client(self) -> None:
+        """Test repeated lookups share one Secrets Manager client."""
+        with patch("boto3.client") as mock_client:
+            mock_client.return_value.get_secret_value.return_value = {"SecretString": "{}"}
+
+            get_secret("arn:aws:secretsmanager:us-east-1:123:secret:a")
+            get_secret("arn:aws:secretsmanager:us-east-1:123:secret:b")
+
+            mock_client.assert_called_once()
+            assert mock_client.call_args.args == ("secretsmanager",)
+
 
 # =============================================================================
 # Lambda Authorizer Tests
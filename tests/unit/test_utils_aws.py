@@ -0,0 +1,116 @@
+"""Unit tests for shared boto3 client helpers."""
+
+import contextlib
+from unittest.mock import MagicMock, patch
+
+from botocore.exceptions import ClientError
+from moto import mock_aws
+
+from spectra.utils.aws import (
+    count_aws_calls,
+    deserialize_item,
+    get_client,
+    get_resource,
+    get_table,
+    serialize_item,
+)
+
+
+class TestGetClient:
+    """Tests for get_client."""
+
+    def test_client_reused_per_service_and_region(self) -> None:
+        """Test a client is created once per service and region."""
+        with patch("boto3.client") as mock_client:
+            mock_client.side_effect = lambda *_args, **_kwargs: MagicMock()
+
+            first = get_client("s3", "us-east-1")
+            second = get_client("s3", "us-east-1")
+            other_region = get_client("s3", "eu-west-1")
+
+        assert first is second
+        assert first is not other_region
+        assert mock_client.call_count == 2
+
+
+class TestGetResource:
+    """Tests for get_resource."""
+
+    def test_resource_reused(self) -> None:
+        """Test a resource is created once per service and region."""
+        with patch("boto3.resource") as mock_resource:
+            first = get_resource("dynamodb", "us-east-1")
+            second = get_resource("dynamodb", "us-east-1")
+
+        assert first is second
+        mock_resource.assert_called_once()
+        assert mock_resource.call_args.args == ("dynamodb",)
+        assert mock_resource.call_args.kwargs["region_name"] == "us-east-1"
+
+    def test_resource_uses_shared_config(self) -> None:
+        """Test resources are created with the tuned connection pool."""
+        with patch("boto3.resource") as mock_resource:
+            get_resource("dynamodb", "us-east-1")
+
+        config = mock_resource.call_args.kwargs["config"]
+        assert config.max_pool_connections == 50
+        assert config.retries == {"mode": "adaptive"}
+        assert config.tcp_keepalive is True
+
+
+class TestGetTable:
+    """Tests for get_table."""
+
+    def test_table_reused_per_name(self) -> None:
+        """Test a Table is built once per table name and region."""
+        with patch("boto3.resource") as mock_resource:
+            mock_resource.return_value.Table.side_effect = lambda _name: object()
+
+            first = get_table("jobs", "us-east-1")
+            second = get_table("jobs", "us-east-1")
+            other = get_table("sessions", "us-east-1")
+
+        assert first is second
+        assert first is not other
+        assert mock_resource.return_value.Table.call_count == 2
+
+
+class TestCountAwsCalls:
+    """Tests for count_aws_calls."""
+
+    def test_counts_calls_made_inside_nested_blocks(self, aws_credentials: None) -> None:
+        """Test API calls are counted by every enclosing block, presigning excluded."""
+        with mock_aws():
+            s3 = get_client("s3", "us-east-1")
+            table = get_table("jobs", "us-east-1")
+            s3.create_bucket(Bucket="bucket")
+
+            with count_aws_calls() as outer:
+                s3.list_objects_v2(Bucket="bucket")
+                with count_aws_calls() as inner:
+                    s3.head_bucket(Bucket="bucket")
+                    s3.generate_presigned_url("get_object", Params={"Bucket": "bucket", "Key": "k"})
+                    with contextlib.suppress(ClientError):
+                        table.get_item(Key={"job_id": "job-1"})
+
+        assert inner.count == 2
+        assert outer.count == 3
+
+
+class TestItemSerialization:
+    """Tests for low-level DynamoDB item conversion."""
+
+    def test_round_trip(self) -> None:
+        """Test items survive serialization and deserialization."""
+        item = {
+            "job_id": "job-1",
+            "async_mode": True,
+            "ttl": 1700000000,
+            "result": {"row_count": 5, "location": "inline"},
+        }
+
+        serialized = serialize_item(item)
+
+        assert serialized["job_id"] == {"S": "job-1"}
+        assert serialized["ttl"] == {"N": "1700000000"}
+        assert deserialize_item(serialized) == item